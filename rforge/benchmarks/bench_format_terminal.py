@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Terminal formatting benchmark.
+
+Compares the per-result cost of the reusable terminal render context
+(format_terminal / format_terminal_many) with the original approach of
+building a new StringIO and Rich Console for every result, after
+checking both produce identical output.
+
+Run with: python benchmarks/bench_format_terminal.py [--count 500]
+"""
+import argparse
+import random
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from formatters import format_terminal, format_terminal_many  # noqa: E402
+
+
+def legacy_format_terminal(data: Dict[str, Any]) -> str:
+    """Original format_terminal (new console per call), kept as the reference."""
+    from rich.console import Console
+
+    output = StringIO()
+    console = Console(file=output, force_terminal=True, width=80)
+
+    status = data.get("status", "unknown")
+    if status == "success":
+        status_emoji = "✅"
+    elif status in ["error", "failed", "failure"]:
+        status_emoji = "❌"
+    elif status in ["warning", "warn"]:
+        status_emoji = "⚠️"
+    else:
+        status_emoji = "ℹ️"
+
+    console.print(f"{status_emoji} {data.get('title', 'Result')}", style="bold")
+    console.print()
+    if "data" in data and isinstance(data["data"], dict):
+        for key, value in data["data"].items():
+            console.print(f"  • {key}: {value}")
+
+    result = output.getvalue()
+    output.close()
+    return result
+
+
+def build_results(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build package health results like an ecosystem run produces."""
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"rpkg{n} health check",
+            "status": rng.choice(["success", "success", "warning", "error"]),
+            "data": {
+                "health": rng.randint(40, 100),
+                "tests_passed": rng.randint(0, 300),
+                "coverage": f"{rng.uniform(50, 100):.1f}%",
+                "version": f"{rng.randint(0, 3)}.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+                "path": f"/home/user/projects/rpkg{n}"
+            }
+        }
+        for n in range(count)
+    ]
+
+
+def best_per_result(render: Callable[[List[Dict[str, Any]]], Any], results: List[Dict[str, Any]], repeat: int) -> float:
+    """Return the best microseconds per result over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(results)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(results)
+
+
+def compare(results: List[Dict[str, Any]], repeat: int) -> Dict[str, float]:
+    """Time the legacy and reusable renderers (microseconds per result)."""
+    return {
+        "legacy": best_per_result(lambda batch: [legacy_format_terminal(d) for d in batch], results, repeat),
+        "format_terminal": best_per_result(lambda batch: [format_terminal(d) for d in batch], results, repeat),
+        "format_terminal_many": best_per_result(format_terminal_many, results, repeat)
+    }
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=500)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    results = build_results(args.count)
+    if format_terminal_many(results) != [legacy_format_terminal(data) for data in results]:
+        print("MISMATCH: format_terminal_many output differs from the original")
+        return 1
+
+    timings = compare(results, args.repeat)
+    print(f"Results: {args.count:,} package checks")
+    for name, per_result in timings.items():
+        print(f"  {name:<21} {per_result:7.1f} us/result  speedup {timings['legacy'] / per_result:4.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
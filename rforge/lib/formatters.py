@@ -8,21 +8,67 @@ Provides three output formats:
 """
 
 import json
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from io import StringIO
+from typing import Dict, Any, Callable, Iterable, List, Optional
 
+# Resolved on first use (see compact_json)
+_compact_encoder: Optional[Callable[[Any], str]] = None
 
-def format_json(data: Dict[str, Any], mode: str = "default", **metadata) -> str:
+
+def _stdlib_compact(obj: Any) -> str:
+    """Encode compact JSON with the standard library."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _load_compact_encoder() -> Callable[[Any], str]:
+    """Use the workflow plugin's compact encoder when it is installed."""
+    try:
+        from workflow.format_handlers import json_encoder
+    except ImportError:
+        return _stdlib_compact
+    return json_encoder()[1]
+
+
+def compact_json(obj: Any) -> str:
+    """
+    Encode a value as compact (single-line) JSON.
+
+    Uses the workflow plugin's encoder (``workflow.format_handlers.json_encoder``:
+    orjson or msgspec when installed, the standard library for values
+    they reject) when that plugin is installed, and the standard library
+    otherwise.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        JSON string without indentation or spaces
+
+    Example:
+        >>> compact_json({"status": "pass", "tests": [1, 2]})
+        '{"status":"pass","tests":[1,2]}'
+    """
+    global _compact_encoder
+    if _compact_encoder is None:
+        _compact_encoder = _load_compact_encoder()
+    return _compact_encoder(obj)
+
+
+def format_json(data: Dict[str, Any], mode: str = "default", compact: bool = False, **metadata) -> str:
     """
     Format analysis results as JSON.
 
     Args:
         data: Analysis results dictionary
         mode: Mode used for analysis (default, debug, optimize, release)
+        compact: Emit single-line JSON for machine consumers (see compact_json)
         **metadata: Additional metadata (version, package_name, etc.)
 
     Returns:
-        Valid JSON string with results and metadata
+        Valid JSON string with results and metadata (pretty-printed
+        with the standard library unless compact)
 
     Example:
         >>> results = {"tests_passed": 15, "warnings": 2}
@@ -42,6 +88,9 @@ def format_json(data: Dict[str, Any], mode: str = "default", **metadata) -> str:
     if metadata:
         output["metadata"] = metadata
 
+    if compact:
+        return compact_json(output)
+
     # Ensure valid JSON output
     return json.dumps(output, indent=2, ensure_ascii=False)
 
@@ -68,6 +117,99 @@ def validate_json_output(json_string: str) -> bool:
         return False
 
 
+# Title emoji per status (anything else gets "ℹ️")
+STATUS_EMOJI = {
+    "success": "✅",
+    "error": "❌",
+    "failed": "❌",
+    "failure": "❌",
+    "warning": "⚠️",
+    "warn": "⚠️",
+}
+
+
+class TerminalRenderer:
+    """
+    Reusable, thread-safe render context for terminal output.
+
+    Each thread gets its own Rich console (and string buffer), created on
+    first use and reset between results, instead of a new console per
+    result. Each result is rendered with two print calls (the bold title,
+    then the remaining lines) rather than one per line. Console
+    settings (e.g., NO_COLOR) are read when a thread's console is created.
+
+    Example:
+        >>> renderer = TerminalRenderer()
+        >>> "✅ Test" in renderer.render({"title": "Test", "status": "success"})
+        True
+    """
+
+    def __init__(self, width: int = 80):
+        """
+        Initialize renderer.
+
+        Args:
+            width: Console width in characters
+        """
+        self.width = width
+        self._local = threading.local()
+
+    def _console(self):
+        """Get this thread's console with an empty buffer."""
+        console = getattr(self._local, "console", None)
+        if console is None:
+            from rich.console import Console
+
+            # A fixed height skips terminal size probing on every print
+            console = Console(file=StringIO(), force_terminal=True, width=self.width, height=25)
+            self._local.console = console
+        else:
+            console.file.seek(0)
+            console.file.truncate()
+        return console
+
+    def render(self, data: Dict[str, Any]) -> str:
+        """
+        Render one result.
+
+        Args:
+            data: Analysis results dictionary
+
+        Returns:
+            Formatted terminal output string with colors and emojis
+        """
+        console = self._console()
+
+        # Title line in bold (styled as a whole line, like the original
+        # per-line prints), then an empty line
+        status = data.get("status", "unknown")
+        status_emoji = STATUS_EMOJI.get(status, "ℹ️") if isinstance(status, str) else "ℹ️"
+        console.print(f"{status_emoji} {data.get('title', 'Result')}", style="bold")
+        lines = [""]
+
+        # Display data as bullet points if present
+        if "data" in data and isinstance(data["data"], dict):
+            lines.extend(console.render_str(f"  • {key}: {value}") for key, value in data["data"].items())
+
+        console.print(*lines, sep="\n")
+        return console.file.getvalue()
+
+    def render_many(self, results: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Render several results.
+
+        Args:
+            results: Analysis results dictionaries
+
+        Returns:
+            One formatted string per result
+        """
+        return [self.render(data) for data in results]
+
+
+_terminal_renderer = TerminalRenderer()
+
+
 def format_terminal(data: Dict[str, Any], mode: str = "default") -> str:
     """
     Format analysis results for terminal output with Rich formatting.
@@ -85,39 +227,26 @@ def format_terminal(data: Dict[str, Any], mode: str = "default") -> str:
         >>> "✅" in output
         True
     """
-    from io import StringIO
-    from rich.console import Console
+    return _terminal_renderer.render(data)
 
-    # Create console that writes to string
-    output = StringIO()
-    console = Console(file=output, force_terminal=True, width=80)
-
-    # Status emoji based on status field
-    status = data.get("status", "unknown")
-    if status == "success":
-        status_emoji = "✅"
-    elif status in ["error", "failed", "failure"]:
-        status_emoji = "❌"
-    elif status in ["warning", "warn"]:
-        status_emoji = "⚠️"
-    else:
-        status_emoji = "ℹ️"
 
-    # Title line with emoji
-    title = data.get("title", "Result")
-    console.print(f"{status_emoji} {title}", style="bold")
-    console.print()  # Empty line
+def format_terminal_many(results: Iterable[Dict[str, Any]], mode: str = "default") -> List[str]:
+    """
+    Format many analysis results for terminal output (e.g., an ecosystem run).
 
-    # Display data as bullet points if present
-    if "data" in data and isinstance(data["data"], dict):
-        for key, value in data["data"].items():
-            console.print(f"  • {key}: {value}")
+    Args:
+        results: Analysis results dictionaries
+        mode: Mode used for analysis
 
-    # Get the string output
-    result = output.getvalue()
-    output.close()
+    Returns:
+        One formatted string per result, each equal to format_terminal(data)
 
-    return result
+    Example:
+        >>> outputs = format_terminal_many([{"title": "a"}, {"title": "b"}])
+        >>> len(outputs)
+        2
+    """
+    return _terminal_renderer.render_many(results)
 
 
 def format_markdown(data: Dict[str, Any], mode: str = "default") -> str:
@@ -12,6 +12,7 @@ Tests cover:
 import pytest
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
@@ -20,8 +21,11 @@ rforge_lib = Path(__file__).parent.parent.parent / "rforge" / "lib"
 sys.path.insert(0, str(rforge_lib))
 
 from formatters import (
+    TerminalRenderer,
+    compact_json,
     format_json,
     format_terminal,
+    format_terminal_many,
     format_markdown,
     get_formatter,
     validate_json_output,
@@ -210,6 +214,37 @@ class TestJSONFormatting:
         assert "timestamp" in parsed
         assert len(parsed["timestamp"]) > 0  # Non-empty timestamp
 
+    def test_json_format_compact(self):
+        """Test compact JSON is one line with the same content."""
+        data = {"title": "Résumé", "data": {"health": 87, "issues": [1, 2]}}
+
+        pretty = json.loads(format_json(data, mode="debug", version="1.0.0"))
+        compact = format_json(data, mode="debug", compact=True, version="1.0.0")
+
+        assert "\n" not in compact
+        assert ", " not in compact
+        assert "Résumé" in compact  # Not ASCII-escaped, like the pretty output
+        parsed = json.loads(compact)
+        parsed["timestamp"] = pretty["timestamp"]
+        assert parsed == pretty
+
+    def test_compact_json_falls_back_for_non_string_keys(self):
+        """Test values fast backends reject are still encoded."""
+        assert json.loads(compact_json({1: "one", "big": 2 ** 70})) == {"1": "one", "big": 2 ** 70}
+
+    def test_compact_json_shares_workflow_encoder(self, monkeypatch):
+        """Test compact_json uses the workflow plugin's encoder when installed."""
+        import formatters
+
+        monkeypatch.syspath_prepend(str(Path(__file__).parent.parent.parent / "workflow"))
+        for name in [name for name in sys.modules if name == "workflow" or name.startswith("workflow.")]:
+            monkeypatch.delitem(sys.modules, name)
+        monkeypatch.setattr(formatters, "_compact_encoder", None)
+        from workflow.format_handlers import json_encoder
+
+        assert compact_json({"status": "pass"}) == '{"status":"pass"}'
+        assert formatters._compact_encoder is json_encoder()[1]
+
 
 @pytest.mark.unit
 @pytest.mark.mode_system
@@ -308,6 +343,56 @@ class TestTerminalFormatting:
         assert "\n" in output
         assert "•" in output
 
+    def test_terminal_render_context_reused(self):
+        """Test consecutive results do not leak into each other."""
+        first = format_terminal({"title": "First", "status": "success", "data": {"tests": 15}})
+        second = format_terminal({"title": "Second", "status": "error"})
+
+        assert "First" not in second
+        assert format_terminal({"title": "First", "status": "success", "data": {"tests": 15}}) == first
+
+    def test_terminal_format_many(self):
+        """Test bulk formatting matches formatting one by one."""
+        results = [
+            {"title": f"pkg{n}", "status": status, "data": {"health": 80 + n}}
+            for n, status in enumerate(["success", "warning", "failed", "unknown"])
+        ]
+
+        assert format_terminal_many(results) == [format_terminal(data) for data in results]
+        assert format_terminal_many([]) == []
+
+    @pytest.mark.parametrize("title", ["\tindented", "a\tb [bold]c[/] d", "[x]\t:\n\tsecond line"])
+    def test_terminal_title_styled_like_per_line_print(self, title):
+        """Test titles with tabs and markup get the same ANSI output as printing each line."""
+        from io import StringIO
+        from rich.console import Console
+
+        data = {"title": title, "status": "success", "data": {"k\t": title}}
+        output = StringIO()
+        console = Console(file=output, force_terminal=True, width=80)
+        console.print(f"✅ {title}", style="bold")
+        console.print()
+        console.print(f"  • k\t: {title}")
+
+        assert format_terminal(data) == output.getvalue()
+
+    def test_terminal_unhashable_status(self):
+        """Test unhashable status values fall back to the info emoji."""
+        output = format_terminal({"title": "Check", "status": ["success"]})
+
+        assert "ℹ️ Check" in output
+
+    def test_terminal_renderer_thread_safe(self):
+        """Test concurrent rendering gives the same output as sequential."""
+        renderer = TerminalRenderer()
+        results = [{"title": f"pkg{n}", "status": "success", "data": {"n": n}} for n in range(50)]
+        expected = renderer.render_many(results)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outputs = list(pool.map(renderer.render, results * 4))
+
+        assert outputs == expected * 4
+
 
 @pytest.mark.unit
 @pytest.mark.mode_system
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Columnar export benchmark.
+
+Answers a duration/usage query (mean duration and agent runs per time
+budget) over a batch of synthetic thorough-mode results (10k by default),
+once by parsing pretty ``JSONFormatter`` output record by record and once
+by scanning a Parquet file written with ``write_columnar``, after checking
+both give the same answer. Requires pyarrow.
+
+Run with: python benchmarks/bench_columnar_export.py [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_format_handlers import build_results  # noqa: E402
+from workflow.columnar_export import write_columnar  # noqa: E402
+from workflow.format_handlers import JSONFormatter  # noqa: E402
+
+BUDGETS = ("quick", "default", "thorough")
+
+Answer = Dict[str, Tuple[float, int]]
+
+
+def json_query(outputs: List[str]) -> Answer:
+    """Mean duration and agent runs per budget from pretty JSON outputs."""
+    totals = {budget: [0.0, 0, 0] for budget in BUDGETS}
+    for output in outputs:
+        metadata = json.loads(output)["metadata"]
+        total = totals[metadata["time_budget"]]
+        total[0] += metadata["duration_seconds"]
+        total[1] += 1
+        total[2] += len(metadata["agents_used"])
+    return {budget: (duration / count, agents) for budget, (duration, count, agents) in totals.items() if count}
+
+
+def parquet_query(path: str) -> Answer:
+    """Mean duration and agent runs per budget from a Parquet scan."""
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, columns=["time_budget", "duration_seconds", "agent_count"])
+    # Row groups carry their own dictionaries
+    grouped = table.unify_dictionaries().group_by("time_budget").aggregate(
+        [("duration_seconds", "mean"), ("agent_count", "sum")]
+    )
+    return {
+        row["time_budget"]: (row["duration_seconds_mean"], row["agent_count_sum"])
+        for row in grouped.to_pylist()
+    }
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    results = build_results(args.count)
+    for n, data in enumerate(results):
+        data["metadata"]["time_budget"] = BUDGETS[n % len(BUDGETS)]
+    outputs = [JSONFormatter().format(data) for data in results]
+    print(f"Results: {len(results):,} ({sum(map(len, outputs)) / 1e6:.1f} MB of pretty JSON)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "runs.parquet")
+        start = time.perf_counter()
+        write_columnar(outputs, path)
+        export_ms = (time.perf_counter() - start) * 1e3
+        print(f"  export    {export_ms:8.1f} ms  ({os.path.getsize(path) / 1e3:.0f} kB Parquet)")
+
+        expected = json_query(outputs)
+        answer = parquet_query(path)
+        if set(answer) != set(expected) or any(
+            abs(answer[budget][0] - expected[budget][0]) > 1e-9 or answer[budget][1] != expected[budget][1]
+            for budget in expected
+        ):
+            print("MISMATCH: Parquet query differs from JSON query")
+            return 1
+
+        timings = {}
+        for name, query in (("json", lambda: json_query(outputs)), ("parquet", lambda: parquet_query(path))):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                query()
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best * 1e3
+
+    print(f"  query     json {timings['json']:8.1f} ms  parquet {timings['parquet']:8.1f} ms"
+          f"  speedup {timings['json'] / timings['parquet']:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Format handler benchmark.
+
+Renders a batch of synthetic thorough-mode results (10k by default) with
+the streaming ``TerminalFormatter`` and ``MarkdownFormatter`` and with the
+original single-list formatters, after checking both produce identical
+output (streaming must not cost batch rendering time). Also compares pretty-printed
+``JSONFormatter`` output with compact output from each installed backend,
+and one-by-one JSON output with a ``format_many`` JSON Lines batch.
+
+Run with: python benchmarks/bench_format_handlers.py [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import io
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from workflow.format_handlers import (  # noqa: E402
+    JSON_BACKENDS,
+    JSONFormatter,
+    MarkdownFormatter,
+    TerminalFormatter,
+    format_many,
+    write_output
+)
+
+
+def legacy_terminal(data: Dict[str, Any]) -> str:
+    """Original TerminalFormatter.format, kept as the benchmark reference."""
+    lines = []
+    metadata = data.get("metadata", {})
+    lines.append(f"⏱️  Mode: {metadata.get('mode', 'unknown')} ({metadata.get('time_budget', 'default')}) - Target: < {TerminalFormatter()._format_budget(metadata.get('time_budget', 'default'))}")
+    lines.append("")
+    content = data.get("content", {})
+    if "quick_wins" in content:
+        lines.append("⚡ Quick Wins:")
+        for item in content["quick_wins"]:
+            if isinstance(item, dict):
+                lines.append(f"- {item.get('action', '')} - {item.get('benefit', '')}")
+            else:
+                lines.append(f"- {item}")
+        lines.append("")
+    if "medium_effort" in content:
+        lines.append("🔧 Medium Effort:")
+        for item in content["medium_effort"]:
+            if isinstance(item, dict):
+                lines.append(f"- [ ] {item.get('task', '')} - {item.get('outcome', '')}")
+            else:
+                lines.append(f"- [ ] {item}")
+        lines.append("")
+    if "long_term" in content:
+        lines.append("🏗️ Long Term:")
+        for item in content["long_term"]:
+            if isinstance(item, dict):
+                lines.append(f"- {item.get('item', '')} - {item.get('strategic_value', '')}")
+            else:
+                lines.append(f"- {item}")
+        lines.append("")
+    recommendations = data.get("recommendations", {})
+    if "recommended_path" in recommendations:
+        lines.append("→ Recommended Path:")
+        lines.append(recommendations["recommended_path"])
+        lines.append("")
+    if "next_steps" in recommendations:
+        lines.append("Next Steps:")
+        for i, step in enumerate(recommendations["next_steps"], 1):
+            lines.append(f"{i}. [ ] {step}")
+        lines.append("")
+    if "duration_seconds" in metadata:
+        duration = metadata["duration_seconds"]
+        budget_mode = metadata.get("time_budget", "default")
+        lines.append(f"✅ Completed in {duration}s (within {budget_mode} budget)")
+    return "\n".join(lines)
+
+
+def legacy_markdown(data: Dict[str, Any]) -> str:
+    """Original MarkdownFormatter.format, kept as the benchmark reference."""
+    lines = []
+    content = data.get("content", {})
+    topic = content.get("topic", "Brainstorm")
+    lines.append(f"# {topic}")
+    lines.append("")
+    metadata = data.get("metadata", {})
+    if "timestamp" in metadata:
+        lines.append(f"**Generated:** {metadata['timestamp']}")
+    if "mode" in metadata:
+        lines.append(f"**Mode:** {metadata['mode']} ({metadata.get('time_budget', 'default')})")
+    if "duration_seconds" in metadata:
+        lines.append(f"**Duration:** {metadata['duration_seconds']} seconds")
+    lines.append("")
+    if "quick_wins" in content:
+        lines.append("## Quick Wins (< 30 min each)")
+        for item in content["quick_wins"]:
+            if isinstance(item, dict):
+                lines.append(f"- ⚡ {item.get('action', '')} - {item.get('benefit', '')}")
+            else:
+                lines.append(f"- ⚡ {item}")
+        lines.append("")
+    if "medium_effort" in content:
+        lines.append("## Medium Effort (1-2 hours)")
+        for item in content["medium_effort"]:
+            if isinstance(item, dict):
+                lines.append(f"- [ ] {item.get('task', '')}")
+            else:
+                lines.append(f"- [ ] {item}")
+        lines.append("")
+    recommendations = data.get("recommendations", {})
+    if "recommended_path" in recommendations:
+        lines.append("## Recommended Path")
+        lines.append(f"→ {recommendations['recommended_path']}")
+        lines.append("")
+    if "next_steps" in recommendations:
+        lines.append("## Next Steps")
+        for i, step in enumerate(recommendations["next_steps"], 1):
+            lines.append(f"{i}. [ ] {step}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_results(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build thorough-mode results with up to 30 items per section."""
+    rng = random.Random(seed)
+
+    def phrase() -> str:
+        return " ".join(rng.choice(["cache", "tenant", "index", "queue", "auth", "shard"])
+                        for _ in range(rng.randint(2, 5)))
+
+    results = []
+    for n in range(count):
+        results.append({
+            "metadata": {
+                "timestamp": "2024-12-24T14:00:00Z",
+                "mode": "architecture",
+                "time_budget": "thorough",
+                "duration_seconds": rng.randint(60, 1800),
+                "agents_used": ["backend-architect", "database-architect"]
+            },
+            "content": {
+                "topic": f"Topic {n}",
+                "quick_wins": [
+                    {"action": phrase(), "benefit": phrase()} if rng.random() < 0.8 else phrase()
+                    for _ in range(rng.randint(15, 30))
+                ],
+                "medium_effort": [
+                    {"task": phrase(), "outcome": phrase()} for _ in range(rng.randint(15, 30))
+                ],
+                "long_term": [
+                    {"item": phrase(), "strategic_value": phrase()} for _ in range(rng.randint(5, 15))
+                ]
+            },
+            "recommendations": {
+                "recommended_path": phrase(),
+                "next_steps": [phrase() for _ in range(rng.randint(3, 8))]
+            }
+        })
+    return results
+
+
+def time_per_result(render: Callable[[Dict[str, Any]], str], results: List[Dict[str, Any]]) -> float:
+    """Return microseconds per result."""
+    start = time.perf_counter()
+    for data in results:
+        render(data)
+    return (time.perf_counter() - start) * 1e6 / len(results)
+
+
+def best_of(repeat: int, *renders: Callable[[Dict[str, Any]], str], results: List[Dict[str, Any]]) -> List[float]:
+    """Return the best microseconds per result of each renderer, runs interleaved."""
+    best = [float("inf")] * len(renders)
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for index, render in enumerate(renders):
+                best[index] = min(best[index], time_per_result(render, results))
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    results = build_results(args.count)
+    print(f"Results: {len(results):,} thorough-mode")
+
+    for name, legacy, current in (
+        ("terminal", legacy_terminal, TerminalFormatter().format),
+        ("markdown", legacy_markdown, MarkdownFormatter().format),
+    ):
+        if any(legacy(data) != current(data) for data in results):
+            print(f"MISMATCH: {name} output differs from the original formatter")
+            return 1
+
+        legacy_us, current_us = best_of(args.repeat, legacy, current, results=results)
+        print(f"  {name:<9} original {legacy_us:7.1f} us/result  current {current_us:7.1f} us/result"
+              f"  speedup {legacy_us / current_us:4.2f}x")
+
+    renders = {"pretty": JSONFormatter().format}
+    for backend in JSON_BACKENDS:
+        try:
+            renders[f"compact/{backend}"] = JSONFormatter(compact=True, backend=backend).format
+        except ImportError:
+            print(f"  json      compact/{backend}: not installed")
+    for name, render in renders.items():
+        if any(json.loads(render(data)) != json.loads(renders["pretty"](data)) for data in results):
+            print(f"MISMATCH: json {name} output differs from pretty output")
+            return 1
+
+    timings = best_of(args.repeat, *renders.values(), results=results)
+    for name, json_us in zip(renders, timings):
+        print(f"  json      {name:<15} {json_us:7.1f} us/result  speedup {timings[0] / json_us:4.2f}x")
+
+    def one_by_one(batch: List[Dict[str, Any]]) -> None:
+        stream = io.StringIO()
+        for data in batch:
+            write_output(data, stream, "json")
+
+    def json_lines(batch: List[Dict[str, Any]]) -> None:
+        format_many(batch, io.StringIO())
+
+    single_us, lines_us = best_of(args.repeat, one_by_one, json_lines, results=[results])
+    print(f"  batch     json one-by-one {single_us / len(results):7.1f} us/result"
+          f"  jsonl {lines_us / len(results):7.1f} us/result  speedup {single_us / lines_us:4.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
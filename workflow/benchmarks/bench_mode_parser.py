@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Mode parser benchmark.
+
+Compares per-command latency of the single-pass ``ModeParser.parse`` with
+the original multi-scan implementation on a synthetic corpus of
+``/brainstorm`` invocations, after checking both produce identical results.
+Also times per-keystroke ``IncrementalParser`` updates while typing the
+end of a command with a long topic.
+
+Run with: python benchmarks/bench_mode_parser.py [--count 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from workflow.mode_parser import IncrementalParser, ModeParser  # noqa: E402
+
+
+TOPIC_WORDS = [
+    "auth", "user", "notifications", "dashboard", "oauth", "api", "cache",
+    "multi-tenant", "SaaS", "billing", "search", "CI/CD", "pipeline",
+    "metrics", "onboarding", "payments", "default", "--format",
+]
+
+
+class LegacyModeParser:
+    """Original multi-scan parser, kept as the benchmark reference."""
+
+    TIME_BUDGET_MODES = ModeParser.TIME_BUDGET_MODES
+    CONTENT_MODES = ModeParser.CONTENT_MODES
+    OUTPUT_FORMATS = ModeParser.OUTPUT_FORMATS
+
+    def parse(self, command: str) -> Dict[str, Any]:
+        if not command or not command.strip():
+            return {
+                "command": "/brainstorm",
+                "time_budget_mode": "default",
+                "content_mode": None,
+                "topic": None,
+                "format": "terminal"
+            }
+
+        parts = command.split()
+        result: Dict[str, Any] = {"command": "/brainstorm"}
+        result["time_budget_mode"] = next(
+            (mode for mode in self.TIME_BUDGET_MODES if mode in parts), "default"
+        )
+        result["content_mode"] = next(
+            (mode for mode in self.CONTENT_MODES if mode in parts), None
+        )
+
+        result["format"] = "terminal"
+        if "--format" in parts:
+            format_index = parts.index("--format")
+            if format_index + 1 < len(parts):
+                result["format"] = parts[format_index + 1]
+
+        result["topic"] = self._extract_topic(parts, result)
+        return result
+
+    def _extract_topic(self, parts: List[str], parsed: Dict[str, Any]) -> Optional[str]:
+        exclude_words = {"/brainstorm"}
+        if parsed["time_budget_mode"] in self.TIME_BUDGET_MODES:
+            exclude_words.add(parsed["time_budget_mode"])
+        if parsed["content_mode"]:
+            exclude_words.add(parsed["content_mode"])
+        if "--format" in parts:
+            exclude_words.add("--format")
+            format_index = parts.index("--format")
+            if format_index + 1 < len(parts):
+                exclude_words.add(parts[format_index + 1])
+
+        topic_words = []
+        skip_next = False
+        for word in parts:
+            if word == "--format":
+                skip_next = True
+                continue
+            if skip_next:
+                skip_next = False
+                continue
+            if word in exclude_words:
+                continue
+            topic_words.append(word)
+
+        return " ".join(topic_words) if topic_words else None
+
+
+def build_corpus(count: int, seed: int = 42) -> List[str]:
+    """Generate a reproducible corpus of brainstorm commands."""
+    rng = random.Random(seed)
+    keywords = ModeParser.TIME_BUDGET_MODES + ModeParser.CONTENT_MODES
+    formats = ModeParser.OUTPUT_FORMATS + ["invalid"]
+
+    corpus = []
+    for _ in range(count):
+        words = rng.sample(TOPIC_WORDS, rng.randint(0, 5))
+        words += rng.sample(keywords, rng.randint(0, 3))
+        rng.shuffle(words)
+        if rng.random() < 0.4:
+            position = rng.randint(0, len(words))
+            words[position:position] = ["--format", rng.choice(formats)]
+        corpus.append(" ".join(["/brainstorm"] + words))
+    return corpus
+
+
+def run(parser: Any, corpus: List[str]) -> float:
+    """Parse the whole corpus and return elapsed seconds."""
+    parse = parser.parse
+    start = time.perf_counter()
+    for command in corpus:
+        parse(command)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    corpus = build_corpus(args.count)
+    legacy = LegacyModeParser()
+    current = ModeParser()
+
+    mismatches = [
+        command for command in corpus
+        if dict(current.parse(command)) != legacy.parse(command)
+    ]
+    if mismatches:
+        print(f"❌ {len(mismatches)} results differ, e.g. {mismatches[0]!r}")
+        return 1
+
+    print(f"Corpus: {len(corpus):,} commands (results identical)")
+    legacy_seconds = run(legacy, corpus)
+    current_seconds = run(current, corpus)
+
+    for name, seconds in (("legacy", legacy_seconds), ("single-pass", current_seconds)):
+        per_command_ns = seconds / len(corpus) * 1e9
+        print(f"  {name:<12} {seconds:8.3f}s  {per_command_ns:8.0f} ns/command")
+    print(f"  speedup      {legacy_seconds / current_seconds:8.2f}x")
+
+    topic = " ".join(f"word{i}" for i in range(2000))
+    command = f"/brainstorm thorough {topic} --format json"
+    incremental = IncrementalParser(current)
+    incremental.update(command[:-200])
+    start = time.perf_counter()
+    for end in range(len(command) - 200, len(command) + 1):
+        incremental.update(command[:end])
+        incremental.completions()
+    per_keystroke_us = (time.perf_counter() - start) / 201 * 1e6
+    print(f"  keystroke    {per_keystroke_us:8.1f} us/update (2,000-word topic)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
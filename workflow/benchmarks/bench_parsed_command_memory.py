@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Parsed command memory benchmark.
+
+Measures, with tracemalloc, the memory held by a list of parse results
+stored as ``ParsedCommand`` records versus plain per-call dicts.
+
+Run with: python benchmarks/bench_parsed_command_memory.py [--count 1000000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_mode_parser import build_corpus  # noqa: E402
+from workflow.mode_parser import ModeParser  # noqa: E402
+
+
+def measure(corpus: List[str], convert: Callable) -> int:
+    """Return bytes still allocated after holding every converted result."""
+    parse = ModeParser().parse
+    gc.collect()
+    tracemalloc.start()
+    results = [convert(parse(command)) for command in corpus]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return current
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--count", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    corpus = build_corpus(args.count)
+    print(f"Corpus: {len(corpus):,} commands")
+
+    dict_bytes = measure(corpus, lambda parsed: parsed.to_dict())
+    record_bytes = measure(corpus, lambda parsed: parsed)
+
+    for name, total in (("dict", dict_bytes), ("ParsedCommand", record_bytes)):
+        print(f"  {name:<14} {total / 2**20:8.1f} MiB  {total / len(corpus):6.0f} B/result")
+    print(f"  saving         {1 - record_bytes / dict_bytes:8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
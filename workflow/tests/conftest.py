@@ -115,6 +115,25 @@ def mock_command_input():
 # Time Budget Fixtures
 # ============================================================================
 
+class FakeClock:
+    """Manually advanced nanosecond clock for deterministic timing tests."""
+
+    def __init__(self, start_ns: int = 1_000):
+        self.now_ns = start_ns
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def fake_clock():
+    """Manually advanced clock to inject into TimeBudget and Deadline."""
+    return FakeClock()
+
+
 @pytest.fixture
 def time_budgets():
     """Time budget configurations for all modes."""
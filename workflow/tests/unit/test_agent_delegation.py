@@ -8,9 +8,21 @@ Tests agent selection, delegation, and result synthesis for:
 - Agent availability and configuration
 """
 
+import threading
+import time
+
 import pytest
 from typing import List, Dict
 
+from workflow.agent_delegation import (
+    AgentConfig,
+    AgentDelegator,
+    AgentScheduler,
+    routing_table,
+    select_agents
+)
+from workflow.time_budgets import Deadline
+
 
 @pytest.mark.unit
 class TestAgentAvailability:
@@ -416,3 +428,307 @@ class TestAgentMetadata:
         # backend-architect → backend_architect
         normalized_metadata = {name.replace("-", "_") for name in agents_in_metadata}
         assert normalized_metadata == agents_in_analysis
+
+
+@pytest.mark.unit
+class TestDeadlineDelegation:
+    """Test sharing one deadline across delegated agent calls."""
+
+    # "deploy" selects devops-engineer (30-90s), padded with backend-architect (60-180s)
+    TOPIC = "deploy pipeline"
+
+    def test_sub_calls_see_remaining_budget(self, fake_clock):
+        """Each agent gets a sub-deadline capped by its typical duration."""
+        seen = {}
+
+        def invoke(agent, topic, deadline):
+            seen[agent] = deadline.remaining()
+            fake_clock.advance(10)
+            return f"{agent} analysis"
+
+        results = AgentDelegator().delegate(
+            self.TOPIC, "thorough", invoke, Deadline.after(1800, fake_clock)
+        )
+
+        assert [r.agent for r in results] == ["devops-engineer", "backend-architect"]
+        assert all(r.status == "completed" for r in results)
+        assert seen == {"devops-engineer": 90, "backend-architect": 180}
+        assert results[0].elapsed_seconds == 10
+
+    def test_later_agent_shrinks_to_remaining_share(self, fake_clock):
+        """Later agents get what is left when the budget is tight."""
+        def invoke(agent, topic, deadline):
+            fake_clock.advance(deadline.remaining())
+
+        results = AgentDelegator().delegate(
+            self.TOPIC, "thorough", invoke, Deadline.after(200, fake_clock)
+        )
+
+        assert [r.budget_seconds for r in results] == [90, 110]
+
+    def test_overrun_skips_later_agents(self, fake_clock):
+        """An overrunning agent causes agents that cannot fit to be skipped."""
+        def invoke(agent, topic, deadline):
+            fake_clock.advance(95)
+
+        results = AgentDelegator().delegate(
+            self.TOPIC, "thorough", invoke, Deadline.after(100, fake_clock)
+        )
+
+        assert results[0].status == "completed"
+        assert results[1].status == "skipped"
+
+    def test_failed_agent_recorded(self):
+        """Agent errors are recorded without stopping the run."""
+        def invoke(agent, topic, deadline):
+            if agent == "devops-engineer":
+                raise RuntimeError("agent unavailable")
+            return "ok"
+
+        results = AgentDelegator().delegate(self.TOPIC, "thorough", invoke)
+
+        assert results[0].status == "failed"
+        assert results[0].result == "agent unavailable"
+        assert results[1].status == "completed"
+
+    def test_quick_mode_delegates_nothing(self):
+        """Quick mode never calls agents."""
+        def invoke(agent, topic, deadline):
+            raise AssertionError("quick mode must not delegate")
+
+        assert AgentDelegator().delegate("auth", "quick", invoke) == []
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestParallelAgentRun:
+    """Test concurrent agent execution with streamed results."""
+
+    # "deploy" selects devops-engineer, padded with backend-architect
+    TOPIC = "deploy pipeline"
+
+    def test_agents_run_concurrently(self):
+        """Agents run concurrently, not one after another."""
+        # Both agents must be running at once to pass the barrier
+        barrier = threading.Barrier(2)
+
+        def invoke(agent, topic, deadline):
+            barrier.wait(timeout=5)
+            return f"{agent} analysis"
+
+        results = list(AgentDelegator().run(self.TOPIC, "thorough", invoke))
+
+        assert {r.agent for r in results} == {"devops-engineer", "backend-architect"}
+        assert all(r.status == "completed" for r in results)
+
+    def test_results_streamed_in_completion_order(self):
+        """The fastest agent is yielded first."""
+        def invoke(agent, topic, deadline):
+            time.sleep(0.3 if agent == "devops-engineer" else 0.01)
+            return agent
+
+        stream = AgentDelegator().run(self.TOPIC, "thorough", invoke)
+
+        assert next(stream).agent == "backend-architect"
+        assert next(stream).agent == "devops-engineer"
+
+    def test_agent_timeout_at_deadline(self):
+        """Agents still running at the deadline are reported as timed out."""
+        release = threading.Event()
+        returned = threading.Event()
+
+        def invoke(agent, topic, deadline):
+            if agent == "devops-engineer":
+                release.wait(timeout=5)
+                returned.set()
+            return agent
+
+        results = {
+            r.agent: r for r in AgentDelegator().run(
+                self.TOPIC, "thorough", invoke, Deadline.after(0.2)
+            )
+        }
+
+        # The run ended while the slow agent was still blocked
+        assert not returned.is_set()
+        release.set()
+        assert results["devops-engineer"].status == "timeout"
+        assert results["backend-architect"].status == "completed"
+
+    def test_bounded_concurrency_skips_unstarted(self):
+        """With one worker, agents queued past the deadline are skipped."""
+        running = []
+
+        def invoke(agent, topic, deadline):
+            running.append(agent)
+            time.sleep(0.4)
+
+        results = {
+            r.agent: r.status for r in AgentDelegator().run(
+                self.TOPIC, "thorough", invoke, Deadline.after(0.15), max_workers=1
+            )
+        }
+
+        # Longest expected agent (backend-architect, 60-180s) is dispatched first
+        assert results == {"backend-architect": "timeout", "devops-engineer": "skipped"}
+        assert running == ["backend-architect"]
+
+    def test_queued_agents_wait_for_abandoned_worker(self):
+        """A timed-out agent's worker is reused once it returns, within the shared deadline."""
+        scheduler = AgentScheduler(["a", "b"], 1, {"a": (0.1, 0.2), "b": (0.01, 0.05)})
+
+        def invoke(agent, topic, deadline):
+            if agent == "a":
+                time.sleep(0.4)
+            return agent
+
+        results = {
+            r.agent: r.status for r in AgentDelegator().run(
+                self.TOPIC, "thorough", invoke, Deadline.after(30), scheduler=scheduler
+            )
+        }
+
+        assert results == {"a": "timeout", "b": "completed"}
+
+    def test_agents_blocked_by_abandoned_workers(self):
+        """Agents starved by timed-out workers until the deadline are blocked, not skipped."""
+        scheduler = AgentScheduler(["a", "b"], 1, {"a": (0.05, 0.1), "b": (0.01, 0.05)})
+
+        def invoke(agent, topic, deadline):
+            time.sleep(0.6)
+
+        results = {
+            r.agent: r.status for r in AgentDelegator().run(
+                self.TOPIC, "thorough", invoke, Deadline.after(0.3), scheduler=scheduler
+            )
+        }
+
+        assert results == {"a": "timeout", "b": "blocked"}
+
+    def test_failures_streamed(self):
+        """Agent exceptions become failed results."""
+        def invoke(agent, topic, deadline):
+            raise RuntimeError(f"{agent} unavailable")
+
+        results = list(AgentDelegator().run("deploy", "thorough", invoke))
+
+        assert all(r.status == "failed" for r in results)
+        assert "unavailable" in results[0].result
+
+    def test_quick_mode_runs_nothing(self):
+        """Quick mode yields no results."""
+        assert list(AgentDelegator().run("auth", "quick", lambda *args: None)) == []
+
+
+@pytest.mark.unit
+class TestAgentScheduler:
+    """Test longest-expected-first scheduling and online re-planning."""
+
+    DURATIONS = {"a": (10, 10), "b": (10, 30), "c": (20, 40), "d": (30, 50)}
+
+    def test_longest_expected_first_plan(self):
+        """Agents are packed longest-first into the worker pool."""
+        scheduler = AgentScheduler(["a", "b", "c", "d"], 2, self.DURATIONS)
+
+        plan = scheduler.plan()
+
+        assert plan.order == ["d", "c", "b", "a"]
+        assert [(e.agent, e.worker, e.start_seconds) for e in plan.entries] == [
+            ("d", 0, 0), ("c", 1, 0), ("b", 1, 30), ("a", 0, 40)
+        ]
+        assert plan.makespan_seconds == 50
+
+    def test_replan_with_actual_durations(self):
+        """Overruns rescale remaining estimates and push out completion."""
+        scheduler = AgentScheduler(["a", "b", "c", "d"], 2, self.DURATIONS)
+        for agent in (scheduler.next_agent(), scheduler.next_agent()):
+            scheduler.start(agent, 0)
+
+        scheduler.finish("c", 60)  # twice its expected 30s
+        plan = scheduler.plan(now_seconds=60)
+
+        assert scheduler.correction() == 2
+        assert {e.agent: e.status for e in plan.entries} == {
+            "c": "finished", "d": "running", "b": "planned", "a": "planned"
+        }
+        assert plan.makespan_seconds == 100
+
+    def test_workers_limited_to_agent_count(self):
+        """Never more workers than agents."""
+        assert AgentScheduler(["a"], 4, self.DURATIONS).workers == 1
+
+    def test_delegator_plan_honors_agent_count(self):
+        """Plans cover at most the mode's maximum number of agents."""
+        plan = AgentDelegator().plan(
+            "auth database performance deploy security", "thorough", max_workers=2
+        )
+
+        assert 2 <= len(plan.entries) <= 4
+        assert plan.workers == 2
+        expected = [e.duration_seconds for e in plan.entries]
+        assert expected == sorted(expected, reverse=True)
+
+    def test_run_reports_into_scheduler(self):
+        """A scheduler passed to run() is updated as agents finish."""
+        delegator = AgentDelegator()
+        scheduler = delegator.create_scheduler("deploy pipeline", "thorough")
+
+        results = list(delegator.run(
+            "deploy pipeline", "thorough", lambda *args: "ok", scheduler=scheduler
+        ))
+
+        assert len(results) == 2
+        assert all(e.status == "finished" for e in scheduler.plan().entries)
+
+
+@pytest.mark.unit
+class TestRoutingTable:
+    """Test routing tables compiled once per rule revision."""
+
+    def test_table_reused_until_rules_replaced(self, monkeypatch):
+        """The same table serves calls until a rule table is replaced."""
+        table = routing_table()
+
+        assert routing_table() is table
+        assert routing_table(AgentConfig()) is table
+
+        monkeypatch.setattr(AgentConfig, "SELECTION_RULES", {"docs": ["ux-ui-designer"]})
+        rebuilt = routing_table()
+
+        assert rebuilt is not table
+        assert select_agents("docs site", "default") == ["ux-ui-designer"]
+
+    def test_table_is_immutable(self):
+        """Compiled tables cannot be modified."""
+        table = routing_table()
+
+        with pytest.raises(AttributeError):
+            table.agent_order = ()
+        with pytest.raises(TypeError):
+            table.limits["quick"] = (0, 4, False)
+
+    def test_mode_limits(self):
+        """Per-mode limits are precomputed from MODE_RULES."""
+        table = routing_table()
+
+        assert table.limits["quick"] is None
+        assert table.limits["default"] == (0, 2, False)
+        assert table.limits["thorough"] == (2, 4, True)
+
+    def test_select_matches_delegator(self):
+        """Module-level selection agrees with AgentDelegator."""
+        delegator = AgentDelegator()
+        for topic in ("auth API", "deploy pipeline", "nothing relevant", ""):
+            for mode in ("quick", "default", "thorough", "unknown"):
+                assert select_agents(topic, mode) == delegator.select_agents(topic, mode)
+
+    def test_thorough_pads_in_agent_order(self):
+        """Thorough mode pads to its minimum with agents in config order."""
+        assert select_agents("nothing relevant", "thorough") == list(AgentConfig.AGENTS)[:2]
+
+    def test_returns_fresh_list(self):
+        """Callers may modify the returned list."""
+        first = select_agents("auth", "default")
+        first.append("extra")
+
+        assert select_agents("auth", "default") == ["backend-architect", "security-specialist"]
@@ -0,0 +1,168 @@
+"""
+Unit tests for columnar export in workflow plugin.
+
+Tests exporting results for analytics:
+- Flattening brainstorm and rforge results into typed columns
+- Serialized (JSON) records
+- Arrow IPC and Parquet files (requires pyarrow)
+"""
+
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from workflow.columnar_export import column_names, flatten_results, results_table, write_columnar
+from workflow.format_handlers import JSONFormatter, format_many
+
+RFORGE_RESULT = {
+    "timestamp": "2024-12-24T14:00:00+00:00",
+    "mode": "debug",
+    "results": {"title": "Package check", "status": "success", "data": {"tests": 15, "warnings": 2}},
+    "metadata": {"package_name": "medfit", "version": "1.0.0"}
+}
+
+
+@pytest.mark.unit
+class TestFlattenResults:
+    """Test flattening results into columns."""
+
+    def test_brainstorm_columns(self, mock_brainstorm_thorough_result, mock_brainstorm_quick_result):
+        """Metadata, section counts and agents become columns."""
+        columns = flatten_results([mock_brainstorm_thorough_result, mock_brainstorm_quick_result])
+
+        assert tuple(columns) == column_names("brainstorm")
+        assert columns["timestamp"][0] == datetime(2024, 12, 24, 14, 0, tzinfo=timezone.utc)
+        assert columns["mode"] == ["architecture", "feature"]
+        assert columns["time_budget"] == ["thorough", "quick"]
+        assert columns["duration_seconds"] == [204.0, 45.0]
+        assert columns["quick_wins_count"] == [1, 2]
+        assert columns["next_steps_count"] == [4, 3]
+        assert columns["agents"][0] == ["backend-architect", "database-architect"]
+        assert columns["agent_count"][0] == 2
+
+    def test_missing_fields_are_none(self):
+        """Missing metadata is None and missing sections count zero."""
+        columns = flatten_results([{"content": {"topic": "Empty"}}])
+
+        assert columns["mode"] == [None]
+        assert columns["duration_seconds"] == [None]
+        assert columns["long_term_count"] == [0]
+        assert columns["agents"] == [None]
+
+    def test_non_list_sections_count_none(self):
+        """Sections that are null or not lists do not break the export."""
+        columns = flatten_results([{"content": {"quick_wins": None, "medium_effort": 3, "long_term": "x"}}])
+
+        assert columns["quick_wins_count"] == [0]
+        assert columns["medium_effort_count"] == [None]
+        assert columns["long_term_count"] == [None]
+
+    @pytest.mark.parametrize("kind", ["brainstorm", "rforge"])
+    def test_null_and_non_object_parts_are_none(self, kind):
+        """Null or non-object metadata, content and records give None columns."""
+        records = [
+            {"metadata": None, "content": None, "recommendations": ["x"]},
+            '{"metadata": [], "content": "text", "recommendations": null}',
+            "[1, 2]",
+            "null"
+        ]
+
+        columns = flatten_results(records, kind=kind)
+
+        assert columns["mode"] == [None] * 4
+        assert columns["agents"] == [None] * 4
+        assert columns["duration_seconds"] == [None] * 4
+        if kind == "brainstorm":
+            assert columns["topic"] == [None] * 4
+            assert columns["next_steps_count"] == [0] * 4
+        else:
+            assert columns["package_name"] == [None] * 4
+
+    def test_naive_timestamps_assume_utc(self):
+        """Timestamps without an offset are UTC unless assume_tz says otherwise."""
+        record = dict(RFORGE_RESULT, timestamp="2024-12-24T14:00:00")
+
+        default = flatten_results([record], kind="rforge")
+        shifted = flatten_results([record], kind="rforge", assume_tz=timezone(timedelta(hours=2)))
+
+        assert default["timestamp"] == [datetime(2024, 12, 24, 14, 0, tzinfo=timezone.utc)]
+        assert shifted["timestamp"] == [datetime(2024, 12, 24, 12, 0, tzinfo=timezone.utc)]
+
+    def test_serialized_records(self, mock_brainstorm_thorough_result):
+        """Pretty JSON and JSON Lines records flatten like dictionaries."""
+        stream = io.StringIO()
+        format_many([mock_brainstorm_thorough_result], stream)
+        records = [JSONFormatter().format(mock_brainstorm_thorough_result), stream.getvalue()]
+
+        columns = flatten_results(records)
+
+        assert columns == flatten_results([mock_brainstorm_thorough_result] * 2)
+
+    def test_rforge_columns(self):
+        """RForge results keep status, package metadata and raw results."""
+        columns = flatten_results([json.dumps(RFORGE_RESULT)], kind="rforge")
+
+        assert columns["status"] == ["success"]
+        assert columns["package_name"] == ["medfit"]
+        assert columns["data_count"] == [2]
+        assert json.loads(columns["results"][0]) == RFORGE_RESULT["results"]
+
+    def test_invalid_kind(self):
+        """Unknown record kinds are rejected."""
+        with pytest.raises(ValueError, match="Invalid record kind 'notes'"):
+            flatten_results([], kind="notes")
+
+
+@pytest.mark.unit
+class TestColumnarFiles:
+    """Test writing Arrow and Parquet files."""
+
+    def test_table_types(self, mock_brainstorm_thorough_result):
+        """Columns are typed for vectorized scans."""
+        pa = pytest.importorskip("pyarrow")
+
+        table = results_table([mock_brainstorm_thorough_result])
+
+        assert table.schema.field("duration_seconds").type == pa.float64()
+        assert table.schema.field("quick_wins_count").type == pa.int32()
+        assert table.schema.field("agents").type == pa.list_(pa.string())
+        assert pa.types.is_dictionary(table.schema.field("mode").type)
+
+    def test_parquet_batches(self, tmp_path, mock_brainstorm_thorough_result, mock_brainstorm_quick_result):
+        """Parquet files are written one row group per batch."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "runs.parquet")
+
+        rows = write_columnar(
+            [mock_brainstorm_thorough_result, mock_brainstorm_quick_result] * 3, path, batch_rows=4
+        )
+
+        assert rows == 6
+        assert pq.ParquetFile(path).num_row_groups == 2
+        table = pq.read_table(path, columns=["duration_seconds"])
+        assert sum(table.column("duration_seconds").to_pylist()) == 3 * (204 + 45)
+
+    def test_arrow_rforge(self, tmp_path):
+        """RForge results export to Arrow IPC files."""
+        pa = pytest.importorskip("pyarrow")
+        path = str(tmp_path / "checks.arrow")
+
+        assert write_columnar([RFORGE_RESULT], path, kind="rforge") == 1
+
+        with pa.ipc.open_file(path) as reader:
+            assert reader.read_all().column("version").to_pylist() == ["1.0.0"]
+
+    def test_empty_input_writes_schema(self, tmp_path):
+        """No records still gives a readable, empty file."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "runs.parquet")
+
+        assert write_columnar([], path) == 0
+        assert pq.read_table(path).column_names == list(column_names())
+
+    def test_unknown_suffix(self, tmp_path):
+        """The file format must be known."""
+        with pytest.raises(ValueError, match="Invalid columnar format"):
+            write_columnar([], str(tmp_path / "runs.csv"))
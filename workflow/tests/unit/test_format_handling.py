@@ -8,9 +8,36 @@ Tests output format generation and validation for:
 """
 
 import pytest
+import io
 import json
 import re
 
+from workflow.format_handlers import (
+    FormatHandler,
+    JSONFormatter,
+    MarkdownFormatter,
+    TerminalFormatter,
+    JSONLinesFormatter,
+    format_many,
+    format_output,
+    get_format_handler,
+    json_encoder,
+    write_output
+)
+from workflow.mode_parser import ModeParser
+
+QUICK_TERMINAL_OUTPUT = (
+    "⏱️  Mode: feature (quick) - Target: < 60 seconds\n\n"
+    "⚡ Quick Wins:\n- Email notifications - Easy to implement\n"
+    "- Basic templates - Reusable patterns\n\n"
+    "🔧 Medium Effort:\n- [ ] In-app notifications - Better UX\n\n"
+    "🏗️ Long Term:\n- Push notifications - Mobile engagement\n\n"
+    "→ Recommended Path:\nStart with email notifications using SendGrid...\n\n"
+    "Next Steps:\n1. [ ] Set up email service (SendGrid/Mailgun)\n"
+    "2. [ ] Create notification templates\n3. [ ] Add user notification preferences\n\n"
+    "✅ Completed in 45s (within quick budget)"
+)
+
 
 @pytest.mark.unit
 class TestTerminalFormat:
@@ -453,3 +480,221 @@ class TestFormatBackwardCompatibility:
 
         assert parsed_json["format"] == "json"
         assert parsed_markdown["format"] == "markdown"
+
+
+@pytest.mark.unit
+class TestStreamingFormat:
+    """Test streaming output through iter_format / write_to."""
+
+    FORMATS = ["terminal", "json", "markdown"]
+
+    def test_terminal_output_unchanged(self, mock_brainstorm_quick_result):
+        """Terminal output is byte-identical to the line-joined output."""
+        assert format_output(mock_brainstorm_quick_result, "terminal") == QUICK_TERMINAL_OUTPUT
+
+    def test_json_output_unchanged(self, mock_brainstorm_thorough_result):
+        """JSON output matches json.dumps(indent=2)."""
+        expected = json.dumps({
+            "metadata": mock_brainstorm_thorough_result["metadata"],
+            "content": mock_brainstorm_thorough_result["content"],
+            "recommendations": mock_brainstorm_thorough_result["recommendations"]
+        }, indent=2)
+
+        assert format_output(mock_brainstorm_thorough_result, "json") == expected
+
+    @pytest.mark.parametrize("format_type", FORMATS)
+    def test_chunks_concatenate_to_format(self, format_type, mock_brainstorm_thorough_result):
+        """Streamed chunks join to exactly format()."""
+        handler = get_format_handler(format_type)
+        chunks = list(handler.iter_format(mock_brainstorm_thorough_result))
+
+        assert "".join(chunks) == handler.format(mock_brainstorm_thorough_result)
+
+    @pytest.mark.parametrize("format_type", FORMATS)
+    def test_write_to_file(self, format_type, mock_brainstorm_quick_result):
+        """write_output streams to a file and reports characters written."""
+        buffer = io.StringIO()
+
+        written = write_output(mock_brainstorm_quick_result, buffer, format_type)
+
+        assert buffer.getvalue() == format_output(mock_brainstorm_quick_result, format_type)
+        assert written == len(buffer.getvalue())
+
+    def test_large_result_streams_in_chunks(self):
+        """Large results are produced in several chunks, lazily."""
+        data = {"content": {
+            "quick_wins": [f"idea {n}" for n in range(1000)],
+            "medium_effort": [f"task {n}" for n in range(1000)]
+        }}
+
+        terminal_chunks = TerminalFormatter().iter_format(data)
+        first = next(terminal_chunks)
+        assert first.startswith("⏱️  Mode: unknown")
+        assert "task 0" not in first
+        assert len(list(terminal_chunks)) >= 1
+        assert len(list(JSONFormatter().iter_format(data))) > 1
+
+    def test_format_only_subclass_streams(self):
+        """Handlers that only implement format() still stream."""
+        class UpperFormatter(FormatHandler):
+            def format(self, data):
+                return data["text"].upper()
+
+        assert list(UpperFormatter().iter_format({"text": "ok"})) == ["OK"]
+
+    def test_base_handler_not_implemented(self):
+        """The base handler implements neither method."""
+        with pytest.raises(NotImplementedError):
+            FormatHandler().format({})
+
+
+@pytest.mark.unit
+class TestLineSections:
+    """Test the result sections of terminal and markdown formats."""
+
+    def test_sections_not_split_across_chunks(self):
+        """Chunks end at section boundaries."""
+        data = {"content": {
+            "quick_wins": [f"idea {n}" for n in range(100)],
+            "medium_effort": [f"task {n}" for n in range(10)]
+        }}
+
+        chunks = list(TerminalFormatter().iter_format(data))
+
+        assert chunks[0].endswith("- idea 99\n")
+        assert chunks[1].startswith("\n🔧 Medium Effort:")
+
+    def test_missing_fields_render_empty(self):
+        """Dict items without a field render it as an empty string."""
+        data = {"content": {"medium_effort": [{"task": "t"}, "plain"]}}
+
+        assert "- [ ] t - \n- [ ] plain\n" in TerminalFormatter().format(data)
+
+    def test_markdown_omits_long_term(self, mock_brainstorm_quick_result):
+        """Markdown has no long-term section and no medium-effort outcome."""
+        markdown = MarkdownFormatter().format(mock_brainstorm_quick_result)
+
+        assert "Push notifications" not in markdown
+        assert "- [ ] In-app notifications\n" in markdown
+        assert markdown.endswith("3. [ ] Add user notification preferences\n")
+
+
+@pytest.mark.unit
+class TestCompactJSON:
+    """Test compact JSON output and encoder backends."""
+
+    @pytest.mark.parametrize("backend", [None, "json", "orjson", "msgspec"])
+    def test_compact_matches_pretty(self, backend, mock_brainstorm_thorough_result):
+        """Every installed backend encodes the same document on one line."""
+        if backend in ("orjson", "msgspec"):
+            pytest.importorskip(backend)
+        handler = JSONFormatter(compact=True, backend=backend)
+
+        output = handler.format(mock_brainstorm_thorough_result)
+
+        assert "\n" not in output
+        assert json.loads(output) == json.loads(JSONFormatter().format(mock_brainstorm_thorough_result))
+        assert "".join(handler.iter_format(mock_brainstorm_thorough_result)) == output
+
+    def test_pretty_uses_stdlib(self, mock_brainstorm_quick_result):
+        """Pretty output is byte-identical to json.dumps(indent=2)."""
+        handler = JSONFormatter()
+
+        assert handler.backend == "json"
+        assert handler.format(mock_brainstorm_quick_result) == json.dumps(
+            JSONFormatter._envelope(mock_brainstorm_quick_result), indent=2
+        )
+
+    def test_factory_options(self, mock_brainstorm_quick_result):
+        """Options reach the handler through the factory helpers."""
+        output = format_output(mock_brainstorm_quick_result, "json", compact=True)
+        stream = io.StringIO()
+        write_output(mock_brainstorm_quick_result, stream, "json", compact=True, backend="json")
+
+        assert "\n" not in output
+        assert stream.getvalue() == get_format_handler("json", compact=True, backend="json").format(
+            mock_brainstorm_quick_result
+        )
+
+    @pytest.mark.parametrize("format_type", ["terminal", "markdown", "jsonl", "json", "unknown"])
+    def test_options_ignored_by_other_formats(self, format_type, mock_brainstorm_quick_result):
+        """Options a format does not take are dropped instead of raising TypeError."""
+        expected = get_format_handler(format_type).format(mock_brainstorm_quick_result)
+
+        output = format_output(mock_brainstorm_quick_result, format_type, compact=True, backend="json")
+
+        if format_type == "json":
+            assert json.loads(output) == json.loads(expected)
+        else:
+            assert output == expected
+
+    def test_unknown_option_rejected(self, mock_brainstorm_quick_result):
+        """Options no format accepts are still reported."""
+        with pytest.raises(TypeError, match="Invalid format option 'compcat'"):
+            format_output(mock_brainstorm_quick_result, "json", compcat=True)
+
+    def test_stdlib_fallback_for_rejected_values(self):
+        """Values a fast backend rejects are encoded by the standard library."""
+        name, encode = json_encoder()
+
+        assert json.loads(encode({1: "one", "big": 2 ** 70})) == {"1": "one", "big": 2 ** 70}
+        assert encode({"topic": "café"}) == '{"topic":"café"}'
+        assert name in ("orjson", "msgspec", "json")
+
+    def test_invalid_backend(self):
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Invalid JSON backend 'ujson'"):
+            JSONFormatter(compact=True, backend="ujson")
+
+
+@pytest.mark.unit
+class TestJSONLines:
+    """Test JSON Lines batch output."""
+
+    def test_one_record_per_line(self, mock_brainstorm_quick_result, mock_brainstorm_thorough_result):
+        """Each result becomes one compact JSON object per line."""
+        stream = io.StringIO()
+
+        count = format_many([mock_brainstorm_quick_result, mock_brainstorm_thorough_result], stream)
+
+        lines = stream.getvalue().split("\n")
+        assert count == 2
+        assert lines[2] == ""
+        assert [json.loads(line) for line in lines[:2]] == [
+            json.loads(JSONFormatter().format(mock_brainstorm_quick_result)),
+            json.loads(JSONFormatter().format(mock_brainstorm_thorough_result))
+        ]
+
+    def test_factory_and_mode_parser(self, mock_brainstorm_quick_result):
+        """jsonl is a regular output format."""
+        output = format_output(mock_brainstorm_quick_result, "jsonl")
+
+        assert isinstance(get_format_handler("jsonl"), JSONLinesFormatter)
+        assert output.endswith("\n") and output.count("\n") == 1
+        assert ModeParser().parse("/brainstorm --format jsonl")["format"] == "jsonl"
+
+    def test_serialized_envelopes_passed_through(self, mock_brainstorm_quick_result):
+        """Serialized records are written as-is; pretty ones are compacted."""
+        handler = JSONLinesFormatter()
+        record = handler.format(mock_brainstorm_quick_result)
+        pretty = JSONFormatter().format(mock_brainstorm_quick_result)
+
+        assert handler.format(record) == record
+        assert handler.format(record.encode("utf-8")) == record
+        assert json.loads(handler.format(pretty)) == json.loads(record)
+        assert handler.format(pretty).count("\n") == 1
+
+    def test_append_to_log(self, tmp_path, mock_brainstorm_quick_result):
+        """Appending adds records and repairs a partial last line."""
+        log = tmp_path / "runs.jsonl"
+        log.write_text('{"metadata": {}}\n{"trunc')
+
+        assert format_many([mock_brainstorm_quick_result] * 3, str(log)) == 3
+
+        lines = log.read_text().splitlines()
+        assert lines[:2] == ['{"metadata": {}}', '{"trunc']
+        assert len(lines) == 5
+        assert all(json.loads(line)["metadata"]["mode"] == "feature" for line in lines[2:])
+
+        format_many([mock_brainstorm_quick_result], str(log), append=False)
+        assert len(log.read_text().splitlines()) == 1
@@ -0,0 +1,269 @@
+"""
+Unit tests for keyword matching in workflow plugin.
+
+Tests the multi-pattern matcher behind:
+- Agent selection from SELECTION_RULES
+- Skill activation from SKILLS triggers
+- Word-boundary, stemmed and substring match modes
+- Compiling once per rule table
+"""
+
+import random
+import string
+
+import pytest
+
+from workflow.agent_delegation import AgentConfig, AgentDelegator, SkillActivator
+from workflow.keyword_matcher import (
+    KeywordMatcher,
+    RuleMatcher,
+    TokenMatcher,
+    build_matcher,
+    clear_matcher_cache,
+    compiled_matcher,
+    compiled_skill_matcher,
+    stem,
+    tokenize
+)
+
+
+def naive_matches(rules, text):
+    """Reference: plain substring test per keyword."""
+    text_lower = text.lower()
+    return [keyword for keyword in rules if keyword.lower() in text_lower]
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test the Aho-Corasick matcher."""
+
+    def test_case_insensitive_substring(self):
+        """Keywords match anywhere in the text regardless of case."""
+        matcher = KeywordMatcher({"API": ["a"], "auth": ["b"]})
+
+        assert matcher.matched_keywords("rapid OAuth flow") == ["API", "auth"]
+        assert matcher.matched_keywords("nothing here") == []
+        assert matcher.matched_keywords("") == []
+
+    def test_overlapping_and_nested_keywords(self):
+        """Keywords that overlap or contain each other all match."""
+        matcher = KeywordMatcher({"he": [1], "she": [2], "his": [3], "hers": [4]})
+
+        assert matcher.matched_keywords("ushers") == ["he", "she", "hers"]
+        assert matcher.matched_keywords("this") == ["his"]
+
+    def test_values_unique_in_rule_order(self):
+        """Selected values are deduplicated and ordered by rule."""
+        matcher = KeywordMatcher({"auth": ["x", "y"], "api": ["y", "z"]})
+
+        assert matcher.matched_values("API auth") == ["x", "y", "z"]
+
+    def test_matches_naive_scan_on_random_rules(self):
+        """Results agree with the per-keyword substring scan."""
+        rng = random.Random(3)
+        alphabet = "abcd"
+        rules = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))): [n]
+            for n in range(200)
+        }
+        matcher = KeywordMatcher(rules)
+
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet + string.ascii_uppercase[:4]) for _ in range(30))
+            assert matcher.matched_keywords(text) == naive_matches(rules, text)
+
+    def test_rule_matcher_is_abstract(self):
+        """Matchers must implement match_indices."""
+        with pytest.raises(TypeError, match="match_indices"):
+            RuleMatcher({"auth": ["a"]})
+
+
+@pytest.mark.unit
+class TestTokenMatcher:
+    """Test word-boundary matching over the token index."""
+
+    def test_tokenize(self):
+        """Text splits into case-folded word tokens."""
+        assert tokenize("CI/CD for OAuth2-based APIs") == ["ci", "cd", "for", "oauth", "2", "based", "apis"]
+        assert tokenize("k8s on 64 cores") == ["k8s", "on", "64", "cores"]
+        assert tokenize("C++ and C# on STRASSE") == ["c++", "and", "c#", "on", "strasse"]
+        assert tokenize("Straße 认证 api_gateway") == ["strasse", "认证", "api", "gateway"]
+        assert tokenize("") == []
+
+    def test_no_match_inside_words(self):
+        """Short keywords no longer fire inside unrelated words."""
+        matcher = TokenMatcher({"UI": ["ux-ui-designer"], "API": ["backend-architect"]})
+
+        assert matcher.matched_keywords("build a rapid prototype") == []
+        assert matcher.matched_keywords("new UI for the API") == ["UI", "API"]
+
+    def test_whole_words_and_inflections(self):
+        """Keywords match whole words and their regular inflections only."""
+        matcher = TokenMatcher({"auth": ["a"], "deploy": ["d"], "database": ["b"]})
+
+        assert matcher.matched_keywords("auth, deployments and databases") == ["auth", "deploy", "database"]
+        assert matcher.matched_keywords("OAuth redeploy") == []
+
+    def test_no_false_prefix_matches(self):
+        """Longer words sharing a keyword's prefix do not match."""
+        matcher = TokenMatcher({"auth": ["a"], "C++": ["c"], ".NET": ["n"]})
+
+        assert matcher.matched_keywords("author authority") == []
+        assert matcher.matched_keywords("C API on the network") == []
+        assert matcher.matched_keywords("C++ and ASP.NET") == ["C++", ".NET"]
+
+    def test_symbol_keywords_stay_distinct(self):
+        """Keywords differing only in symbols select different values."""
+        matcher = TokenMatcher({"C++": ["cpp"], "C#": ["csharp"]})
+
+        assert matcher.matched_values("C# API") == ["csharp"]
+
+    def test_non_ascii_keywords(self):
+        """Keywords in any script match whole words."""
+        matcher = TokenMatcher({"认证": ["a"], "sécurité": ["s"]})
+
+        assert matcher.matched_keywords("认证 系统 et SÉCURITÉ") == ["认证", "sécurité"]
+
+    def test_empty_keywords_rejected(self):
+        """Keywords without letters or digits cannot be matched."""
+        with pytest.raises(ValueError, match="Invalid keyword '\\+\\+'"):
+            TokenMatcher({"++": ["x"]})
+
+    def test_phrase_keys(self):
+        """Multi-token keywords match consecutive tokens."""
+        matcher = TokenMatcher({"CI/CD": ["devops"], "code review": ["reviewer"]})
+
+        assert matcher.matched_keywords("set up ci-cd") == ["CI/CD"]
+        assert matcher.matched_keywords("code reviews and CI") == ["code review"]
+        assert matcher.matched_keywords("cd ci review code") == []
+
+    def test_stemming(self):
+        """Stemming maps related word forms together."""
+        rules = {"security": ["security-specialist"]}
+
+        assert stem("security") == stem("secure") == "secur"
+        assert TokenMatcher(rules).matched_keywords("secure login") == []
+        assert TokenMatcher(rules, stemming=True).matched_keywords("secure login") == ["security"]
+
+    def test_substring_mode_kept(self):
+        """Substring mode still matches inside words."""
+        matcher = build_matcher({"UI": ["ux-ui-designer"]}, "substring")
+
+        assert matcher.matched_keywords("build") == ["UI"]
+
+
+@pytest.mark.unit
+class TestCompiledMatcher:
+    """Test that matchers are compiled once per rule table."""
+
+    def test_reused_for_same_table(self):
+        """The same table object gets the same matcher."""
+        rules = {"auth": ["backend-architect"]}
+
+        assert compiled_matcher(rules) is compiled_matcher(rules)
+        assert compiled_matcher(rules, "substring") is not compiled_matcher(rules)
+
+    def test_rebuilt_for_replaced_table(self):
+        """A replaced table gets a new matcher."""
+        first = compiled_matcher({"auth": ["a"]})
+        second = compiled_matcher({"auth": ["b"]})
+
+        assert second.matched_values("auth") == ["b"]
+        assert first is not second
+
+    def test_cache_does_not_grow_with_tables(self):
+        """Only the latest table per kind and mode stays compiled."""
+        from workflow import keyword_matcher
+
+        clear_matcher_cache()
+        for n in range(50):
+            compiled_matcher({f"keyword{n}": [n]})
+
+        assert len(keyword_matcher._compiled) == 1
+
+    def test_clear_after_in_place_edit(self):
+        """Clearing the cache picks up in-place edits."""
+        rules = {"auth": ["a"]}
+        compiled_matcher(rules)
+        rules["deploy"] = ["b"]
+        clear_matcher_cache()
+
+        assert compiled_matcher(rules).matched_values("deploy") == ["b"]
+
+    def test_skill_table_compiled_once(self):
+        """Skill tables compile to trigger -> skill matchers."""
+        skills = {"s": {"triggers": ["x"]}}
+
+        assert compiled_skill_matcher(skills).matched_values("x") == ["s"]
+        assert compiled_skill_matcher(skills) is compiled_skill_matcher(skills)
+
+    def test_invalid_match_mode(self):
+        """Unknown match modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid match mode 'fuzzy'"):
+            build_matcher({"auth": ["a"]}, "fuzzy")
+
+
+@pytest.mark.unit
+class TestMatcherSelection:
+    """Test agent selection and skill activation through the matcher."""
+
+    def test_select_agents_in_rule_order(self):
+        """Selected agents follow SELECTION_RULES order."""
+        delegator = AgentDelegator()
+
+        assert delegator.select_agents("database auth", "default") == [
+            "backend-architect", "security-specialist"
+        ]
+
+    def test_select_agents_ignores_embedded_keywords(self):
+        """Keywords inside other words do not trigger delegation."""
+        delegator = AgentDelegator()
+
+        assert delegator.select_agents("build a rapid prototype", "default") == []
+
+    def test_select_agents_for_oauth_not_author(self):
+        """OAuth topics reach the auth agents; "author" does not."""
+        delegator = AgentDelegator()
+
+        assert delegator.select_agents("OAuth login", "default") == [
+            "backend-architect", "security-specialist"
+        ]
+        assert delegator.select_agents("author guidelines", "default") == []
+
+    @pytest.mark.parametrize("match_mode", ["word", "stem"])
+    @pytest.mark.parametrize("topic", ["user authorization", "authenticate users", "OAuth2 login"])
+    def test_select_agents_for_auth_variants(self, topic, match_mode, monkeypatch):
+        """Auth topics the substring scan selected still reach the auth agents."""
+        monkeypatch.setattr(AgentConfig, "MATCH_MODE", match_mode)
+
+        assert AgentDelegator().select_agents(topic, "default") == [
+            "backend-architect", "security-specialist"
+        ]
+
+    def test_dockerfile_activates_devops(self):
+        """Dockerfile topics still activate the devops skill."""
+        assert SkillActivator().get_activated_skills("write a Dockerfile") == ["devops-helper"]
+
+    def test_select_agents_matches_substring_scan(self):
+        """Selection covers the same agents as the substring scan."""
+        delegator = AgentDelegator()
+        topic = "Secure API deploy with database performance"
+        expected = {
+            agent
+            for keyword in naive_matches(AgentConfig.SELECTION_RULES, topic)
+            for agent in AgentConfig.SELECTION_RULES[keyword]
+        }
+
+        assert set(delegator.select_agents(topic, "thorough")) <= expected
+        assert len(delegator.select_agents(topic, "thorough")) == 4
+
+    def test_skill_activation(self):
+        """Skills activate on any trigger, case-insensitively."""
+        activator = SkillActivator()
+
+        assert activator.should_activate("devops-helper", "set up ci/cd")
+        assert not activator.should_activate("devops-helper", "write docs")
+        assert not activator.should_activate("unknown-skill", "deploy")
+        assert activator.get_activated_skills("REST API with React") == [
+            "backend-designer", "frontend-designer"
+        ]
@@ -8,8 +8,28 @@ Tests command parsing logic for:
 - Format parameter parsing
 """
 
+import io
+import json
+import pickle
+import types
+
 import pytest
 
+from workflow import mode_parser
+from workflow.mode_parser import (
+    IncrementalParser,
+    ModeParser,
+    ParsedCommand,
+    ParseCache,
+    disable_parse_cache,
+    enable_parse_cache,
+    OrchestrateCommand,
+    parse_cache_stats,
+    parse_command_line,
+    parse_many,
+    parse_stream,
+)
+
 
 @pytest.mark.unit
 class TestTimeBudgetModeParsing:
@@ -356,3 +376,433 @@ class TestV2NewFeatures:
         assert parsed["content_mode"] == "architecture"
         assert parsed["format"] == "json"
         assert "oauth" in parsed["topic"]
+
+
+@pytest.mark.unit
+class TestSinglePassParser:
+    """Test keyword precedence and exclusion rules of the single-pass parser."""
+
+    def test_time_budget_precedence_ignores_position(self):
+        """Quick wins over thorough regardless of word order."""
+        parsed = pytest.parse_mode_from_command("/brainstorm thorough quick auth")
+
+        assert parsed["time_budget_mode"] == "quick"
+        assert parsed["topic"] == "thorough auth"
+
+    def test_content_mode_precedence_ignores_position(self):
+        """Content modes follow CONTENT_MODES order."""
+        parsed = pytest.parse_mode_from_command("/brainstorm devops feature pipeline")
+
+        assert parsed["content_mode"] == "feature"
+        assert parsed["topic"] == "devops pipeline"
+
+    def test_repeated_keywords_removed_from_topic(self):
+        """Every occurrence of a chosen mode is excluded from the topic."""
+        parsed = pytest.parse_mode_from_command("/brainstorm quick auth quick flow")
+
+        assert parsed["topic"] == "auth flow"
+
+    def test_default_word_kept_in_topic(self):
+        """The implicit default budget is not treated as a keyword."""
+        parsed = pytest.parse_mode_from_command("/brainstorm default settings")
+
+        assert parsed["time_budget_mode"] == "default"
+        assert parsed["topic"] == "default settings"
+
+    def test_format_value_excluded_everywhere(self):
+        """The format value is dropped from the topic wherever it appears."""
+        parsed = pytest.parse_mode_from_command("/brainstorm json schema --format json")
+
+        assert parsed["format"] == "json"
+        assert parsed["topic"] == "schema"
+
+    def test_keyword_as_format_value(self):
+        """A keyword following --format is both the format and a mode."""
+        parsed = pytest.parse_mode_from_command("/brainstorm --format quick auth")
+
+        assert parsed["format"] == "quick"
+        assert parsed["time_budget_mode"] == "quick"
+        assert parsed["topic"] == "auth"
+
+    def test_trailing_format_flag(self):
+        """A dangling --format falls back to the default format."""
+        parsed = pytest.parse_mode_from_command("/brainstorm auth --format")
+
+        assert parsed["format"] == "terminal"
+        assert parsed["topic"] == "auth"
+
+    def test_whitespace_only_command(self):
+        """Whitespace-only input returns defaults."""
+        parsed = pytest.parse_mode_from_command("   ")
+
+        assert parsed["time_budget_mode"] == "default"
+        assert parsed["topic"] is None
+
+
+@pytest.mark.unit
+class TestBulkParsing:
+    """Test lazy bulk parsing of many commands."""
+
+    COMMANDS = [
+        "/brainstorm quick feature auth",
+        "/brainstorm --format json",
+        "/brainstorm thorough architecture oauth --format markdown",
+    ]
+
+    def test_parse_many_is_lazy(self):
+        """parse_many returns a generator that consumes input on demand."""
+        consumed = []
+
+        def commands():
+            for command in self.COMMANDS:
+                consumed.append(command)
+                yield command
+
+        results = parse_many(commands())
+        assert isinstance(results, types.GeneratorType)
+        assert consumed == []
+
+        first = next(results)
+        assert first["time_budget_mode"] == "quick"
+        assert consumed == self.COMMANDS[:1]
+
+    def test_parse_many_matches_single_parse(self):
+        """Bulk results equal individual parse results, in order."""
+        expected = [pytest.parse_mode_from_command(c) for c in self.COMMANDS]
+
+        assert list(parse_many(self.COMMANDS)) == expected
+
+    def test_parse_stream_plain_lines(self):
+        """Plain logs are parsed one command per non-blank line."""
+        log = io.StringIO("\n".join(self.COMMANDS[:2]) + "\n\n")
+
+        results = list(parse_stream(log))
+
+        assert len(results) == 2
+        assert results[0]["topic"] == "auth"
+        assert results[1]["format"] == "json"
+
+    def test_parse_stream_jsonl_field(self):
+        """JSONL logs read the command from the given field."""
+        records = [{"command": c, "session": i} for i, c in enumerate(self.COMMANDS)]
+        records.append({"event": "resume"})
+        log = io.StringIO("\n".join(json.dumps(r) for r in records))
+
+        results = list(parse_stream(log, field="command"))
+
+        assert len(results) == 3
+        assert results[2]["content_mode"] == "architecture"
+
+    def test_parse_stream_skips_truncated_line(self):
+        """A truncated JSONL line is skipped by default and raised on request."""
+        records = [json.dumps({"command": c}) for c in self.COMMANDS[:2]]
+        text = "\n".join(records + ['{"command": "/brainstorm qu'])
+
+        results = list(parse_stream(io.StringIO(text), field="command"))
+        parser_results = list(ModeParser().parse_stream(io.StringIO(text), field="command"))
+
+        assert len(results) == 2
+        assert results[0]["topic"] == "auth"
+        assert parser_results == results
+        with pytest.raises(json.JSONDecodeError):
+            list(parse_stream(io.StringIO(text), field="command", errors="raise"))
+
+    def test_parse_stream_invalid_errors_mode(self):
+        """Unknown errors modes are rejected before reading."""
+        with pytest.raises(ValueError, match="Invalid errors mode 'ignore'"):
+            parse_stream(io.StringIO(""), field="command", errors="ignore")
+
+    @pytest.mark.slow
+    def test_parse_many_multiprocessing_preserves_order(self):
+        """Chunked multiprocessing mode yields results in input order."""
+        commands = self.COMMANDS * 5
+        expected = list(parse_many(commands))
+
+        assert list(parse_many(commands, processes=2, chunksize=4)) == expected
+
+
+@pytest.mark.unit
+class TestParsedCommand:
+    """Test the compact ParsedCommand result type."""
+
+    def test_parse_returns_parsed_command(self):
+        """Parse results are ParsedCommand records."""
+        parsed = pytest.parse_mode_from_command("/brainstorm quick feature auth")
+
+        assert isinstance(parsed, ParsedCommand)
+        assert parsed.time_budget_mode == "quick"
+        assert parsed["time_budget_mode"] == "quick"
+
+    def test_dict_compatible_view(self):
+        """ParsedCommand compares equal to and converts into a plain dict."""
+        parsed = pytest.parse_mode_from_command("/brainstorm --format json")
+        expected = {
+            "command": "/brainstorm",
+            "time_budget_mode": "default",
+            "content_mode": None,
+            "topic": None,
+            "format": "json",
+        }
+
+        assert parsed == expected
+        assert dict(parsed) == expected
+        assert parsed.to_dict() == expected
+        assert list(parsed.keys()) == list(expected.keys())
+        assert parsed.get("missing", "fallback") == "fallback"
+
+    def test_json_serialization_via_to_dict(self):
+        """Results are not dicts, so they are serialized through to_dict()."""
+        parsed = pytest.parse_mode_from_command("/brainstorm quick auth --format json")
+
+        with pytest.raises(TypeError):
+            json.dumps(parsed)
+        assert json.loads(json.dumps(parsed.to_dict())) == dict(parsed)
+
+    def test_unknown_key_raises(self):
+        """Only the five result fields are exposed through the dict view."""
+        parsed = pytest.parse_mode_from_command("/brainstorm auth")
+
+        with pytest.raises(KeyError):
+            parsed["__class__"]
+
+    def test_no_instance_dict(self):
+        """Records are slotted (no per-instance __dict__)."""
+        parsed = pytest.parse_mode_from_command("/brainstorm auth")
+
+        assert not hasattr(parsed, "__dict__")
+
+    def test_values_are_interned(self):
+        """Mode and format values share the parser's constant strings."""
+        first = pytest.parse_mode_from_command("/brainstorm quick design --format json")
+        second = ModeParser().parse("/brainstorm " + "quick design --format json")
+
+        assert first.time_budget_mode is second.time_budget_mode
+        assert first.content_mode is second.content_mode
+        assert first.format is second.format
+
+    def test_pickle_round_trip(self):
+        """Records survive pickling (multiprocessing parse_many)."""
+        parsed = pytest.parse_mode_from_command("/brainstorm thorough oauth")
+
+        assert pickle.loads(pickle.dumps(parsed)) == parsed
+
+
+@pytest.fixture
+def parse_cache():
+    """Enable a small parse cache for one test, then restore the previous one."""
+    previous = mode_parser._parse_cache
+    enable_parse_cache(maxsize=2)
+    yield
+    mode_parser._parse_cache = previous
+
+
+@pytest.mark.unit
+class TestParseCache:
+    """Test the opt-in LRU cache in front of parse_mode_from_command."""
+
+    def test_disabled_by_default(self):
+        """Without enable_parse_cache, stats report a disabled cache."""
+        disable_parse_cache()
+
+        assert parse_cache_stats()["enabled"] is False
+
+    def test_hits_return_same_result(self, parse_cache):
+        """Repeated commands are served from the cache."""
+        first = pytest.parse_mode_from_command("/brainstorm quick feature auth")
+        second = pytest.parse_mode_from_command("/brainstorm quick feature auth")
+
+        assert first is second
+        stats = parse_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_least_recently_used_evicted(self, parse_cache):
+        """The least recently used command is evicted at maxsize."""
+        pytest.parse_mode_from_command("/brainstorm a")
+        pytest.parse_mode_from_command("/brainstorm b")
+        pytest.parse_mode_from_command("/brainstorm a")
+        pytest.parse_mode_from_command("/brainstorm c")
+        pytest.parse_mode_from_command("/brainstorm a")
+
+        stats = parse_cache_stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["size"] == stats["maxsize"] == 2
+
+    def test_cached_results_are_immutable(self, parse_cache):
+        """Callers cannot mutate a cached entry."""
+        parsed = pytest.parse_mode_from_command("/brainstorm quick auth")
+
+        with pytest.raises(AttributeError):
+            parsed.topic = "changed"
+        with pytest.raises(TypeError):
+            parsed["topic"] = "changed"
+
+        assert pytest.parse_mode_from_command("/brainstorm quick auth")["topic"] == "auth"
+
+    def test_invalid_size_rejected(self):
+        """Cache size must be positive."""
+        with pytest.raises(ValueError):
+            ParseCache(ModeParser().parse, maxsize=0)
+
+
+@pytest.mark.unit
+class TestCommandGrammar:
+    """Test recognition of workflow commands in arbitrary text lines."""
+
+    @pytest.mark.parametrize("line,expected_mode", [
+        ('orchestrate "add auth" optimize', "optimize"),
+        ('orchestrate "fix bug" debug', "debug"),
+        ('orchestrate "prep release" release', "release"),
+        ('orchestrate "quick task"', "default"),
+        ("orchestrate status", None),
+        ("orchestrate timeline", None),
+    ])
+    def test_orchestrate_mode_syntax(self, line, expected_mode):
+        """Craft orchestrate commands yield their mode (None for subcommands)."""
+        parsed = parse_command_line(line)
+
+        assert isinstance(parsed, OrchestrateCommand)
+        assert parsed.mode == expected_mode
+
+    def test_orchestrate_subcommand_and_namespace(self):
+        """Namespaced orchestrate subcommands are recognized."""
+        parsed = parse_command_line("/craft:orchestrate status")
+
+        assert parsed.subcommand == "status"
+        assert parsed.task is None
+
+    def test_brainstorm_line_matches_mode_parser(self):
+        """Brainstorm lines parse exactly like parse_mode_from_command."""
+        line = "/brainstorm thorough architecture oauth --format json"
+
+        assert parse_command_line(line) == pytest.parse_mode_from_command(line)
+
+    def test_namespaced_brainstorm_with_newline(self):
+        """Transcript lines may be indented, namespaced and newline-terminated."""
+        parsed = parse_command_line("  /workflow:brainstorm quick api\n")
+
+        assert parsed["time_budget_mode"] == "quick"
+        assert parsed["topic"] == "api"
+
+    @pytest.mark.parametrize("line", [
+        "",
+        "sounds good, thanks!",
+        "ok /brainstorm later",
+        "/brainstorming session notes",
+        'orchestrate "task" unknown-mode',
+        "/help",
+    ])
+    def test_non_commands_rejected(self, line):
+        """Chat lines that are not commands return None."""
+        assert parse_command_line(line) is None
+
+
+@pytest.mark.unit
+class TestIncrementalParser:
+    """Test keystroke-level incremental parsing and completion."""
+
+    COMMAND = "/brainstorm quick feature user auth --format json"
+
+    def test_every_prefix_matches_full_parse(self):
+        """Typing character by character always matches ModeParser.parse."""
+        parser = ModeParser()
+        incremental = IncrementalParser()
+
+        for end in range(len(self.COMMAND) + 1):
+            incremental.update(self.COMMAND[:end])
+            assert incremental.result() == parser.parse(self.COMMAND[:end])
+
+    def test_backspace_and_mid_edit(self):
+        """Deleting and editing earlier tokens rolls back state."""
+        parser = ModeParser()
+        incremental = IncrementalParser()
+        incremental.update(self.COMMAND)
+
+        for text in [
+            "/brainstorm quick feature",
+            "/brainstorm quick",
+            "/brainstorm thorough design dashboard",
+            "/brainstorm --format markdown api",
+            "",
+        ]:
+            incremental.update(text)
+            assert incremental.result() == parser.parse(text)
+
+    def test_complete_command(self):
+        """The first token completes to the command."""
+        incremental = IncrementalParser()
+        incremental.update("/br")
+
+        assert incremental.completions() == ["/brainstorm"]
+
+    def test_complete_time_and_content_modes(self):
+        """Unfilled slots are offered, filtered by the typed prefix."""
+        incremental = IncrementalParser()
+
+        incremental.update("/brainstorm ")
+        assert incremental.completions() == (
+            ModeParser.TIME_BUDGET_MODES + ModeParser.CONTENT_MODES + ["--format"]
+        )
+
+        incremental.update("/brainstorm quick d")
+        assert incremental.completions() == ["design", "devops"]
+
+    def test_complete_format_value(self):
+        """After --format only format values are offered."""
+        incremental = IncrementalParser()
+        incremental.update("/brainstorm auth --format m")
+
+        assert incremental.completions() == ["markdown"]
+
+    def test_only_overriding_modes_offered(self):
+        """Modes outranked by the current ones are not offered."""
+        incremental = IncrementalParser()
+
+        incremental.update("/brainstorm quick feature --format json ")
+        assert incremental.completions() == []
+
+        # "quick" and earlier content modes still override
+        incremental.update("/brainstorm thorough backend --format json ")
+        assert incremental.completions() == ["quick", "feature", "architecture", "design"]
+
+    def test_completions_match_parser(self):
+        """A mode is offered exactly when appending it changes the parse."""
+        parser = ModeParser()
+        incremental = IncrementalParser()
+
+        for text in ["/brainstorm ", "/brainstorm thorough ", "/brainstorm quick design ", "/brainstorm devops auth "]:
+            incremental.update(text)
+            offered = set(incremental.completions())
+            before = parser.parse(text)
+            for mode in ModeParser.TIME_BUDGET_MODES + ModeParser.CONTENT_MODES:
+                after = parser.parse(text + mode)
+                changes = (after["time_budget_mode"], after["content_mode"]) != (
+                    before["time_budget_mode"], before["content_mode"]
+                )
+                assert (mode in offered) == changes, (text, mode)
+
+    def test_keystroke_work_bounded_for_long_topics(self):
+        """Each keystroke classifies at most the edited tokens, not the whole command."""
+        topic = " ".join(f"word{i}" for i in range(2000))
+        command = f"/brainstorm thorough {topic} --format json"
+        incremental = IncrementalParser()
+        incremental.update(command[:-200])
+
+        steps = 0
+        step = incremental._step
+
+        def counting_step(state, word):
+            nonlocal steps
+            steps += 1
+            return step(state, word)
+
+        incremental._step = counting_step
+        for end in range(len(command) - 200, len(command) + 1):
+            incremental.update(command[:end])
+            incremental.result()
+            incremental.completions()
+
+        # One token committed per word boundary, plus the partial token in result()
+        assert steps <= 201 + command[-200:].count(" ") + 1
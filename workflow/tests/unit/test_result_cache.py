@@ -0,0 +1,212 @@
+"""
+Unit tests for the agent result cache in workflow plugin.
+
+Tests caching of delegated agent outputs:
+- Content addressing by (agent, normalized topic, mode)
+- TTL expiry and size-based eviction
+- Inspection and purging
+- Cache hits in delegation and completion messages
+"""
+
+import pytest
+
+from workflow.agent_delegation import AgentDelegator
+from workflow.result_cache import AgentResultCache
+from workflow.time_budgets import TimeBudget
+
+
+class WallClock:
+    """Manually advanced wall clock (seconds since the epoch)."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return WallClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return AgentResultCache(str(tmp_path / "agent-results"), ttl_seconds=3600, clock=clock)
+
+
+@pytest.mark.unit
+class TestAgentResultCache:
+    """Test storing, expiring and evicting cached results."""
+
+    def test_round_trip(self, cache):
+        """Stored results are returned for the same key."""
+        assert cache.put("security-specialist", "auth", "thorough", {"risks": ["CSRF"]})
+
+        assert cache.lookup("security-specialist", "auth", "thorough") == (True, {"risks": ["CSRF"]})
+        assert cache.lookup("security-specialist", "auth", "default") == (False, None)
+        assert cache.get("backend-architect", "auth", "thorough", "missing") == "missing"
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_topic_normalized(self, cache):
+        """Case, punctuation and spacing do not change the key."""
+        cache.put("security-specialist", "Auth flow?", "thorough", "result")
+
+        assert cache.get("security-specialist", "  auth   FLOW ", "thorough") == "result"
+
+    def test_distinct_topics_not_merged(self, cache):
+        """Non-ASCII and symbol-bearing topics keep their own entries."""
+        cache.put("backend-architect", "认证系统", "thorough", "auth")
+        cache.put("backend-architect", "C++ API", "thorough", "cpp")
+
+        assert cache.get("backend-architect", "支付系统", "thorough") is None
+        assert cache.get("backend-architect", "C# API", "thorough") is None
+        assert cache.get("backend-architect", "认证系统", "thorough") == "auth"
+        assert cache.get("backend-architect", "c++ api", "thorough") == "cpp"
+
+    def test_topic_without_tokens_not_cached(self, cache):
+        """Topics that normalize to nothing are neither stored nor looked up."""
+        assert not cache.put("security-specialist", "?!", "thorough", "result")
+
+        assert cache.lookup("security-specialist", "...", "thorough") == (False, None)
+        assert cache.stats()["entries"] == 0
+
+    def test_put_scans_only_when_over_limits(self, tmp_path, clock, monkeypatch):
+        """Writes within the limits do not rescan the directory."""
+        cache = AgentResultCache(str(tmp_path), max_entries=5, clock=clock)
+        scans = []
+        scan = cache._scan
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+
+        for n in range(5):
+            cache.put("backend-architect", f"topic {n}", "thorough", n)
+            clock.now += 1
+        assert len(scans) == 1
+
+        cache.put("backend-architect", "topic 5", "thorough", 5)
+        assert len(scans) == 2
+        assert cache.get("backend-architect", "topic 0", "thorough") is None
+
+    def test_unserializable_result_not_stored(self, cache):
+        """Results that are not JSON-serializable are skipped."""
+        assert not cache.put("security-specialist", "auth", "thorough", object())
+        assert cache.stats()["entries"] == 0
+
+    def test_ttl_expiry(self, cache, clock):
+        """Expired entries are misses and are removed."""
+        cache.put("security-specialist", "auth", "thorough", "result")
+        clock.now += 3601
+
+        assert cache.lookup("security-specialist", "auth", "thorough") == (False, None)
+        assert cache.stats()["entries"] == 0
+
+    def test_evicts_oldest_beyond_max_entries(self, tmp_path, clock):
+        """The oldest entries go first when over max_entries."""
+        cache = AgentResultCache(str(tmp_path), max_entries=2, clock=clock)
+        for topic in ("first", "second", "third"):
+            cache.put("backend-architect", topic, "thorough", topic)
+            clock.now += 1
+
+        assert [entry["topic"] for entry in cache.entries()] == ["second", "third"]
+
+    def test_evicts_beyond_max_bytes(self, tmp_path, clock):
+        """Entries are evicted to stay within max_bytes."""
+        cache = AgentResultCache(str(tmp_path), max_bytes=1000, clock=clock)
+        for topic in ("first", "second", "third"):
+            cache.put("backend-architect", topic, "thorough", "x" * 400)
+            clock.now += 1
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 1000
+        assert stats["entries"] == 1
+
+    def test_entries_and_purge(self, cache, clock):
+        """Entries can be listed and purged by agent, mode or expiry."""
+        cache.put("security-specialist", "auth", "thorough", "a")
+        cache.put("backend-architect", "auth", "thorough", "b")
+        cache.put("backend-architect", "auth", "default", "c")
+        clock.now += 10
+
+        entries = cache.entries()
+        assert len(entries) == 3
+        assert entries[0]["age_seconds"] == 10
+        assert not any(entry["expired"] for entry in entries)
+
+        assert cache.purge(expired_only=True) == 0
+        assert cache.purge(agent="backend-architect", mode="default") == 1
+        assert cache.purge(agent="backend-architect") == 1
+        assert cache.purge() == 1
+        assert cache.entries() == []
+
+    @pytest.mark.parametrize("content", ["[]", "{}", '{"created": "now"}', "not json"])
+    def test_malformed_entries_are_misses(self, cache, content):
+        """Entry files that are not valid entries are misses and not listed."""
+        cache.put("security-specialist", "auth", "thorough", "a")
+        path = cache._path(cache.key("security-specialist", "auth", "thorough"))
+        with open(path, "w", encoding="utf-8") as entry_file:
+            entry_file.write(content)
+
+        assert cache.lookup("security-specialist", "auth", "thorough") == (False, None)
+        assert cache.entries() == []
+        assert cache.purge() == 0
+
+
+@pytest.mark.unit
+class TestCachedDelegation:
+    """Test cache hits in delegation."""
+
+    # "deploy" selects devops-engineer, padded with backend-architect
+    TOPIC = "deploy pipeline"
+
+    def test_delegate_skips_cached_agents(self, cache):
+        """A repeated run serves every agent from the cache."""
+        calls = []
+
+        def invoke(agent, topic, deadline):
+            calls.append(agent)
+            return f"{agent} analysis"
+
+        first = AgentDelegator().delegate(self.TOPIC, "thorough", invoke, cache=cache)
+        second = AgentDelegator().delegate(self.TOPIC, "thorough", invoke, cache=cache)
+
+        assert len(calls) == 2
+        assert [r.status for r in first] == ["completed", "completed"]
+        assert [r.status for r in second] == ["cached", "cached"]
+        assert [r.result for r in second] == [r.result for r in first]
+
+    def test_failed_results_not_cached(self, cache):
+        """Failed agent calls are retried on the next run."""
+        def invoke(agent, topic, deadline):
+            raise RuntimeError("agent unavailable")
+
+        AgentDelegator().delegate(self.TOPIC, "thorough", invoke, cache=cache)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_run_yields_cached_first(self, cache):
+        """Concurrent runs yield hits up front and dispatch only misses."""
+        cache.put("backend-architect", self.TOPIC, "thorough", "cached analysis")
+        calls = []
+
+        def invoke(agent, topic, deadline):
+            calls.append(agent)
+            return f"{agent} analysis"
+
+        results = list(AgentDelegator().run(self.TOPIC, "thorough", invoke, cache=cache))
+
+        assert calls == ["devops-engineer"]
+        assert [(r.agent, r.status) for r in results] == [
+            ("backend-architect", "cached"),
+            ("devops-engineer", "completed")
+        ]
+        assert cache.get("devops-engineer", self.TOPIC, "thorough") == "devops-engineer analysis"
+
+    def test_completion_message_reports_hits(self):
+        """The completion message says how many results came from cache."""
+        budget = TimeBudget()
+
+        message = budget.format_completion_message(
+            "thorough", 3.2, agents=["a", "b"], cache_hits=2
+        )
+        assert message.endswith("with 2 agents (2 cached)")
+        assert "cached" not in budget.format_completion_message("thorough", 3.2)
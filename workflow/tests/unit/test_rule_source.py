@@ -0,0 +1,236 @@
+"""
+Unit tests for hot-reloadable rule sources in workflow plugin.
+
+Tests loading agent and skill rules from files:
+- JSON and YAML parsing and validation
+- Atomic swaps of AgentConfig and SkillActivator tables
+- Reusing compiled tables when nothing changed
+- Background watching
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from workflow.agent_delegation import AgentConfig, SkillActivator, routing_table, select_agents
+from workflow.rule_source import RuleSource, load_rules, parse_rules
+
+
+@pytest.fixture(autouse=True)
+def restore_rules(monkeypatch):
+    """Restore the built-in tables after each test."""
+    for owner, attribute in (
+        (AgentConfig, "AGENTS"),
+        (AgentConfig, "SELECTION_RULES"),
+        (AgentConfig, "MATCH_MODE"),
+        (SkillActivator, "SKILLS"),
+        (SkillActivator, "MATCH_MODE")
+    ):
+        monkeypatch.setattr(owner, attribute, getattr(owner, attribute))
+
+
+def write_rules(path, rules, mtime=None):
+    """Write a rules file, optionally forcing its modification time."""
+    path.write_text(json.dumps(rules))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+@pytest.mark.unit
+class TestParseRules:
+    """Test parsing and validating rules documents."""
+
+    def test_json_agents_get_tuple_durations(self):
+        """Durations become (min, max) tuples like the built-in table."""
+        rules = parse_rules(
+            '{"agents": {"docs-writer": {"typical_duration": [10, 30]}}}', "rules.json"
+        )
+
+        assert rules["agents"]["docs-writer"]["typical_duration"] == (10, 30)
+
+    def test_yaml(self):
+        """YAML files are parsed with PyYAML."""
+        pytest.importorskip("yaml")
+
+        rules = parse_rules("selection_rules:\n  docs: [backend-architect]\n", "rules.yaml")
+
+        assert rules == {"selection_rules": {"docs": ["backend-architect"]}}
+
+    def test_unknown_agent_rejected(self):
+        """Selection rules must reference known agents."""
+        with pytest.raises(ValueError, match="Unknown agent 'ghost' in selection rule 'docs'"):
+            parse_rules('{"selection_rules": {"docs": ["ghost"]}}', "rules.json")
+
+    def test_unknown_section_and_mode_rejected(self):
+        """Unknown sections and match modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid rules section 'modes'"):
+            parse_rules('{"modes": {}}', "rules.json")
+        with pytest.raises(ValueError, match="Invalid match mode 'fuzzy'"):
+            parse_rules('{"match_mode": "fuzzy"}', "rules.json")
+
+    @pytest.mark.parametrize("document", [
+        {"agents": ["backend-architect"]},
+        {"agents": {"docs-writer": "fast"}},
+        {"agents": {"docs-writer": {"typical_duration": 30}}},
+        {"selection_rules": ["docs"]},
+        {"selection_rules": {"docs": "backend-architect"}},
+        {"skills": {"docs": {"triggers": "docs"}}},
+        {"match_mode": ["word"]}
+    ])
+    def test_wrong_section_types_rejected(self, document):
+        """Sections of the wrong shape raise ValueError, not AttributeError/TypeError."""
+        with pytest.raises(ValueError, match="Invalid"):
+            parse_rules(json.dumps(document), "rules.json")
+
+    def test_malformed_json(self):
+        """Malformed files raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid rules file"):
+            parse_rules("{not json", "rules.json")
+
+
+@pytest.mark.unit
+class TestRuleSource:
+    """Test loading and reloading rules."""
+
+    def test_load_replaces_tables(self, tmp_path):
+        """Loaded sections replace the built-in tables."""
+        path = write_rules(tmp_path / "rules.json", {
+            "selection_rules": {"docs": ["ux-ui-designer"]},
+            "skills": {"docs-helper": {"triggers": ["docs"], "provides": ["style guide"]}}
+        })
+
+        source = load_rules(path)
+
+        assert source.revision == 1
+        assert select_agents("docs site", "default") == ["ux-ui-designer"]
+        assert SkillActivator().get_activated_skills("docs site") == ["docs-helper"]
+        # Sections missing from the file are kept
+        assert "backend-architect" in AgentConfig.AGENTS
+
+    def test_unchanged_file_not_reloaded(self, tmp_path):
+        """Polling an unchanged file does nothing."""
+        path = write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ux-ui-designer"]}})
+        source = load_rules(path)
+
+        assert not source.changed()
+        assert not source.poll()
+
+    def test_touched_file_reuses_tables(self, tmp_path):
+        """A new mtime with the same contents keeps the compiled tables."""
+        rules = {"selection_rules": {"docs": ["ux-ui-designer"]}}
+        path = write_rules(tmp_path / "rules.json", rules, mtime=1_000_000)
+        source = load_rules(path)
+        table = routing_table()
+
+        write_rules(tmp_path / "rules.json", rules, mtime=2_000_000)
+
+        assert source.changed()
+        assert not source.poll()
+        assert routing_table() is table
+        assert source.revision == 1
+
+    def test_edit_swaps_prebuilt_table(self, tmp_path):
+        """Edits install a routing table compiled before the swap."""
+        path = write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ux-ui-designer"]}}, 1_000_000)
+        source = load_rules(path)
+        old_table = routing_table()
+
+        write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["devops-engineer"]}}, 2_000_000)
+
+        assert source.poll()
+        assert routing_table() is not old_table
+        assert select_agents("docs", "default") == ["devops-engineer"]
+        # Selections already holding the old table are unaffected
+        assert old_table.select("docs", "default") == ["ux-ui-designer"]
+
+    def test_bad_edit_keeps_current_rules(self, tmp_path):
+        """A malformed edit is recorded and the current rules stay."""
+        path = write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ux-ui-designer"]}}, 1_000_000)
+        source = load_rules(path)
+
+        write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ghost"]}}, 2_000_000)
+
+        assert not source.poll()
+        assert isinstance(source.last_error, ValueError)
+        assert select_agents("docs", "default") == ["ux-ui-designer"]
+
+    def test_match_mode(self, tmp_path):
+        """The file can switch the match mode."""
+        load_rules(write_rules(tmp_path / "rules.json", {"match_mode": "substring"}))
+
+        assert select_agents("build a UI", "default") == ["ux-ui-designer"]
+        assert select_agents("rebuild", "default") == ["ux-ui-designer"]
+
+    def test_omitted_match_mode_resets_to_word(self, tmp_path):
+        """Dropping match_mode from the file goes back to the default mode."""
+        path = write_rules(tmp_path / "rules.json", {"match_mode": "substring"}, 1_000_000)
+        source = load_rules(path)
+
+        write_rules(tmp_path / "rules.json", {}, 2_000_000)
+
+        assert source.poll()
+        assert AgentConfig.MATCH_MODE == SkillActivator.MATCH_MODE == "word"
+        assert select_agents("rebuild", "default") == []
+
+    def test_malformed_section_keeps_watcher_alive(self, tmp_path):
+        """Type errors in a reloaded file are recorded, not raised."""
+        path = write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ux-ui-designer"]}}, 1_000_000)
+        source = load_rules(path)
+
+        write_rules(tmp_path / "rules.json", {"agents": ["a", "b"]}, 2_000_000)
+
+        assert not source.poll()
+        assert isinstance(source.last_error, ValueError)
+        assert select_agents("docs", "default") == ["ux-ui-designer"]
+
+    def test_readers_never_see_partial_reload(self, tmp_path):
+        """Selections during reloads come from one revision or the other."""
+        import threading
+
+        # "build" only fires inside "rebuild" in substring mode
+        first = {"selection_rules": {"docs": ["ux-ui-designer"], "build": ["backend-architect"]}}
+        second = {
+            "selection_rules": {"docs": ["devops-engineer"], "build": ["ux-ui-designer"]},
+            "match_mode": "substring"
+        }
+        path = tmp_path / "rules.json"
+        source = load_rules(write_rules(path, first))
+        stop = threading.Event()
+        seen = set()
+
+        def read():
+            while not stop.is_set():
+                seen.add(tuple(select_agents("docs rebuild", "default")))
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for n in range(50):
+                write_rules(path, (first, second)[n % 2])
+                source.reload(force=True)
+        finally:
+            stop.set()
+            reader.join()
+
+        assert seen <= {("ux-ui-designer",), ("devops-engineer", "ux-ui-designer")}
+
+    def test_watch_picks_up_edits(self, tmp_path):
+        """The background watcher reloads edited files."""
+        path = write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["ux-ui-designer"]}}, 1_000_000)
+        source = load_rules(path, watch=True, interval=0.01)
+        try:
+            with pytest.raises(RuntimeError, match="already watching"):
+                source.watch()
+
+            write_rules(tmp_path / "rules.json", {"selection_rules": {"docs": ["devops-engineer"]}}, 2_000_000)
+            for _ in range(200):
+                if source.revision == 2:
+                    break
+                time.sleep(0.01)
+        finally:
+            source.stop()
+
+        assert select_agents("docs", "default") == ["devops-engineer"]
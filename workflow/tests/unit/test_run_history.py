@@ -0,0 +1,152 @@
+"""
+Unit tests for run history in workflow plugin.
+
+Tests latency statistics of past runs:
+- Quantile sketch accuracy and bounds
+- Per-shape and per-mode statistics
+- JSON persistence
+- Data-driven budget predictions and completion messages
+"""
+
+import random
+
+import pytest
+
+from workflow.run_history import LatencySketch, RunHistory
+from workflow.time_budgets import TimeBudget, get_budget_for_mode
+
+
+@pytest.mark.unit
+class TestLatencySketch:
+    """Test the streaming quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Quantile estimates stay within the configured relative error."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(4, 0.6) for _ in range(20000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_empty_sketch(self):
+        """Empty sketches have no quantiles."""
+        summary = LatencySketch().summary()
+
+        assert summary["count"] == 0
+        assert summary["p95"] is None
+
+    def test_bucket_count_bounded(self):
+        """The number of buckets never exceeds max_buckets."""
+        sketch = LatencySketch(relative_accuracy=0.001, max_buckets=32)
+        for exponent in range(-2, 4):
+            for step in range(1, 100):
+                sketch.add(step * 10 ** exponent)
+
+        assert len(sketch.buckets) <= 32
+        assert sketch.quantile(0.99) <= sketch.max
+
+    def test_round_trip(self):
+        """Sketches serialize and restore losslessly."""
+        sketch = LatencySketch()
+        for value in (0.0, 12.5, 45, 212):
+            sketch.add(value)
+
+        restored = LatencySketch.from_dict(sketch.to_dict())
+
+        assert restored.summary() == sketch.summary()
+
+    def test_invalid_accuracy(self):
+        """Relative accuracy must be between 0 and 1."""
+        with pytest.raises(ValueError):
+            LatencySketch(relative_accuracy=1.5)
+
+
+@pytest.mark.unit
+class TestRunHistory:
+    """Test per-shape run history."""
+
+    AGENTS = ["backend-architect", "security-specialist"]
+
+    def test_shape_key_ignores_agent_order(self):
+        """Agent order does not change the shape."""
+        assert RunHistory.shape_key("thorough", "feature", self.AGENTS) == \
+            RunHistory.shape_key("thorough", "feature", reversed(self.AGENTS))
+
+    def test_summary_per_shape_and_mode(self):
+        """Statistics are kept per shape and per mode."""
+        history = RunHistory()
+        for elapsed in range(100, 200):
+            history.record("thorough", elapsed, "feature", self.AGENTS)
+        history.record("thorough", 900, "architecture", ["database-architect"])
+
+        shape = history.summary("thorough", "feature", self.AGENTS)
+        mode = history.summary("thorough")
+
+        assert shape["count"] == 100
+        assert shape["p50"] == pytest.approx(149.5, rel=0.02)
+        assert mode["count"] == 101
+        assert history.summary("quick") is None
+
+    def test_shapes_bounded(self):
+        """Least recently recorded shapes are dropped beyond max_shapes."""
+        history = RunHistory(max_shapes=2)
+        history.record("default", 10, "feature")
+        history.record("default", 10, "design")
+        history.record("default", 10, "feature")
+        history.record("default", 10, "backend")
+
+        assert history.shapes() == ("default|feature|", "default|backend|")
+
+    def test_persistence(self, tmp_path):
+        """History survives save and reload."""
+        path = tmp_path / "history" / "runs.json"
+        history = RunHistory(str(path))
+        history.record("quick", 42, "feature")
+        history.save()
+
+        reloaded = RunHistory(str(path))
+
+        assert reloaded.summary("quick", "feature")["count"] == 1
+        assert reloaded.summary("quick")["p50"] == pytest.approx(42, rel=0.02)
+
+    def test_save_requires_path(self):
+        """In-memory histories cannot be saved."""
+        with pytest.raises(ValueError):
+            RunHistory().save()
+
+
+@pytest.mark.unit
+class TestBudgetPredictions:
+    """Test data-driven budget predictions."""
+
+    def test_budget_without_history_unchanged(self):
+        """Without history the static budget is returned."""
+        assert get_budget_for_mode("quick") == TimeBudget.BUDGETS["quick"]
+
+    def test_budget_with_history_has_prediction(self):
+        """With history the budget includes predicted quantiles."""
+        history = RunHistory()
+        for elapsed in (150, 180, 212):
+            history.record("thorough", elapsed, "feature", ["backend-architect"])
+
+        budget = get_budget_for_mode(
+            "thorough", history, content_mode="feature", agents=["backend-architect"]
+        )
+
+        assert budget["budget_seconds"] == 1800
+        assert budget["predicted"]["count"] == 3
+        assert budget["predicted"]["p50"] == pytest.approx(180, rel=0.02)
+        assert "predicted" not in TimeBudget.BUDGETS["thorough"]
+
+    def test_completion_message_reports_p95(self):
+        """The completion message can cite the shape's p95."""
+        message = TimeBudget().format_completion_message(
+            "thorough", 204, agents=["backend-architect"], p95=212.4
+        )
+
+        assert message.endswith("; p95 for this shape is 212 s")
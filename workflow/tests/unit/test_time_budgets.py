@@ -7,8 +7,17 @@ Tests time budget specifications, enforcement, and reporting for:
 - thorough mode (< 1800s MAX)
 """
 
+import asyncio
+import inspect
+import json
+import multiprocessing
+import threading
+
 import pytest
 import time
+from unittest.mock import patch
+
+from workflow.time_budgets import Deadline, TimeBudget, enforce_time_budget
 
 
 @pytest.mark.unit
@@ -377,3 +386,406 @@ class TestPerformanceGuarantees:
         for mode, config in time_budgets.items():
             budget_type = config["type"]
             assert budget_type in semantics
+
+
+@pytest.mark.unit
+class TestMonotonicTiming:
+    """Test the monotonic nanosecond timing backend."""
+
+    def test_default_clock_is_monotonic_ns(self):
+        """TimeBudget times with an integer nanosecond clock by default."""
+        budget = TimeBudget()
+        budget.start("quick")
+
+        assert isinstance(budget.start_ns, int)
+        assert isinstance(budget.elapsed_ns(), int)
+        assert budget.elapsed_ns() >= 0
+
+    def test_elapsed_with_fake_clock(self, fake_clock):
+        """Elapsed time follows the injected clock exactly."""
+        budget = TimeBudget(clock=fake_clock)
+        budget.start("quick")
+
+        fake_clock.advance(0.000250)
+
+        assert budget.elapsed_ns() == 250_000
+        assert budget.elapsed() == pytest.approx(0.00025)
+
+    def test_not_started(self, fake_clock):
+        """Elapsed is zero before start."""
+        budget = TimeBudget(clock=fake_clock)
+
+        assert budget.start_time is None
+        assert budget.elapsed() == 0.0
+        assert budget.elapsed_ns() == 0
+
+    def test_wall_clock_jump_ignored(self):
+        """Wall-clock adjustments do not affect elapsed time."""
+        budget = TimeBudget()
+        with patch("time.time", return_value=0.0):
+            budget.start("quick")
+        with patch("time.time", return_value=1e9):
+            assert budget.elapsed() < 60
+
+    def test_decorator_uses_injected_clock(self, fake_clock):
+        """enforce_time_budget measures with the injected clock."""
+        @enforce_time_budget(60, clock=fake_clock)
+        def operation():
+            fake_clock.advance(60)
+            return "result"
+
+        result, elapsed, within_budget = operation()
+
+        assert result == "result"
+        assert elapsed == 60.0
+        assert within_budget is True
+
+    def test_decorator_budget_boundary_in_ns(self, fake_clock):
+        """One nanosecond over budget is reported as exceeded."""
+        @enforce_time_budget(60, clock=fake_clock)
+        def operation():
+            fake_clock.now_ns += 60 * 1_000_000_000 + 1
+
+        _, _, within_budget = operation()
+
+        assert within_budget is False
+
+    def test_decorator_preserves_metadata(self):
+        """Wrapped functions keep their name and docstring."""
+        @enforce_time_budget(60)
+        def quick_operation():
+            """Quick operation."""
+
+        assert quick_operation.__name__ == "quick_operation"
+        assert quick_operation.__doc__ == "Quick operation."
+
+
+@pytest.mark.unit
+class TestPhaseSpanTree:
+    """Test nested phase timing and span tree export."""
+
+    @pytest.fixture
+    def thorough_run(self, fake_clock):
+        """Finished thorough-mode budget with nested phases."""
+        budget = TimeBudget(clock=fake_clock)
+        budget.start("thorough")
+
+        with budget.phase("parse"):
+            fake_clock.advance(0.5)
+        with budget.phase("agents"):
+            fake_clock.advance(1)
+            with budget.phase("backend-architect"):
+                fake_clock.advance(120)
+            with budget.phase("security-specialist"):
+                fake_clock.advance(90)
+        with budget.phase("synthesis"):
+            fake_clock.advance(30)
+        fake_clock.advance(2)
+        budget.stop()
+        return budget
+
+    def test_span_tree_totals_and_self_times(self, thorough_run):
+        """Spans carry total and self time."""
+        tree = thorough_run.span_tree()
+
+        assert tree["name"] == "thorough"
+        assert tree["total_seconds"] == pytest.approx(243.5)
+        assert tree["self_seconds"] == pytest.approx(2)
+
+        agents = tree["children"][1]
+        assert agents["name"] == "agents"
+        assert agents["total_seconds"] == pytest.approx(211)
+        assert agents["self_seconds"] == pytest.approx(1)
+        assert [child["name"] for child in agents["children"]] == [
+            "backend-architect", "security-specialist"
+        ]
+
+    def test_export_json(self, thorough_run):
+        """The span tree exports as JSON."""
+        exported = json.loads(thorough_run.export_json())
+
+        assert exported["children"][0]["name"] == "parse"
+
+    def test_export_folded_stacks(self, thorough_run):
+        """Folded stacks list self time in microseconds per stack."""
+        lines = thorough_run.export_folded().splitlines()
+
+        assert "thorough 2000000" in lines
+        assert "thorough;agents;backend-architect 120000000" in lines
+        assert "thorough;synthesis 30000000" in lines
+
+    def test_phase_requires_start(self, fake_clock):
+        """Phases cannot be opened before start()."""
+        budget = TimeBudget(clock=fake_clock)
+
+        with pytest.raises(RuntimeError):
+            with budget.phase("parse"):
+                pass
+
+    def test_open_spans_measured_at_export(self, fake_clock):
+        """Unfinished phases report time up to now."""
+        budget = TimeBudget(clock=fake_clock)
+        budget.start("quick")
+
+        with budget.phase("parse"):
+            fake_clock.advance(3)
+            tree = budget.span_tree()
+
+        assert tree["children"][0]["total_seconds"] == pytest.approx(3)
+        assert tree["self_seconds"] == pytest.approx(0)
+
+
+def _spin_forever():
+    """Busy loop used to exercise hard-kill enforcement."""
+    while True:
+        pass
+
+
+def _return_answer():
+    return 42
+
+
+def _raise_value_error():
+    raise ValueError("boom")
+
+
+@enforce_time_budget(30, policy="kill", start_method="spawn")
+def _spawned_answer(value):
+    return value * 2
+
+
+@enforce_time_budget(0.5, policy="kill", start_method="spawn", on_timeout=lambda: "partial")
+def _spawned_spin():
+    while True:
+        pass
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestPreemptiveEnforcement:
+    """Test deadline enforcement that stops waiting for runaway work."""
+
+    def test_cancel_returns_at_deadline(self):
+        """The cancel policy returns at the deadline, not when work ends."""
+        @enforce_time_budget(0.1, policy="cancel")
+        def runaway():
+            time.sleep(2)
+            return "late"
+
+        start = time.perf_counter()
+        result, elapsed, within_budget = runaway()
+
+        assert time.perf_counter() - start < 1
+        assert result is None
+        assert within_budget is False
+        assert elapsed >= 0.1
+
+    def test_cancel_partial_result_callback(self):
+        """on_timeout supplies a graceful partial result."""
+        ideas = []
+
+        def partial():
+            return {"partial": True, "ideas": list(ideas)}
+
+        @enforce_time_budget(0.1, policy="cancel", on_timeout=partial)
+        def brainstorm():
+            ideas.append("Email notifications")
+            time.sleep(2)
+            ideas.append("Never reached")
+
+        result, _, within_budget = brainstorm()
+
+        assert within_budget is False
+        assert result == {"partial": True, "ideas": ["Email notifications"]}
+
+    def test_cancel_fast_call_within_budget(self):
+        """Calls that finish in time return their own result."""
+        @enforce_time_budget(5, policy="cancel")
+        def fast():
+            return "done"
+
+        assert fast()[0] == "done"
+        assert fast()[2] is True
+
+    def test_cancel_propagates_exceptions(self):
+        """Exceptions raised by the worker reach the caller."""
+        with pytest.raises(ValueError, match="boom"):
+            enforce_time_budget(5, policy="cancel")(_raise_value_error)()
+
+    def test_kill_terminates_runaway_process(self):
+        """The kill policy terminates a CPU-bound runaway call."""
+        result, _, within_budget = enforce_time_budget(
+            0.2, policy="kill", on_timeout=lambda: "partial"
+        )(_spin_forever)()
+
+        assert result == "partial"
+        assert within_budget is False
+
+    def test_kill_returns_worker_result(self):
+        """Results cross the process boundary."""
+        result, _, within_budget = enforce_time_budget(5, policy="kill")(_return_answer)()
+
+        assert result == 42
+        assert within_budget is True
+
+    def test_kill_propagates_exceptions(self):
+        """Worker exceptions are re-raised in the caller."""
+        with pytest.raises(ValueError, match="boom"):
+            enforce_time_budget(5, policy="kill")(_raise_value_error)()
+
+    def test_kill_decorated_function_under_spawn(self):
+        """Decorated module-level functions run in spawned workers."""
+        result, _, within_budget = _spawned_answer(21)
+
+        assert result == 42
+        assert within_budget is True
+
+    def test_kill_terminates_spawned_worker(self):
+        """Spawned runaway workers are terminated at the deadline."""
+        assert _spawned_spin() == ("partial", pytest.approx(0.5, abs=1.5), False)
+
+    @pytest.mark.skipif(
+        "forkserver" not in multiprocessing.get_all_start_methods(), reason="no forkserver"
+    )
+    def test_kill_undecorated_function_under_forkserver(self):
+        """Plain module-level functions are found by name in the worker."""
+        result, _, _ = enforce_time_budget(30, policy="kill", start_method="forkserver")(_return_answer)()
+
+        assert result == 42
+
+    def test_cancel_passes_deadline(self):
+        """Functions taking a deadline are asked to stop at the budget."""
+        stopped = threading.Event()
+
+        @enforce_time_budget(0.1, policy="cancel", on_timeout=lambda: "partial")
+        def cooperative(deadline):
+            while not deadline.expired():
+                time.sleep(0.01)
+            stopped.set()
+
+        assert cooperative()[0] == "partial"
+        assert stopped.wait(2)
+
+    def test_cancel_keeps_positional_deadline(self):
+        """A deadline passed positionally is not injected a second time."""
+        @enforce_time_budget(60, policy="cancel")
+        def operation(topic, deadline=None):
+            return topic, deadline
+
+        assert operation("x", None)[0] == ("x", None)
+        assert operation("x")[0][1].remaining() > 0
+
+    def test_invalid_policy(self):
+        """Unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            enforce_time_budget(60, policy="ignore")
+
+
+@pytest.mark.unit
+class TestAsyncEnforcement:
+    """Test enforce_time_budget on coroutine functions."""
+
+    def test_async_wrapper_is_coroutine_function(self):
+        """Decorating an async def yields an async def."""
+        @enforce_time_budget(60)
+        async def operation():
+            return "result"
+
+        assert inspect.iscoroutinefunction(operation)
+
+    def test_async_times_awaited_work(self, fake_clock):
+        """Elapsed time covers the awaited work, not coroutine creation."""
+        @enforce_time_budget(60, clock=fake_clock)
+        async def operation():
+            await asyncio.sleep(0)
+            fake_clock.advance(61)
+            return "result"
+
+        result, elapsed, within_budget = asyncio.run(operation())
+
+        assert result == "result"
+        assert elapsed == 61.0
+        assert within_budget is False
+
+    def test_async_cancel_at_deadline(self):
+        """The cancel policy cancels the coroutine at the deadline."""
+        cancelled = []
+
+        @enforce_time_budget(0.05, policy="cancel", on_timeout=lambda: "partial")
+        async def runaway():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        result, _, within_budget = asyncio.run(runaway())
+
+        assert result == "partial"
+        assert within_budget is False
+        assert cancelled == [True]
+
+    def test_async_awaitable_partial_result(self):
+        """on_timeout may be a coroutine function."""
+        async def partial():
+            return "async partial"
+
+        @enforce_time_budget(0.05, policy="kill", on_timeout=partial)
+        async def runaway():
+            await asyncio.sleep(5)
+
+        assert asyncio.run(runaway())[0] == "async partial"
+
+    def test_concurrent_calls_under_deadlines(self):
+        """Concurrent agent calls on one event loop each keep their deadline."""
+        @enforce_time_budget(0.5, policy="cancel")
+        async def agent(name, delay):
+            await asyncio.sleep(delay)
+            return name
+
+        async def main():
+            return await asyncio.gather(agent("fast", 0.01), agent("slow", 5))
+
+        start = time.perf_counter()
+        (fast, slow) = asyncio.run(main())
+
+        assert time.perf_counter() - start < 2
+        assert fast[0] == "fast" and fast[2] is True
+        assert slow[0] is None and slow[2] is False
+
+
+@pytest.mark.unit
+class TestDeadline:
+    """Test the deadline context shared with delegated calls."""
+
+    def test_deadline_from_time_budget(self, fake_clock):
+        """A started budget yields a deadline at start + budget."""
+        budget = TimeBudget(clock=fake_clock)
+        budget.start("quick")
+        fake_clock.advance(15)
+
+        deadline = budget.deadline()
+
+        assert deadline.remaining() == 45
+        assert not deadline.expired()
+
+    def test_deadline_requires_start(self, fake_clock):
+        """Deadlines need a started budget."""
+        with pytest.raises(RuntimeError):
+            TimeBudget(clock=fake_clock).deadline()
+
+    def test_expired_deadline(self, fake_clock):
+        """Remaining time never goes negative."""
+        deadline = Deadline.after(1, fake_clock)
+        fake_clock.advance(5)
+
+        assert deadline.expired()
+        assert deadline.remaining() == 0
+
+    def test_child_deadline_capped_by_parent(self, fake_clock):
+        """Sub-deadlines never outlive their parent."""
+        deadline = Deadline.after(60, fake_clock)
+
+        assert deadline.child(30).remaining() == 30
+        assert deadline.child(120).remaining() == 60
+        assert deadline.child().remaining() == 60
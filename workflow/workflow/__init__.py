@@ -3,39 +3,75 @@ Workflow plugin for Claude Code.
 
 Provides brainstorming and workflow automation tools with:
 - Time budget modes (quick/default/thorough)
-- Multiple output formats (terminal/json/markdown)
+- Multiple output formats (terminal/json/jsonl/markdown)
 - Agent delegation for complex analysis
 - ADHD-friendly structured outputs
 """
 
 __version__ = "2.0.0"
 
-from .mode_parser import ModeParser, parse_mode_from_command
+from .mode_parser import (
+    ModeParser,
+    ParsedCommand,
+    IncrementalParser,
+    CommandGrammar,
+    OrchestrateCommand,
+    parse_mode_from_command,
+    parse_command_line,
+    parse_many,
+    parse_stream,
+    enable_parse_cache,
+    disable_parse_cache,
+    parse_cache_stats
+)
 from .time_budgets import (
+    Deadline,
+    Span,
     TimeBudget,
     get_time_budgets,
     get_budget_for_mode,
     enforce_time_budget
 )
+from .run_history import LatencySketch, RunHistory
+from .keyword_matcher import (
+    KeywordMatcher,
+    TokenMatcher,
+    compiled_matcher,
+    clear_matcher_cache
+)
+from .result_cache import AgentResultCache
 from .format_handlers import (
     FormatHandler,
+    LineFormatter,
     TerminalFormatter,
     JSONFormatter,
+    JSONLinesFormatter,
     MarkdownFormatter,
     FormatHandlerFactory,
     format_output,
-    get_format_handler
+    write_output,
+    format_many,
+    get_format_handler,
+    json_encoder
 )
 from .agent_delegation import (
     AgentConfig,
     AgentDelegator,
+    AgentResult,
+    AgentScheduler,
+    ExecutionPlan,
+    PlannedAgent,
+    RoutingTable,
     SkillActivator,
+    routing_table,
     select_agents,
     get_available_agents,
     get_agent_selection_rules,
     get_mode_examples,
     get_auto_activating_skills
 )
+from .rule_source import RuleSource, load_rules
+from .columnar_export import flatten_results, results_table, write_columnar
 
 __all__ = [
     # Version
@@ -43,30 +79,75 @@ __all__ = [
 
     # Mode Parser
     "ModeParser",
+    "ParsedCommand",
+    "IncrementalParser",
+    "CommandGrammar",
+    "OrchestrateCommand",
     "parse_mode_from_command",
+    "parse_command_line",
+    "parse_many",
+    "parse_stream",
+    "enable_parse_cache",
+    "disable_parse_cache",
+    "parse_cache_stats",
 
     # Time Budgets
+    "Deadline",
+    "Span",
     "TimeBudget",
     "get_time_budgets",
     "get_budget_for_mode",
     "enforce_time_budget",
 
+    # Run History
+    "LatencySketch",
+    "RunHistory",
+
+    # Keyword Matcher
+    "KeywordMatcher",
+    "TokenMatcher",
+    "compiled_matcher",
+    "clear_matcher_cache",
+
+    # Result Cache
+    "AgentResultCache",
+
     # Format Handlers
     "FormatHandler",
+    "LineFormatter",
     "TerminalFormatter",
     "JSONFormatter",
+    "JSONLinesFormatter",
     "MarkdownFormatter",
     "FormatHandlerFactory",
     "format_output",
+    "write_output",
+    "format_many",
+    "json_encoder",
     "get_format_handler",
 
     # Agent Delegation
     "AgentConfig",
     "AgentDelegator",
+    "AgentResult",
+    "AgentScheduler",
+    "ExecutionPlan",
+    "PlannedAgent",
+    "RoutingTable",
     "SkillActivator",
+    "routing_table",
     "select_agents",
     "get_available_agents",
     "get_agent_selection_rules",
     "get_mode_examples",
     "get_auto_activating_skills",
+
+    # Rule Source
+    "RuleSource",
+    "load_rules",
+
+    # Columnar Export
+    "flatten_results",
+    "results_table",
+    "write_columnar",
 ]
@@ -7,11 +7,30 @@ Provides agent selection, delegation, and result synthesis for:
 - thorough mode (2-4 agents, required)
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+from types import MappingProxyType
+import heapq
+import threading
+
+from .keyword_matcher import RuleMatcher, compiled_matcher, compiled_skill_matcher
+from .result_cache import AgentResultCache
+from .time_budgets import Deadline, TimeBudget, NS_PER_SECOND
+
+# Agent call: invoke(agent_name, topic, deadline) -> agent output
+AgentInvoker = Callable[[str, str, Deadline], Any]
 
 
 class AgentConfig:
-    """Agent configuration and availability."""
+    """
+    Agent configuration and availability.
+
+    Routing tables are compiled once per table object (see
+    :func:`routing_table`), so change routing by assigning new dicts to
+    AGENTS, SELECTION_RULES or MODE_RULES. Edits made in place (e.g.,
+    ``SELECTION_RULES["auth"] = [...]``) are not detected and keep the
+    previously compiled routing.
+    """
 
     # Available agents with specializations
     AGENTS = {
@@ -44,6 +63,11 @@ class AgentConfig:
     # Agent selection rules based on topic keywords
     SELECTION_RULES = {
         "auth": ["backend-architect", "security-specialist"],
+        "authentication": ["backend-architect", "security-specialist"],
+        "authenticate": ["backend-architect", "security-specialist"],
+        "authorization": ["backend-architect", "security-specialist"],
+        "authorize": ["backend-architect", "security-specialist"],
+        "oauth": ["backend-architect", "security-specialist"],
         "database": ["backend-architect", "database-architect"],
         "UI": ["ux-ui-designer"],
         "API": ["backend-architect"],
@@ -52,6 +76,9 @@ class AgentConfig:
         "security": ["security-specialist"]
     }
 
+    # Keyword matching: "word" (word boundaries), "stem" or "substring"
+    MATCH_MODE = "word"
+
     # Mode delegation rules
     MODE_RULES = {
         "quick": {
@@ -72,67 +99,355 @@ class AgentConfig:
     }
 
 
-class AgentDelegator:
-    """Handle agent selection and delegation."""
+class RoutingTable:
+    """
+    Immutable agent routing tables compiled from one AgentConfig revision.
 
-    def __init__(self):
-        """Initialize agent delegator."""
-        self.config = AgentConfig()
+    Holds the keyword matcher, the frozen agent order used to pad
+    thorough mode, and per-mode agent limits, so selecting agents is a
+    matcher scan plus list trimming. Build through :func:`routing_table`,
+    which rebuilds only when the config's tables are replaced.
+    """
 
-    def select_agents(self, topic: str, mode: str) -> List[str]:
+    __slots__ = ("agents", "selection_rules", "mode_rules", "match_mode",
+                 "agent_order", "limits", "default_limits", "_matcher")
+
+    def __init__(self, config: Any = None):
+        """
+        Compile routing tables.
+
+        Args:
+            config: AgentConfig (class or instance) to compile from
+        """
+        config = config or AgentConfig
+        set_slot = object.__setattr__
+
+        set_slot(self, "agents", config.AGENTS)
+        set_slot(self, "selection_rules", config.SELECTION_RULES)
+        set_slot(self, "mode_rules", config.MODE_RULES)
+        set_slot(self, "match_mode", config.MATCH_MODE)
+        set_slot(self, "agent_order", tuple(config.AGENTS))
+        set_slot(self, "_matcher", compiled_matcher(config.SELECTION_RULES, config.MATCH_MODE))
+
+        # mode -> (min_agents, max_agents, pad_to_min), None when not delegating
+        limits: Dict[str, Optional[Tuple[int, Optional[int], bool]]] = {}
+        for mode, rules in config.MODE_RULES.items():
+            agents_count = rules["agents_count"]
+            if mode == "quick" or rules["delegation"] is False:
+                limits[mode] = None
+            elif isinstance(agents_count, tuple):
+                limits[mode] = (agents_count[0], agents_count[1], mode == "thorough")
+            else:
+                limits[mode] = (0, None, False)
+        set_slot(self, "limits", MappingProxyType(limits))
+        set_slot(self, "default_limits", limits.get("default"))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RoutingTable is immutable")
+
+    def is_current(self, config: Any) -> bool:
+        """
+        Check whether the table was compiled from the config's current tables.
+
+        Args:
+            config: AgentConfig (class or instance)
+
+        Returns:
+            True if no rule table was replaced since compiling (identity
+            only: in-place edits are not detected)
+        """
+        return (
+            self.agents is config.AGENTS
+            and self.selection_rules is config.SELECTION_RULES
+            and self.mode_rules is config.MODE_RULES
+            and self.match_mode == config.MATCH_MODE
+        )
+
+    def select(self, topic: str, mode: str) -> List[str]:
         """
         Select agents based on topic and mode.
 
         Args:
             topic: Brainstorm topic
-            mode: Time budget mode (quick/default/thorough)
+            mode: Time budget mode (unknown modes use "default" limits)
 
         Returns:
-            List of agent names to use
+            New list of agent names to use
         """
-        # Quick mode: no agents
-        if mode == "quick":
+        limits = self.limits.get(mode, self.default_limits)
+        if limits is None:
             return []
 
-        # Get mode rules
-        mode_config = self.config.MODE_RULES.get(mode, self.config.MODE_RULES["default"])
+        min_agents, max_agents, pad = limits
+        selected = self._matcher.matched_values(topic)
 
-        # If delegation not allowed/required, handle accordingly
-        if mode_config["delegation"] is False:
-            return []
+        # Thorough mode pads with agents in config order to its minimum
+        if pad and len(selected) < min_agents:
+            for agent in self.agent_order:
+                if agent not in selected:
+                    selected.append(agent)
+                    if len(selected) >= min_agents:
+                        break
 
-        # Find matching agents based on topic keywords
-        selected = set()
-        topic_lower = topic.lower() if topic else ""
+        if max_agents is not None and len(selected) > max_agents:
+            del selected[max_agents:]
 
-        for keyword, agents in self.config.SELECTION_RULES.items():
-            if keyword.lower() in topic_lower:
-                selected.update(agents)
+        return selected
 
-        # Convert to list
-        selected_list = list(selected)
 
-        # Enforce agent count constraints
-        agents_count = mode_config["agents_count"]
+# Routing table per config class, replaced when its rule tables change
+_routing_tables: Dict[Any, RoutingTable] = {}
 
-        if isinstance(agents_count, tuple):
-            min_agents, max_agents = agents_count
+# Held while rule tables are published, and while a stale routing table
+# is rebuilt, so readers never compile from a half-published revision
+_rules_lock = threading.RLock()
+
+
+def routing_table(config: Any = None) -> RoutingTable:
+    """
+    Get the routing table for a config, compiling it once per rule revision.
+
+    Args:
+        config: AgentConfig class or instance (default: AgentConfig)
+
+    Returns:
+        RoutingTable for the config's current tables
+    """
+    config = config or AgentConfig
+    key = config if isinstance(config, type) else type(config)
+    table = _routing_tables.get(key)
+    if table is not None and table.is_current(config):
+        return table
+
+    with _rules_lock:
+        table = _routing_tables.get(key)
+        if table is None or not table.is_current(config):
+            table = _routing_tables[key] = RoutingTable(config)
+        return table
+
+
+def install_routing_table(
+    table: RoutingTable,
+    config: Any = None,
+    updates: Optional[Dict[Tuple[type, str], Any]] = None
+) -> None:
+    """
+    Publish a routing table compiled ahead of time (e.g., by a rule reload).
+
+    The rule tables are assigned and the routing table installed as one
+    step: readers see either the previous revision or the new one.
+
+    Args:
+        table: RoutingTable compiled from the config's new tables
+        config: AgentConfig class the table belongs to (default: AgentConfig)
+        updates: (owner class, attribute) -> new table to assign with it
+            (e.g., {(AgentConfig, "SELECTION_RULES"): rules})
+    """
+    with _rules_lock:
+        for (owner, attribute), value in (updates or {}).items():
+            setattr(owner, attribute, value)
+        _routing_tables[config or AgentConfig] = table
+
+
+class AgentResult(NamedTuple):
+    """Outcome of one delegated agent call."""
+
+    agent: str
+    status: str  # "completed", "cached", "skipped", "blocked", "failed" or "timeout"
+    result: Any
+    elapsed_seconds: float
+    budget_seconds: float
+
+
+class PlannedAgent(NamedTuple):
+    """One agent's slot in an execution plan (seconds from run start)."""
+
+    agent: str
+    worker: int
+    start_seconds: float
+    duration_seconds: float
+    status: str  # "finished", "running" or "planned"
+
+
+class ExecutionPlan(NamedTuple):
+    """Agent-to-worker assignment with expected completion time."""
+
+    entries: List[PlannedAgent]
+    workers: int
+    makespan_seconds: float
+
+    @property
+    def order(self) -> List[str]:
+        """Agents in dispatch order."""
+        return [entry.agent for entry in self.entries]
+
+
+class AgentScheduler:
+    """
+    Longest-expected-first (LPT) scheduler for delegated agents.
+
+    Expected durations start at the midpoint of each agent's
+    ``typical_duration``. As agents finish, their actual durations replace
+    the estimates, and the average actual/expected ratio rescales the
+    estimates of agents that have not finished, so :meth:`plan` gives an
+    up-to-date expected completion time during a run.
+    """
+
+    def __init__(
+        self,
+        agents: List[str],
+        workers: int,
+        durations: Dict[str, Tuple[float, float]]
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            agents: Agents to run (already limited by the mode rules)
+            workers: Maximum concurrent agents
+            durations: typical_duration (min, max) seconds per agent
+        """
+        self.agents = list(agents)
+        self.workers = max(1, min(workers, len(self.agents)))
+        self.durations = durations
+        self._expected = {agent: sum(durations[agent]) / 2 for agent in self.agents}
+        # Stable sort keeps selection order between equal estimates
+        self._queue = sorted(self.agents, key=lambda agent: -self._expected[agent])
+        self._running: Dict[str, float] = {}
+        self._finished: Dict[str, Tuple[float, float]] = {}
+
+    def correction(self) -> float:
+        """
+        Get the average actual/expected duration ratio of finished agents.
+
+        Returns:
+            Ratio (1.0 until an agent with a non-zero estimate finishes)
+        """
+        ratios = [
+            elapsed / self._expected[agent]
+            for agent, (_, elapsed) in self._finished.items()
+            if self._expected[agent] > 0
+        ]
+        return sum(ratios) / len(ratios) if ratios else 1.0
+
+    def expected_duration(self, agent: str) -> float:
+        """
+        Get the current duration estimate for an agent.
+
+        Args:
+            agent: Agent name
+
+        Returns:
+            Actual seconds if finished, otherwise the corrected estimate
+        """
+        if agent in self._finished:
+            return self._finished[agent][1]
+        return self._expected[agent] * self.correction()
+
+    @property
+    def queued(self) -> int:
+        """Number of agents not yet dispatched."""
+        return len(self._queue)
+
+    def next_agent(self) -> Optional[str]:
+        """
+        Take the next agent to dispatch (longest expected first).
+
+        Returns:
+            Agent name, or None when every agent has been dispatched
+        """
+        return self._queue.pop(0) if self._queue else None
+
+    def discard(self, agent: str) -> None:
+        """
+        Drop a queued agent that no longer needs to run (e.g., cached).
 
-            # Thorough mode requires minimum agents
-            if mode == "thorough" and len(selected_list) < min_agents:
-                # Add default agents to meet minimum
-                all_agents = list(self.config.AGENTS.keys())
-                for agent in all_agents:
-                    if agent not in selected_list:
-                        selected_list.append(agent)
-                        if len(selected_list) >= min_agents:
-                            break
+        Args:
+            agent: Agent name
+        """
+        if agent in self._queue:
+            self._queue.remove(agent)
+
+    def start(self, agent: str, at_seconds: float) -> None:
+        """
+        Record that an agent started.
+
+        Args:
+            agent: Agent name
+            at_seconds: Seconds since run start
+        """
+        self._running[agent] = at_seconds
+
+    def finish(self, agent: str, elapsed: float) -> None:
+        """
+        Record an agent's actual duration.
+
+        Args:
+            agent: Agent name
+            elapsed: Seconds the agent ran (a lower bound for timeouts)
+        """
+        start = self._running.pop(agent, 0.0)
+        self._finished[agent] = (start, elapsed)
+
+    def plan(self, now_seconds: float = 0.0) -> ExecutionPlan:
+        """
+        Compute the (re-)plan for the rest of the run.
+
+        Args:
+            now_seconds: Seconds since run start
+
+        Returns:
+            ExecutionPlan covering finished, running and queued agents
+        """
+        entries = []
+        makespan = now_seconds
+
+        for agent, (start, elapsed) in self._finished.items():
+            entries.append(PlannedAgent(agent, -1, start, elapsed, "finished"))
+            makespan = max(makespan, start + elapsed)
 
-            # Limit to maximum
-            if len(selected_list) > max_agents:
-                selected_list = selected_list[:max_agents]
+        # (free_at, worker) for every worker slot
+        slots = []
+        for worker, (agent, start) in enumerate(self._running.items()):
+            duration = max(self.expected_duration(agent), now_seconds - start)
+            entries.append(PlannedAgent(agent, worker, start, duration, "running"))
+            slots.append((start + duration, worker))
+        for worker in range(len(slots), self.workers):
+            slots.append((now_seconds, worker))
+        heapq.heapify(slots)
 
-        return selected_list
+        for agent in self._queue:
+            free_at, worker = heapq.heappop(slots)
+            duration = self.expected_duration(agent)
+            entries.append(PlannedAgent(agent, worker, free_at, duration, "planned"))
+            heapq.heappush(slots, (free_at + duration, worker))
+
+        makespan = max([makespan] + [free_at for free_at, _ in slots])
+        return ExecutionPlan(entries, self.workers, makespan)
+
+
+class AgentDelegator:
+    """Handle agent selection and delegation."""
+
+    def __init__(self):
+        """Initialize agent delegator."""
+        self.config = AgentConfig()
+
+    def select_agents(self, topic: str, mode: str) -> List[str]:
+        """
+        Select agents based on topic and mode.
+
+        Routing is compiled from the config's rule tables when they are
+        replaced; tables edited in place are not picked up (see AgentConfig).
+
+        Args:
+            topic: Brainstorm topic
+            mode: Time budget mode (quick/default/thorough)
+
+        Returns:
+            List of agent names to use
+        """
+        return routing_table(self.config).select(topic, mode)
 
     def get_agent_config(self, agent_name: str) -> Dict[str, Any]:
         """
@@ -203,6 +518,282 @@ class AgentDelegator:
         else:
             return (agents_count, agents_count)
 
+    def delegate(
+        self,
+        topic: str,
+        mode: str,
+        invoke: AgentInvoker,
+        deadline: Optional[Deadline] = None,
+        cache: Optional[AgentResultCache] = None
+    ) -> List[AgentResult]:
+        """
+        Run the selected agents one after another under a shared deadline.
+
+        Each agent gets a sub-deadline of its fair share of the remaining
+        budget, at least its minimum and at most its maximum
+        ``typical_duration``. Agents that would start with less than their
+        minimum duration left are skipped, so overruns by earlier agents
+        shrink or drop later ones instead of blowing the mode budget.
+
+        Args:
+            topic: Brainstorm topic
+            mode: Time budget mode (quick/default/thorough)
+            invoke: Agent call, given (agent_name, topic, deadline)
+            deadline: Shared deadline (default: the mode's budget from now)
+            cache: Result cache; hits are returned as "cached" without
+                calling the agent, completed results are stored
+
+        Returns:
+            One AgentResult per selected agent, in selection order
+        """
+        if deadline is None:
+            budget = TimeBudget()
+            budget.start(mode)
+            deadline = budget.deadline()
+
+        agents = self.select_agents(topic, mode)
+        cached = self._cached_results(agents, topic, mode, cache)
+        to_run = len(agents) - len(cached)
+        results = []
+
+        for agent in agents:
+            if agent in cached:
+                results.append(AgentResult(agent, "cached", cached[agent], 0.0, 0.0))
+                continue
+
+            min_seconds, max_seconds = self.get_agent_config(agent).get(
+                "typical_duration", (0, None)
+            )
+            remaining = deadline.remaining()
+            share = remaining / to_run
+            to_run -= 1
+
+            if remaining <= 0 or remaining < min_seconds:
+                results.append(AgentResult(agent, "skipped", None, 0.0, 0.0))
+                continue
+
+            allowed = max(share, min_seconds)
+            if max_seconds is not None:
+                allowed = min(allowed, max_seconds)
+            agent_deadline = deadline.child(allowed)
+
+            start_ns = deadline.clock()
+            try:
+                output = invoke(agent, topic, agent_deadline)
+                status = "completed"
+            except Exception as exc:
+                output = str(exc)
+                status = "failed"
+            elapsed = (deadline.clock() - start_ns) / NS_PER_SECOND
+
+            if cache is not None and status == "completed":
+                cache.put(agent, topic, mode, output)
+            results.append(AgentResult(agent, status, output, elapsed, allowed))
+
+        return results
+
+    @staticmethod
+    def _cached_results(
+        agents: List[str],
+        topic: str,
+        mode: str,
+        cache: Optional[AgentResultCache]
+    ) -> Dict[str, Any]:
+        """Look up agents in the result cache (agent -> result for hits)."""
+        if cache is None:
+            return {}
+
+        cached = {}
+        for agent in agents:
+            hit, result = cache.lookup(agent, topic, mode)
+            if hit:
+                cached[agent] = result
+        return cached
+
+    def create_scheduler(
+        self,
+        topic: str,
+        mode: str,
+        max_workers: Optional[int] = None
+    ) -> "AgentScheduler":
+        """
+        Create a longest-expected-first scheduler for the selected agents.
+
+        Args:
+            topic: Brainstorm topic
+            mode: Time budget mode (quick/default/thorough)
+            max_workers: Maximum concurrent agents (default: all selected agents)
+
+        Returns:
+            AgentScheduler over select_agents(topic, mode), which already
+            honors MODE_RULES["agents_count"]
+        """
+        agents = self.select_agents(topic, mode)
+        durations = {
+            agent: self.get_agent_config(agent).get("typical_duration", (0, 0))
+            for agent in agents
+        }
+        return AgentScheduler(agents, max_workers or len(agents), durations)
+
+    def plan(
+        self,
+        topic: str,
+        mode: str,
+        max_workers: Optional[int] = None
+    ) -> "ExecutionPlan":
+        """
+        Compute an execution plan before running anything.
+
+        Args:
+            topic: Brainstorm topic
+            mode: Time budget mode (quick/default/thorough)
+            max_workers: Maximum concurrent agents (default: all selected agents)
+
+        Returns:
+            ExecutionPlan with worker assignments and expected completion time
+        """
+        return self.create_scheduler(topic, mode, max_workers).plan()
+
+    def run(
+        self,
+        topic: str,
+        mode: str,
+        invoke: AgentInvoker,
+        deadline: Optional[Deadline] = None,
+        max_workers: Optional[int] = None,
+        scheduler: Optional["AgentScheduler"] = None,
+        cache: Optional[AgentResultCache] = None
+    ) -> Iterator[AgentResult]:
+        """
+        Run the selected agents concurrently and stream their results.
+
+        Agents run on a bounded thread pool, so wall time is roughly the
+        slowest agent rather than the sum. They are dispatched longest
+        expected first by an AgentScheduler, which is updated with actual
+        durations as agents finish; pass your own scheduler to inspect the
+        re-planned expected completion time (``scheduler.plan(...)``) while
+        results stream in.
+
+        Each agent gets a sub-deadline of its maximum ``typical_duration``
+        (never past the shared deadline), starting when it is dispatched.
+        Agents still running at their deadline are reported as "timeout"
+        and left to finish in the background (they should honor their
+        deadline). Their pool threads stay busy until they return, so
+        queued agents wait for a free worker while the shared deadline
+        allows. Agents not dispatched by the shared deadline are "blocked"
+        if they waited on workers held by timed-out agents, otherwise
+        "skipped".
+
+        Args:
+            topic: Brainstorm topic
+            mode: Time budget mode (quick/default/thorough)
+            invoke: Agent call, given (agent_name, topic, deadline); must be thread-safe
+            deadline: Shared deadline (default: the mode's budget from now)
+            max_workers: Maximum concurrent agents (default: all selected agents)
+            scheduler: Scheduler from create_scheduler(topic, mode, max_workers)
+            cache: Result cache; hits are yielded first as "cached" and never
+                dispatched, completed results are stored
+
+        Yields:
+            AgentResult for each agent, in completion order
+        """
+        if deadline is None:
+            budget = TimeBudget()
+            budget.start(mode)
+            deadline = budget.deadline()
+
+        if scheduler is None:
+            scheduler = self.create_scheduler(topic, mode, max_workers)
+        if not scheduler.agents:
+            return
+
+        for agent, result in self._cached_results(scheduler.agents, topic, mode, cache).items():
+            scheduler.discard(agent)
+            yield AgentResult(agent, "cached", result, 0.0, 0.0)
+
+        clock = deadline.clock
+        run_start_ns = clock()
+        started: Dict[str, Tuple[int, Deadline]] = {}
+
+        def offset(now_ns: int) -> float:
+            return (now_ns - run_start_ns) / NS_PER_SECOND
+
+        def outcome(agent: str, status: str, result: Any) -> AgentResult:
+            if agent not in started:
+                return AgentResult(agent, status, result, 0.0, 0.0)
+            start_ns, agent_deadline = started[agent]
+            elapsed = (clock() - start_ns) / NS_PER_SECOND
+            allowed = (agent_deadline.expires_ns - start_ns) / NS_PER_SECOND
+            scheduler.finish(agent, elapsed)
+            return AgentResult(agent, status, result, elapsed, allowed)
+
+        executor = ThreadPoolExecutor(
+            max_workers=scheduler.workers, thread_name_prefix="agent"
+        )
+        futures: Dict[Any, str] = {}
+        pending = set()
+        abandoned = set()
+
+        def dispatch() -> None:
+            # Timed-out agents keep their pool thread until they return
+            abandoned.difference_update([future for future in abandoned if future.done()])
+            while len(pending) + len(abandoned) < scheduler.workers and not deadline.expired():
+                agent = scheduler.next_agent()
+                if agent is None:
+                    return
+                max_seconds = scheduler.durations[agent][1] or None
+                agent_deadline = deadline.child(max_seconds)
+                now_ns = clock()
+                started[agent] = (now_ns, agent_deadline)
+                scheduler.start(agent, offset(now_ns))
+                future = executor.submit(invoke, agent, topic, agent_deadline)
+                futures[future] = agent
+                pending.add(future)
+
+        starved = False
+        try:
+            dispatch()
+            while pending or (abandoned and scheduler.queued and not deadline.expired()):
+                if pending:
+                    # Wake up at the earliest running agent's deadline
+                    timeout = min(started[futures[future]][1].remaining() for future in pending)
+                    done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    # Every worker is held by a timed-out agent; wait for one to return
+                    starved = True
+                    wait(abandoned, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+                    done = ()
+
+                for future in done:
+                    pending.discard(future)
+                    agent = futures[future]
+                    try:
+                        output = future.result()
+                    except Exception as exc:
+                        yield outcome(agent, "failed", str(exc))
+                        continue
+                    if cache is not None:
+                        cache.put(agent, topic, mode, output)
+                    yield outcome(agent, "completed", output)
+
+                for future in list(pending):
+                    agent = futures[future]
+                    if started[agent][1].expired():
+                        pending.discard(future)
+                        abandoned.add(future)
+                        yield outcome(agent, "timeout", None)
+
+                dispatch()
+
+            # Shared deadline passed before these agents could start
+            status = "blocked" if starved else "skipped"
+            agent = scheduler.next_agent()
+            while agent is not None:
+                yield AgentResult(agent, status, None, 0.0, 0.0)
+                agent = scheduler.next_agent()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 
 class SkillActivator:
     """Auto-activate skills based on keywords."""
@@ -210,7 +801,10 @@ class SkillActivator:
     # Auto-activating skills
     SKILLS = {
         "backend-designer": {
-            "triggers": ["API", "database", "backend", "auth", "REST"],
+            "triggers": [
+                "API", "database", "backend", "auth", "authentication", "authenticate",
+                "authorization", "authorize", "OAuth", "REST", "RESTful"
+            ],
             "provides": ["API patterns", "database design", "auth strategies"]
         },
         "frontend-designer": {
@@ -218,11 +812,14 @@ class SkillActivator:
             "provides": ["Component patterns", "state management", "a11y checklist"]
         },
         "devops-helper": {
-            "triggers": ["deploy", "CI/CD", "Docker", "Kubernetes", "infrastructure"],
+            "triggers": ["deploy", "CI/CD", "Docker", "Dockerfile", "Kubernetes", "infrastructure"],
             "provides": ["Deployment strategies", "platform recommendations", "cost estimates"]
         }
     }
 
+    # Trigger matching: "word" (word boundaries), "stem" or "substring"
+    MATCH_MODE = "word"
+
     def should_activate(self, skill_name: str, topic: str) -> bool:
         """
         Check if skill should activate for topic.
@@ -234,18 +831,11 @@ class SkillActivator:
         Returns:
             True if skill should activate
         """
-        skill = self.SKILLS.get(skill_name)
-        if not skill:
+        skills, matcher = self._skill_rules()
+        if not skills.get(skill_name):
             return False
 
-        topic_lower = topic.lower() if topic else ""
-        triggers = skill.get("triggers", [])
-
-        for trigger in triggers:
-            if trigger.lower() in topic_lower:
-                return True
-
-        return False
+        return skill_name in matcher.matched_values(topic)
 
     def get_activated_skills(self, topic: str) -> List[str]:
         """
@@ -257,13 +847,15 @@ class SkillActivator:
         Returns:
             List of skill names
         """
-        activated = []
+        skills, matcher = self._skill_rules()
+        activated = set(matcher.matched_values(topic))
+        return [skill_name for skill_name in skills if skill_name in activated]
 
-        for skill_name in self.SKILLS:
-            if self.should_activate(skill_name, topic):
-                activated.append(skill_name)
-
-        return activated
+    def _skill_rules(self) -> Tuple[Dict[str, Dict[str, Any]], RuleMatcher]:
+        """Get SKILLS and its trigger matcher from one published revision."""
+        with _rules_lock:
+            skills, match_mode = self.SKILLS, self.MATCH_MODE
+        return skills, compiled_skill_matcher(skills, match_mode)
 
     def get_skill_config(self, skill_name: str) -> Dict[str, Any]:
         """
@@ -284,6 +876,9 @@ def select_agents(topic: str, mode: str = "default") -> List[str]:
     """
     Select agents for brainstorm.
 
+    Uses AgentConfig's compiled routing; replace its rule tables rather
+    than editing them in place (see AgentConfig).
+
     Args:
         topic: Brainstorm topic
         mode: Time budget mode (quick/default/thorough)
@@ -291,8 +886,7 @@ def select_agents(topic: str, mode: str = "default") -> List[str]:
     Returns:
         List of agent names to use
     """
-    delegator = AgentDelegator()
-    return delegator.select_agents(topic, mode)
+    return routing_table(AgentConfig).select(topic, mode)
 
 
 def get_available_agents() -> Dict[str, Dict[str, Any]]:
@@ -302,8 +896,7 @@ def get_available_agents() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary of agent configurations
     """
-    delegator = AgentDelegator()
-    return delegator.get_all_agents()
+    return AgentConfig.AGENTS
 
 
 def get_agent_selection_rules() -> Dict[str, List[str]]:
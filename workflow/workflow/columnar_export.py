@@ -0,0 +1,325 @@
+"""
+Columnar export for workflow plugin.
+
+Writes batches of results to Arrow IPC or Parquet files with typed
+columns, for analytics that scan months of runs:
+- Brainstorm results (metadata, item counts per section, agents)
+- RForge ``format_json`` results (metadata, status, raw results)
+
+Records may be result dictionaries or their serialized JSON (e.g., lines
+of a JSON Lines log). Timestamps are stored in UTC; timestamps without
+an offset (as rforge writes them) are read in ``assume_tz``, UTC unless
+given, so exports do not depend on the exporting host's time zone.
+pyarrow is optional and only imported when a table is built.
+"""
+
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+import json
+import os
+
+from .format_handlers import SECTIONS
+
+# Record kinds and file formats
+RECORD_KINDS = ("brainstorm", "rforge")
+FILE_FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+# Rows converted and written per batch
+BATCH_ROWS = 4096
+
+# Brainstorm sections counted into "<key>_count" columns
+COUNTED_SECTIONS = tuple((source, key) for source, key, kind in SECTIONS if kind != "text")
+
+Record = Union[Dict[str, Any], str, bytes]
+
+
+def _load(record: Record) -> Dict[str, Any]:
+    """Decode a serialized record (records that are not objects are empty)."""
+    if isinstance(record, (str, bytes)):
+        record = json.loads(record)
+    return _mapping(record)
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    """A nested object, or {} if it is missing, null or not an object."""
+    return value if isinstance(value, dict) else {}
+
+
+def _timestamp(value: Any, assume_tz: tzinfo) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp into UTC (naive values are in assume_tz)."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=assume_tz)
+    return parsed.astimezone(timezone.utc)
+
+
+def _number(value: Any) -> Optional[float]:
+    """Convert a duration to float (None if missing or not numeric)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _count(value: Any) -> Optional[int]:
+    """Count a section's items (0 if missing, None if not a list)."""
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple)):
+        return len(value)
+    return None
+
+
+def _agents(value: Any) -> Optional[List[str]]:
+    """Agent names as a list of strings."""
+    if not isinstance(value, (list, tuple)):
+        return None
+    return [str(agent) for agent in value]
+
+
+def _brainstorm_row(data: Dict[str, Any], assume_tz: tzinfo) -> Tuple[Any, ...]:
+    """Flatten one brainstorm result (see :func:`column_names`)."""
+    metadata = _mapping(data.get("metadata"))
+    sources = {
+        "content": _mapping(data.get("content")),
+        "recommendations": _mapping(data.get("recommendations"))
+    }
+    agents = _agents(metadata.get("agents_used"))
+    return (
+        _timestamp(metadata.get("timestamp"), assume_tz),
+        metadata.get("mode"),
+        metadata.get("time_budget"),
+        _number(metadata.get("duration_seconds")),
+        sources["content"].get("topic"),
+        *(_count(sources[source].get(key)) for source, key in COUNTED_SECTIONS),
+        agents,
+        None if agents is None else len(agents)
+    )
+
+
+def _rforge_row(data: Dict[str, Any], assume_tz: tzinfo) -> Tuple[Any, ...]:
+    """Flatten one rforge ``format_json`` result (see :func:`column_names`)."""
+    metadata = _mapping(data.get("metadata"))
+    results = data.get("results", {})
+    details = results.get("data") if isinstance(results, dict) else None
+    agents = _agents(metadata.get("agents"))
+    return (
+        _timestamp(data.get("timestamp"), assume_tz),
+        data.get("mode"),
+        results.get("title") if isinstance(results, dict) else None,
+        results.get("status") if isinstance(results, dict) else None,
+        metadata.get("package_name"),
+        metadata.get("version"),
+        _number(metadata.get("duration_seconds")),
+        agents,
+        None if agents is None else len(agents),
+        len(details) if isinstance(details, (dict, list)) else None,
+        json.dumps(results, ensure_ascii=False, separators=(",", ":"))
+    )
+
+
+# Record kind -> (column names, row function)
+_LAYOUTS = {
+    "brainstorm": (
+        ("timestamp", "mode", "time_budget", "duration_seconds", "topic")
+        + tuple(f"{key}_count" for _, key in COUNTED_SECTIONS)
+        + ("agents", "agent_count"),
+        _brainstorm_row
+    ),
+    "rforge": (
+        ("timestamp", "mode", "title", "status", "package_name", "version",
+         "duration_seconds", "agents", "agent_count", "data_count", "results"),
+        _rforge_row
+    )
+}
+
+
+def _layout(kind: str):
+    """Get (column names, row function) for a record kind."""
+    if kind not in _LAYOUTS:
+        raise ValueError(f"Invalid record kind '{kind}'. Valid kinds: {', '.join(RECORD_KINDS)}")
+    return _LAYOUTS[kind]
+
+
+def column_names(kind: str = "brainstorm") -> Tuple[str, ...]:
+    """
+    Get the exported column names.
+
+    Args:
+        kind: "brainstorm" or "rforge"
+
+    Returns:
+        Column names in file order
+
+    Raises:
+        ValueError: If kind not recognized
+    """
+    return _layout(kind)[0]
+
+
+def flatten_results(
+    records: Iterable[Record],
+    kind: str = "brainstorm",
+    assume_tz: tzinfo = timezone.utc
+) -> Dict[str, List[Any]]:
+    """
+    Flatten results into columns (no pyarrow needed).
+
+    Args:
+        records: Result dictionaries or their serialized JSON
+        kind: "brainstorm" or "rforge"
+        assume_tz: Time zone of timestamps without an offset (e.g.,
+            ZoneInfo("Europe/Berlin") for rforge results written there)
+
+    Returns:
+        Dictionary of column name -> values, one per record (None where
+        a field is missing)
+
+    Raises:
+        ValueError: If kind not recognized or a record is not valid JSON
+    """
+    names, row = _layout(kind)
+    rows = [row(_load(record), assume_tz) for record in records]
+    if not rows:
+        return {name: [] for name in names}
+    return dict(zip(names, map(list, zip(*rows))))
+
+
+def _pyarrow():
+    """Import pyarrow."""
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError("pyarrow is required for columnar export") from exc
+    return pyarrow
+
+
+def schema(kind: str = "brainstorm"):
+    """
+    Get the Arrow schema of exported files.
+
+    Args:
+        kind: "brainstorm" or "rforge"
+
+    Returns:
+        pyarrow.Schema
+
+    Raises:
+        ValueError: If kind not recognized
+        ImportError: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+    # Low-cardinality strings are dictionary-encoded
+    category = pa.dictionary(pa.int32(), pa.string())
+    types = {
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "mode": category,
+        "time_budget": category,
+        "status": category,
+        "package_name": category,
+        "version": category,
+        "duration_seconds": pa.float64(),
+        "agents": pa.list_(pa.string()),
+        "agent_count": pa.int32(),
+        "data_count": pa.int32()
+    }
+    return pa.schema([
+        (name, types.get(name, pa.int32() if name.endswith("_count") else pa.string()))
+        for name in column_names(kind)
+    ])
+
+
+def results_table(
+    records: Iterable[Record],
+    kind: str = "brainstorm",
+    assume_tz: tzinfo = timezone.utc
+):
+    """
+    Build an Arrow table from results.
+
+    Args:
+        records: Result dictionaries or their serialized JSON
+        kind: "brainstorm" or "rforge"
+        assume_tz: Time zone of timestamps without an offset
+
+    Returns:
+        pyarrow.Table with :func:`schema` columns
+
+    Raises:
+        ValueError: If kind not recognized or a record is not valid JSON
+        ImportError: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+    return pa.Table.from_pydict(flatten_results(records, kind, assume_tz), schema=schema(kind))
+
+
+def _batches(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    """Split records into lists of at most size."""
+    batch: List[Record] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_columnar(
+    records: Iterable[Record],
+    path: str,
+    kind: str = "brainstorm",
+    file_format: Optional[str] = None,
+    batch_rows: int = BATCH_ROWS,
+    assume_tz: tzinfo = timezone.utc
+) -> int:
+    """
+    Write results to an Arrow IPC or Parquet file.
+
+    Records are converted and written batch by batch, so memory stays
+    bounded for large inputs (e.g., a JSON Lines log read line by line).
+
+    Args:
+        records: Result dictionaries or their serialized JSON
+        path: Output file
+        kind: "brainstorm" or "rforge"
+        file_format: "parquet" or "arrow" (None: from the path suffix)
+        batch_rows: Rows per batch (Parquet row groups hold one batch)
+        assume_tz: Time zone of timestamps without an offset
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If kind or file format not recognized
+        ImportError: If pyarrow is not installed
+    """
+    if file_format is None:
+        file_format = FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format not in ("parquet", "arrow"):
+        raise ValueError(
+            f"Invalid columnar format '{file_format}' for {path}. "
+            f"Valid formats: parquet, arrow (suffixes: {', '.join(FILE_FORMATS)})"
+        )
+
+    pa = _pyarrow()
+    table_schema = schema(kind)
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(path, table_schema)
+    else:
+        writer = pa.ipc.new_file(path, table_schema)
+
+    rows = 0
+    try:
+        for batch in _batches(records, batch_rows):
+            table = pa.Table.from_pydict(flatten_results(batch, kind, assume_tz), schema=table_schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        writer.close()
+    return rows
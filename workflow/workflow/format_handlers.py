@@ -4,15 +4,154 @@ Format handlers for workflow plugin.
 Provides output formatting for:
 - Terminal (rich colors, emojis, ADHD-friendly)
 - JSON (automation-ready, structured)
+- JSON Lines (one compact JSON object per result, for batches and logs)
 - Markdown (documentation-ready, GitHub-compatible)
 """
 
+import inspect
 import json
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, Callable, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Lines buffered before line-based formatters yield a chunk (sections are not split)
+CHUNK_LINES = 64
+
+# Characters per chunk yielded by JSONFormatter
+CHUNK_CHARS = 8192
+
+# Compact JSON encoders, tried in order when no backend is named
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+# Backend name -> compact encoder (None if not installed)
+_json_encoders: Dict[str, Optional[Callable[[Any], str]]] = {}
+
+
+def _stdlib_compact(obj: Any) -> str:
+    """Encode compact JSON with the standard library."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _load_json_encoder(backend: str) -> Optional[Callable[[Any], str]]:
+    """Import a backend's compact encoder, or None if not installed."""
+    if backend == "json":
+        return _stdlib_compact
+    try:
+        if backend == "orjson":
+            import orjson
+            encode = orjson.dumps
+        else:
+            import msgspec
+            encode = msgspec.json.Encoder().encode
+    except ImportError:
+        return None
+
+    def encoder(obj: Any) -> str:
+        try:
+            return encode(obj).decode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            # Non-string keys, integers beyond 64 bits, etc.
+            return _stdlib_compact(obj)
+
+    return encoder
+
+
+def json_encoder(backend: Optional[str] = None) -> Tuple[str, Callable[[Any], str]]:
+    """
+    Get a compact (non-indented) JSON encoder.
+
+    Compact output is the same JSON document whichever backend encodes
+    it, but not necessarily the same bytes (e.g., float spelling).
+    Values a fast backend rejects are encoded by the standard library.
+
+    Args:
+        backend: "orjson", "msgspec", or "json" (None: fastest installed)
+
+    Returns:
+        Tuple of (backend name, function encoding a value to a string)
+
+    Raises:
+        ValueError: If backend not recognized
+        ImportError: If the named backend is not installed
+    """
+    if backend is not None and backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Invalid JSON backend '{backend}'. Valid backends: {', '.join(JSON_BACKENDS)}"
+        )
+
+    for name in (backend,) if backend else JSON_BACKENDS:
+        if name not in _json_encoders:
+            _json_encoders[name] = _load_json_encoder(name)
+        if _json_encoders[name] is not None:
+            return name, _json_encoders[name]
+
+    raise ImportError(f"{backend} is required for the '{backend}' JSON backend")
+
+
+def _join_sections(lines: List[str], sections: Iterable[Any], chunk_lines: int = CHUNK_LINES) -> Iterator[str]:
+    """
+    Stream the equivalent of "\n".join(lines) while a generator fills lines.
+
+    Args:
+        lines: List the generator appends lines to (cleared as chunks are yielded)
+        sections: Generator that pauses after each section (values ignored)
+        chunk_lines: Lines per chunk (at least; sections are not split)
+
+    Yields:
+        Chunks that concatenate to the joined lines
+    """
+    separator = ""
+    for _ in sections:
+        if len(lines) >= chunk_lines:
+            yield separator + "\n".join(lines)
+            lines.clear()
+            separator = "\n"
+    if lines:
+        yield separator + "\n".join(lines)
+
+
+def _coalesce(chunks: Iterable[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """
+    Merge many small chunks into chunks of about chunk_chars characters.
+
+    Args:
+        chunks: Small string chunks (e.g., from JSONEncoder.iterencode)
+        chunk_chars: Target characters per chunk
+
+    Yields:
+        Merged chunks
+    """
+    buffer: List[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_chars:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+# Result sections of line-based formats: (source, key, kind).
+# "items" are lists of strings or dicts, "text" is one string and
+# "steps" is a numbered checklist.
+SECTIONS = (
+    ("content", "quick_wins", "items"),
+    ("content", "medium_effort", "items"),
+    ("content", "long_term", "items"),
+    ("recommendations", "recommended_path", "text"),
+    ("recommendations", "next_steps", "steps"),
+)
 
 
 class FormatHandler:
-    """Base format handler."""
+    """
+    Base format handler.
+
+    Subclasses implement :meth:`iter_format` (streaming) or :meth:`format`;
+    the other is derived from it.
+    """
 
     def format(self, data: Dict[str, Any]) -> str:
         """
@@ -24,28 +163,94 @@ class FormatHandler:
         Returns:
             Formatted string
         """
-        raise NotImplementedError
+        if type(self).iter_format is FormatHandler.iter_format:
+            raise NotImplementedError
+        return "".join(self.iter_format(data))
 
+    def iter_format(self, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Format data for output as a stream of chunks.
+
+        Args:
+            data: Brainstorm result data
+
+        Yields:
+            Chunks that concatenate to format(data)
+        """
+        if type(self).format is FormatHandler.format:
+            raise NotImplementedError
+        yield self.format(data)
+
+    def write_to(self, data: Dict[str, Any], fp: IO[str]) -> int:
+        """
+        Stream formatted output to a text file.
+
+        Args:
+            data: Brainstorm result data
+            fp: Writable text file (e.g., sys.stdout)
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self.iter_format(data):
+            fp.write(chunk)
+            written += len(chunk)
+        return written
 
-class TerminalFormatter(FormatHandler):
-    """Terminal format with colors and emojis."""
+
+class LineFormatter(FormatHandler):
+    """
+    Base for formats rendered as text lines joined by newlines.
+
+    Subclasses implement :meth:`_render`, which appends the output lines
+    to a list and pauses after each section, so :meth:`format` builds
+    one list and :meth:`iter_format` streams whole sections.
+    """
 
     def format(self, data: Dict[str, Any]) -> str:
         """
-        Format for terminal output.
+        Format data for output.
 
         Args:
-            data: Brainstorm result with metadata, content, recommendations
+            data: Brainstorm result data
 
         Returns:
-            Terminal-formatted string with emojis and structure
+            All lines joined by newlines (no trailing newline)
+        """
+        lines: List[str] = []
+        for _ in self._render(data, lines):
+            pass
+        return "\n".join(lines)
+
+    def iter_format(self, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Format data for output as a stream of chunks.
+
+        Args:
+            data: Brainstorm result data
+
+        Yields:
+            Chunks that concatenate to format(data)
         """
-        lines = []
+        lines: List[str] = []
+        return _join_sections(lines, self._render(data, lines))
 
+    def _render(self, data: Dict[str, Any], lines: List[str]) -> Iterator[None]:
+        """Append output lines to lines, pausing after each section."""
+        raise NotImplementedError
+
+
+class TerminalFormatter(LineFormatter):
+    """Terminal format with colors and emojis."""
+
+    def _render(self, data: Dict[str, Any], lines: List[str]) -> Iterator[None]:
+        """Append terminal output lines to lines, pausing after each section."""
         # Header
         metadata = data.get("metadata", {})
         lines.append(f"⏱️  Mode: {metadata.get('mode', 'unknown')} ({metadata.get('time_budget', 'default')}) - Target: < {self._format_budget(metadata.get('time_budget', 'default'))}")
         lines.append("")
+        yield
 
         # Content sections
         content = data.get("content", {})
@@ -59,6 +264,7 @@ class TerminalFormatter(FormatHandler):
                 else:
                     lines.append(f"- {item}")
             lines.append("")
+            yield
 
         # Medium effort
         if "medium_effort" in content:
@@ -69,6 +275,7 @@ class TerminalFormatter(FormatHandler):
                 else:
                     lines.append(f"- [ ] {item}")
             lines.append("")
+            yield
 
         # Long term
         if "long_term" in content:
@@ -79,6 +286,7 @@ class TerminalFormatter(FormatHandler):
                 else:
                     lines.append(f"- {item}")
             lines.append("")
+            yield
 
         # Recommendations
         recommendations = data.get("recommendations", {})
@@ -93,6 +301,7 @@ class TerminalFormatter(FormatHandler):
             for i, step in enumerate(recommendations["next_steps"], 1):
                 lines.append(f"{i}. [ ] {step}")
             lines.append("")
+            yield
 
         # Completion message
         if "duration_seconds" in metadata:
@@ -100,8 +309,6 @@ class TerminalFormatter(FormatHandler):
             budget_mode = metadata.get("time_budget", "default")
             lines.append(f"✅ Completed in {duration}s (within {budget_mode} budget)")
 
-        return "\n".join(lines)
-
     def _format_budget(self, mode: str) -> str:
         """Format budget display string."""
         budgets = {
@@ -113,7 +320,28 @@ class TerminalFormatter(FormatHandler):
 
 
 class JSONFormatter(FormatHandler):
-    """JSON format for automation."""
+    """
+    JSON format for automation.
+
+    Pretty-printed output always comes from the standard library, so it
+    is byte-identical whatever is installed. Compact output uses the
+    fastest installed backend (see :func:`json_encoder`).
+    """
+
+    def __init__(self, compact: bool = False, backend: Optional[str] = None):
+        """
+        Initialize JSON formatter.
+
+        Args:
+            compact: Emit a single line without indentation
+            backend: Compact encoder backend (None: fastest installed)
+
+        Raises:
+            ValueError: If backend not recognized
+            ImportError: If the named backend is not installed
+        """
+        self.compact = compact
+        self.backend, self._encode = json_encoder(backend) if compact else ("json", None)
 
     def format(self, data: Dict[str, Any]) -> str:
         """
@@ -123,33 +351,127 @@ class JSONFormatter(FormatHandler):
             data: Brainstorm result with metadata, content, recommendations
 
         Returns:
-            JSON string (pretty-printed)
+            JSON string (pretty-printed, or one line if compact)
+        """
+        if self._encode is not None:
+            return self._encode(self._envelope(data))
+        return json.dumps(self._envelope(data), indent=2)
+
+    def iter_format(self, data: Dict[str, Any]) -> Iterator[str]:
         """
-        # Ensure required top-level keys exist
-        result = {
+        Format as JSON, as a stream of chunks.
+
+        Args:
+            data: Brainstorm result with metadata, content, recommendations
+
+        Yields:
+            Chunks of the JSON string
+        """
+        if self._encode is not None:
+            return iter((self.format(data),))
+        return _coalesce(json.JSONEncoder(indent=2).iterencode(self._envelope(data)))
+
+    @staticmethod
+    def _envelope(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Ensure required top-level keys exist."""
+        return {
             "metadata": data.get("metadata", {}),
             "content": data.get("content", {}),
             "recommendations": data.get("recommendations", {})
         }
 
-        return json.dumps(result, indent=2)
 
+class JSONLinesFormatter(JSONFormatter):
+    """
+    JSON Lines format for batches of results.
 
-class MarkdownFormatter(FormatHandler):
-    """Markdown format for documentation."""
+    Each result is one compact JSON object terminated by a newline, so
+    output can be appended to, tailed, split and loaded incrementally.
+    """
 
-    def format(self, data: Dict[str, Any]) -> str:
+    ENVELOPE_KEYS = ("metadata", "content", "recommendations")
+
+    def __init__(self, backend: Optional[str] = None):
         """
-        Format as GitHub-compatible markdown.
+        Initialize JSON Lines formatter.
 
         Args:
-            data: Brainstorm result with metadata, content, recommendations
+            backend: Compact encoder backend (None: fastest installed)
+
+        Raises:
+            ValueError: If backend not recognized
+            ImportError: If the named backend is not installed
+        """
+        super().__init__(compact=True, backend=backend)
+
+    def format(self, data: Union[Dict[str, Any], str, bytes]) -> str:
+        """
+        Format one result as a JSON Lines record.
+
+        Args:
+            data: Brainstorm result, or an already serialized JSON envelope
+                (str or bytes), which is passed through without re-encoding
 
         Returns:
-            Markdown string
+            Compact JSON object followed by a newline
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        if isinstance(data, str):
+            record = data.strip()
+            if "\n" in record:
+                # Pretty-printed; a record must stay on one line
+                record = self._encode(json.loads(record))
+            return record + "\n"
+
+        if tuple(data) == self.ENVELOPE_KEYS:
+            return self._encode(data) + "\n"
+        return self._encode(self._envelope(data)) + "\n"
+
+    def iter_format(self, data: Union[Dict[str, Any], str, bytes]) -> Iterator[str]:
+        """
+        Format one result as a JSON Lines record.
+
+        Args:
+            data: Brainstorm result or serialized JSON envelope
+
+        Yields:
+            The record (see :meth:`format`)
+        """
+        yield self.format(data)
+
+    def write_many(self, results: Iterable[Union[Dict[str, Any], str, bytes]], fp: IO[str]) -> int:
         """
-        lines = []
+        Stream many results to a text file, one record per line.
 
+        Records are buffered into chunks of about CHUNK_CHARS characters
+        so large batches make few write calls.
+
+        Args:
+            results: Brainstorm results or serialized JSON envelopes
+            fp: Writable text file
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+
+        def records() -> Iterator[str]:
+            nonlocal count
+            for data in results:
+                yield self.format(data)
+                count += 1
+
+        for chunk in _coalesce(records()):
+            fp.write(chunk)
+        return count
+
+
+class MarkdownFormatter(LineFormatter):
+    """Markdown format for documentation."""
+
+    def _render(self, data: Dict[str, Any], lines: List[str]) -> Iterator[None]:
+        """Append markdown output lines to lines, pausing after each section."""
         # Title (H1)
         content = data.get("content", {})
         topic = content.get("topic", "Brainstorm")
@@ -165,6 +487,7 @@ class MarkdownFormatter(FormatHandler):
         if "duration_seconds" in metadata:
             lines.append(f"**Duration:** {metadata['duration_seconds']} seconds")
         lines.append("")
+        yield
 
         # Quick Wins (H2)
         if "quick_wins" in content:
@@ -175,6 +498,7 @@ class MarkdownFormatter(FormatHandler):
                 else:
                     lines.append(f"- ⚡ {item}")
             lines.append("")
+            yield
 
         # Medium Effort (H2)
         if "medium_effort" in content:
@@ -185,6 +509,7 @@ class MarkdownFormatter(FormatHandler):
                 else:
                     lines.append(f"- [ ] {item}")
             lines.append("")
+            yield
 
         # Recommended Path (H2)
         recommendations = data.get("recommendations", {})
@@ -200,8 +525,6 @@ class MarkdownFormatter(FormatHandler):
                 lines.append(f"{i}. [ ] {step}")
             lines.append("")
 
-        return "\n".join(lines)
-
 
 class FormatHandlerFactory:
     """Factory for creating format handlers."""
@@ -209,70 +532,164 @@ class FormatHandlerFactory:
     _handlers = {
         "terminal": TerminalFormatter,
         "json": JSONFormatter,
+        "jsonl": JSONLinesFormatter,
         "markdown": MarkdownFormatter
     }
 
+    # Handler class -> names of its constructor options
+    _options: Dict[type, Tuple[str, ...]] = {}
+
+    @classmethod
+    def handler_options(cls, handler_class: type) -> Tuple[str, ...]:
+        """
+        Get the options a handler class accepts.
+
+        Args:
+            handler_class: FormatHandler subclass
+
+        Returns:
+            Constructor keyword names (e.g., ("compact", "backend") for json)
+        """
+        if handler_class not in cls._options:
+            parameters = list(inspect.signature(handler_class).parameters.values())
+            cls._options[handler_class] = tuple(
+                parameter.name for parameter in parameters
+                if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+            )
+        return cls._options[handler_class]
+
     @classmethod
-    def get_handler(cls, format_type: str) -> FormatHandler:
+    def get_handler(cls, format_type: str, **options) -> FormatHandler:
         """
         Get format handler for type.
 
+        Options are passed only to handlers that accept them, so callers
+        can give the same options for any format (e.g., compact=True is
+        used by json and ignored by terminal).
+
         Args:
-            format_type: "terminal", "json", or "markdown"
+            format_type: "terminal", "json", "jsonl", or "markdown"
+            **options: Handler options (e.g., compact=True for json)
 
         Returns:
             FormatHandler instance
 
         Raises:
-            ValueError: If format type not recognized
+            TypeError: If an option is not accepted by any format
         """
         handler_class = cls._handlers.get(format_type)
         if handler_class is None:
             # Default to terminal for unknown formats
             handler_class = cls._handlers["terminal"]
 
-        return handler_class()
+        if not options:
+            return handler_class()
+
+        valid = {name for handler in cls._handlers.values() for name in cls.handler_options(handler)}
+        unknown = sorted(set(options) - valid)
+        if unknown:
+            raise TypeError(
+                f"Invalid format option '{unknown[0]}'. Valid options: {', '.join(sorted(valid))}"
+            )
+
+        accepted = cls.handler_options(handler_class)
+        return handler_class(**{name: value for name, value in options.items() if name in accepted})
 
     @classmethod
-    def format_output(cls, data: Dict[str, Any], format_type: str = "terminal") -> str:
+    def format_output(cls, data: Dict[str, Any], format_type: str = "terminal", **options) -> str:
         """
         Format output using specified format.
 
         Args:
             data: Brainstorm result data
-            format_type: Output format (terminal/json/markdown)
+            format_type: Output format (terminal/json/jsonl/markdown)
+            **options: Handler options (e.g., compact=True for json)
 
         Returns:
             Formatted string
         """
-        handler = cls.get_handler(format_type)
+        handler = cls.get_handler(format_type, **options)
         return handler.format(data)
 
 
 # Module-level convenience functions
 
-def format_output(data: Dict[str, Any], format_type: str = "terminal") -> str:
+def format_output(data: Dict[str, Any], format_type: str = "terminal", **options) -> str:
     """
     Format brainstorm output.
 
     Args:
         data: Brainstorm result with metadata, content, recommendations
-        format_type: Output format (terminal, json, markdown)
+        format_type: Output format (terminal, json, jsonl, markdown)
+        **options: Handler options (e.g., compact=True for json)
 
     Returns:
         Formatted output string
     """
-    return FormatHandlerFactory.format_output(data, format_type)
+    return FormatHandlerFactory.format_output(data, format_type, **options)
+
+
+def write_output(data: Dict[str, Any], fp: IO[str], format_type: str = "terminal", **options) -> int:
+    """
+    Stream formatted brainstorm output to a text file.
+
+    Args:
+        data: Brainstorm result with metadata, content, recommendations
+        fp: Writable text file (e.g., sys.stdout)
+        format_type: Output format (terminal, json, jsonl, markdown)
+        **options: Handler options (e.g., compact=True for json)
+
+    Returns:
+        Number of characters written
+    """
+    return FormatHandlerFactory.get_handler(format_type, **options).write_to(data, fp)
+
+
+def format_many(
+    results: Iterable[Union[Dict[str, Any], str, bytes]],
+    fp: Union[IO[str], str],
+    append: bool = True,
+    backend: Optional[str] = None
+) -> int:
+    """
+    Write many brainstorm results as JSON Lines.
+
+    Args:
+        results: Brainstorm results, or serialized JSON envelopes that are
+            written without re-encoding (e.g., lines read from another log)
+        fp: Writable text file, or path of a log file to open
+        append: When fp is a path, add to the file instead of replacing it
+        backend: Compact encoder backend (None: fastest installed)
+
+    Returns:
+        Number of records written
+    """
+    handler = JSONLinesFormatter(backend=backend)
+    if not isinstance(fp, str):
+        return handler.write_many(results, fp)
+
+    # An interrupted writer can leave a partial last line; start a new one
+    partial = False
+    if append and os.path.exists(fp) and os.path.getsize(fp) > 0:
+        with open(fp, "rb") as existing:
+            existing.seek(-1, os.SEEK_END)
+            partial = existing.read(1) != b"\n"
+
+    with open(fp, "a" if append else "w", encoding="utf-8") as log:
+        if partial:
+            log.write("\n")
+        return handler.write_many(results, log)
 
 
-def get_format_handler(format_type: str) -> FormatHandler:
+def get_format_handler(format_type: str, **options) -> FormatHandler:
     """
     Get format handler instance.
 
     Args:
-        format_type: Format type (terminal/json/markdown)
+        format_type: Format type (terminal/json/jsonl/markdown)
+        **options: Handler options (e.g., compact=True for json)
 
     Returns:
         FormatHandler instance
     """
-    return FormatHandlerFactory.get_handler(format_type)
+    return FormatHandlerFactory.get_handler(format_type, **options)
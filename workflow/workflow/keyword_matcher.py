@@ -0,0 +1,419 @@
+"""
+Keyword matcher for workflow plugin.
+
+Finds every rule keyword contained in a topic in one pass, for:
+- Agent selection (AgentConfig.SELECTION_RULES)
+- Skill activation (SkillActivator.SKILLS triggers)
+
+Two match modes are available:
+- word: keywords match whole words (and their regular inflections) via
+  a token index, so "UI" no longer fires on "build" and "auth" no
+  longer fires on "author" ("stem" additionally stems both sides)
+- substring: keywords match anywhere, via an Aho-Corasick automaton
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Callable, Iterable, List, Mapping, Set, Tuple
+import re
+
+MATCH_MODES = ("word", "stem", "substring")
+
+# Unicode letters and digits, keeping trailing "+"/"#" ("C++", "C#");
+# trailing digits are split off ("OAuth2" -> "oauth", "2")
+_TOKEN_PATTERN = re.compile(r"[^\W_]*?[^\W\d_](?=\d+(?![^\W_]))|[^\W_]+[+#]*")
+
+# Regular inflections a whole-word keyword also matches ("API" -> "APIs")
+_WORD_FORMS = ("s", "es", "ed", "ing", "ment", "ments")
+
+# Suffixes stripped by stem(), longest first
+_SUFFIXES = (
+    "ational", "ations", "ation", "ities", "ments", "ment", "ings", "ing",
+    "ity", "ies", "ers", "ed", "er", "es", "s", "e", "y"
+)
+_MIN_STEM = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into case-folded word tokens.
+
+    Tokens are runs of Unicode letters and digits; a trailing "+" or "#"
+    is kept, so "C++" and "C#" stay distinct from "C", and trailing
+    digits become their own token, so "OAuth2" matches "OAuth".
+
+    Args:
+        text: Text to split (e.g., "CI/CD pipeline" -> ["ci", "cd", "pipeline"])
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text.casefold()) if text else []
+
+
+def word_forms(token: str) -> Tuple[str, ...]:
+    """
+    Get the word forms a keyword token matches in "word" mode.
+
+    Only regular inflections are generated; related words with other
+    endings (e.g., "auth" and "authentication") need their own keyword.
+
+    Args:
+        token: Keyword token
+
+    Returns:
+        The token followed by its inflected forms
+    """
+    if not token[-1].isalpha():
+        return (token,)
+    base = token[:-1] if token.endswith("e") else token
+    forms = [token] + [(base if suffix[0] in "ei" else token) + suffix for suffix in _WORD_FORMS]
+    return tuple(dict.fromkeys(forms))
+
+
+def stem(token: str) -> str:
+    """
+    Strip one common English suffix from a token.
+
+    Deliberately light: it only needs to map related forms onto a shared
+    prefix (e.g., "secure"/"security" -> "secur").
+
+    Args:
+        token: Lowercase token
+
+    Returns:
+        Stemmed token (unchanged if too short)
+    """
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM:
+            return token[:-len(suffix)]
+    return token
+
+
+class RuleMatcher(ABC):
+    """Base for matchers over a keyword -> values rule table."""
+
+    def __init__(self, rules: Mapping[str, Iterable[Any]]):
+        """
+        Initialize matcher.
+
+        Args:
+            rules: Mapping of keyword to the values it selects
+                (e.g., SELECTION_RULES: keyword -> agent names)
+        """
+        self.keywords: List[str] = list(rules)
+        self.values: List[Tuple[Any, ...]] = [tuple(rules[keyword]) for keyword in self.keywords]
+
+    @abstractmethod
+    def match_indices(self, text: str) -> List[int]:
+        """
+        Find which keywords occur in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Sorted indices (rule order) of matched keywords
+        """
+
+    def matched_keywords(self, text: str) -> List[str]:
+        """
+        Find which keywords occur in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matched keywords in rule order
+        """
+        return [self.keywords[index] for index in self.match_indices(text)]
+
+    def matched_values(self, text: str) -> List[Any]:
+        """
+        Collect the values selected by every matched keyword.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Unique values in rule order (first occurrence wins)
+        """
+        values = self.values
+        selected: List[Any] = []
+        for index in self.match_indices(text):
+            for value in values[index]:
+                # Selections are a handful of values; a list beats a dict here
+                if value not in selected:
+                    selected.append(value)
+        return selected
+
+
+class KeywordMatcher(RuleMatcher):
+    """Case-insensitive multi-pattern substring matcher (Aho-Corasick)."""
+
+    def __init__(self, rules: Mapping[str, Iterable[Any]]):
+        """
+        Compile rules into an automaton.
+
+        Args:
+            rules: Mapping of keyword to the values it selects
+        """
+        super().__init__(rules)
+
+        # State 0 is the root; each state has transitions, a failure link
+        # and the indices of keywords ending there (by rule order)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[Set[int]] = [set()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(index)
+
+        # Breadth-first failure links; outputs inherit from failure states
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [tuple(sorted(found)) for found in outputs]
+
+    def match_indices(self, text: str) -> List[int]:
+        """
+        Find which keywords occur in the text.
+
+        Args:
+            text: Text to scan (matched case-insensitively)
+
+        Returns:
+            Sorted indices (rule order) of matched keywords
+        """
+        if not text:
+            return []
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: Set[int] = set()
+        state = 0
+
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return sorted(found)
+
+
+class TokenMatcher(RuleMatcher):
+    """
+    Case-insensitive whole-word matcher over a token index.
+
+    Keywords are tokenized like topics; a keyword matches where its tokens
+    appear consecutively in the topic as whole words, the last one also in
+    its regular inflections (see :func:`word_forms`: "deploy" matches
+    "deployment", "CI/CD" matches "ci/cd" and "CI-CD", but "auth" matches
+    neither "author" nor "OAuth"). With stemming, stems are compared
+    instead. Each topic token costs one or two dictionary lookups.
+    """
+
+    def __init__(self, rules: Mapping[str, Iterable[Any]], stemming: bool = False):
+        """
+        Build the token index.
+
+        Args:
+            rules: Mapping of keyword to the values it selects
+            stemming: Stem keyword and topic tokens before matching
+
+        Raises:
+            ValueError: If a keyword has no word tokens (e.g., "++")
+        """
+        super().__init__(rules)
+        self.stemming = stemming
+
+        # Single-token keywords: word form -> indices; phrases indexed by
+        # first token, with the accepted forms of their last token
+        self._words: Dict[str, List[int]] = {}
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], Set[str], int]]] = {}
+
+        for index, keyword in enumerate(self.keywords):
+            tokens = self._normalize(keyword)
+            if not tokens:
+                raise ValueError(
+                    f"Invalid keyword '{keyword}'. Keywords need at least one letter or digit"
+                )
+            forms = (tokens[-1],) if stemming else word_forms(tokens[-1])
+            if len(tokens) == 1:
+                for form in forms:
+                    self._words.setdefault(form, []).append(index)
+            else:
+                self._phrases.setdefault(tokens[0], []).append((tuple(tokens[:-1]), set(forms), index))
+
+    def _normalize(self, text: str) -> List[str]:
+        """Tokenize (and optionally stem) text."""
+        tokens = tokenize(text)
+        if self.stemming:
+            return [stem(token) for token in tokens]
+        return tokens
+
+    def match_indices(self, text: str) -> List[int]:
+        """
+        Find which keywords occur in the text as whole words.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Sorted indices (rule order) of matched keywords
+        """
+        tokens = self._normalize(text)
+        if not tokens:
+            return []
+
+        words = self._words
+        phrases = self._phrases
+        found: Set[int] = set()
+
+        for position, token in enumerate(tokens):
+            hits = words.get(token)
+            if hits:
+                found.update(hits)
+
+            candidates = phrases.get(token)
+            if candidates:
+                for head, last_forms, index in candidates:
+                    end = position + len(head)
+                    if (
+                        end < len(tokens)
+                        and tuple(tokens[position:end]) == head
+                        and tokens[end] in last_forms
+                    ):
+                        found.add(index)
+
+        return sorted(found)
+
+
+def build_matcher(rules: Mapping[str, Iterable[Any]], match_mode: str = "word") -> RuleMatcher:
+    """
+    Build a matcher for a rule table.
+
+    Args:
+        rules: Mapping of keyword to the values it selects
+        match_mode: "word", "stem" (word with stemming) or "substring"
+
+    Returns:
+        RuleMatcher for the mode
+
+    Raises:
+        ValueError: If match_mode is unknown
+    """
+    if match_mode == "word":
+        return TokenMatcher(rules)
+    if match_mode == "stem":
+        return TokenMatcher(rules, stemming=True)
+    if match_mode == "substring":
+        return KeywordMatcher(rules)
+    raise ValueError(
+        f"Invalid match mode '{match_mode}'. Valid modes: {', '.join(MATCH_MODES)}"
+    )
+
+
+def skill_trigger_rules(skills: Mapping[str, Mapping[str, Any]]) -> Dict[str, List[str]]:
+    """
+    Invert a skill table into trigger -> skill names.
+
+    Args:
+        skills: Mapping of skill name to config with a "triggers" list
+
+    Returns:
+        Mapping of trigger keyword to the skills it activates (skill order)
+    """
+    rules: Dict[str, List[str]] = {}
+    for skill_name, skill in skills.items():
+        for trigger in skill.get("triggers", []):
+            rules.setdefault(trigger, []).append(skill_name)
+    return rules
+
+
+# Last compiled matcher per (table kind, mode), with the table it was
+# compiled from. One slot each bounds memory to the tables in use
+# (rule dicts cannot be weakly referenced) and identity checks on the
+# held table cannot be fooled by recycled ids.
+_compiled: Dict[Tuple[str, str], Tuple[Mapping, RuleMatcher]] = {}
+
+
+def _cached(
+    table: Mapping[str, Any],
+    kind: str,
+    match_mode: str,
+    build: Callable[[], RuleMatcher]
+) -> RuleMatcher:
+    """Return the cached matcher for a table, building it when the slot holds another."""
+    key = (kind, match_mode)
+    entry = _compiled.get(key)
+    if entry is not None and entry[0] is table:
+        return entry[1]
+
+    matcher = build()
+    _compiled[key] = (table, matcher)
+    return matcher
+
+
+def compiled_matcher(rules: Mapping[str, Iterable[Any]], match_mode: str = "word") -> RuleMatcher:
+    """
+    Get the matcher for a keyword -> values table, compiling it on first use.
+
+    The matcher is cached for the table object (the most recent table per
+    match mode), so tables are expected to be replaced rather than edited
+    in place; call :func:`clear_matcher_cache` after editing one in place.
+
+    Args:
+        rules: Rule table (e.g., SELECTION_RULES)
+        match_mode: "word", "stem" or "substring"
+
+    Returns:
+        RuleMatcher for the table
+    """
+    return _cached(rules, "rules", match_mode, lambda: build_matcher(rules, match_mode))
+
+
+def compiled_skill_matcher(
+    skills: Mapping[str, Mapping[str, Any]],
+    match_mode: str = "word"
+) -> RuleMatcher:
+    """
+    Get the trigger -> skill matcher for a skill table, compiling it on first use.
+
+    Args:
+        skills: Skill table (e.g., SkillActivator.SKILLS)
+        match_mode: "word", "stem" or "substring"
+
+    Returns:
+        RuleMatcher selecting skill names
+    """
+    return _cached(
+        skills, "skills", match_mode,
+        lambda: build_matcher(skill_trigger_rules(skills), match_mode)
+    )
+
+
+def clear_matcher_cache() -> None:
+    """Drop all compiled matchers (after editing rule tables in place)."""
+    _compiled.clear()
@@ -5,11 +5,120 @@ Parses brainstorm commands to extract:
 - Time budget mode (quick/default/thorough)
 - Content mode (feature/architecture/design/backend/frontend/devops)
 - Topic (remaining words)
-- Format (terminal/json/markdown)
+- Format (terminal/json/jsonl/markdown)
 """
 
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import islice
+from typing import (
+    Dict, Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+)
+import json
+import multiprocessing
+import os
 import re
+import sys
+import threading
+
+# Command handled by this parser
+COMMAND = "/brainstorm"
+FORMAT_FLAG = "--format"
+
+# Keyword slots used by the single-pass classifier
+_SLOT_COMMAND = 0
+_SLOT_FORMAT_FLAG = 1
+_SLOT_TIME_BUDGET = 2
+_SLOT_CONTENT = 3
+
+# Rank larger than any keyword rank
+_NO_RANK = 1 << 30
+
+# How parse_stream handles JSONL lines that are not valid JSON
+STREAM_ERRORS = ("skip", "raise")
+
+# Fields of a parsed command, in dict-view order
+PARSED_FIELDS = ("command", "time_budget_mode", "content_mode", "topic", "format")
+_PARSED_FIELD_SET = frozenset(PARSED_FIELDS)
+
+
+class ParsedCommand(Mapping):
+    """
+    Compact result of parsing a brainstorm command.
+
+    A slotted, immutable record with a read-only dict view, so
+    ``parsed["topic"]``, ``dict(parsed)`` and comparisons with plain dicts
+    keep working. Mode and format values are the interned constants from
+    :class:`ModeParser`, so millions of results share the same string objects.
+
+    It is not a ``dict`` subclass: ``json.dumps`` and other code that
+    requires a real dict needs :meth:`to_dict`.
+    """
+
+    __slots__ = PARSED_FIELDS
+
+    def __init__(
+        self,
+        command: str,
+        time_budget_mode: str,
+        content_mode: Optional[str],
+        topic: Optional[str],
+        format: str
+    ):
+        # Slot descriptors bypass the immutability guard in __setattr__
+        _set_command(self, command)
+        _set_time_budget_mode(self, time_budget_mode)
+        _set_content_mode(self, content_mode)
+        _set_topic(self, topic)
+        _set_format(self, format)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ParsedCommand is immutable (cannot set {name!r})")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ParsedCommand is immutable (cannot delete {name!r})")
+
+    def __hash__(self) -> int:
+        return hash((self.command, self.time_budget_mode, self.content_mode, self.topic, self.format))
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _PARSED_FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(PARSED_FIELDS)
+
+    def __len__(self) -> int:
+        return len(PARSED_FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in PARSED_FIELDS)
+        return f"ParsedCommand({fields})"
+
+    def __reduce__(self):
+        return (
+            ParsedCommand,
+            (self.command, self.time_budget_mode, self.content_mode, self.topic, self.format)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary.
+
+        Returns:
+            New dictionary with the five parsed fields
+        """
+        return {name: getattr(self, name) for name in PARSED_FIELDS}
+
+
+(
+    _set_command,
+    _set_time_budget_mode,
+    _set_content_mode,
+    _set_topic,
+    _set_format
+) = (ParsedCommand.__dict__[name].__set__ for name in PARSED_FIELDS)
 
 
 class ModeParser:
@@ -30,219 +139,661 @@ class ModeParser:
     ]
 
     # Output formats
-    OUTPUT_FORMATS = ["terminal", "json", "markdown"]
+    OUTPUT_FORMATS = ["terminal", "json", "jsonl", "markdown"]
     DEFAULT_FORMAT = "terminal"
 
     def __init__(self):
         """Initialize mode parser."""
-        pass
+        self._keywords = self._build_keyword_table()
+        self._formats = {
+            sys.intern(output_format): sys.intern(output_format)
+            for output_format in self.OUTPUT_FORMATS
+        }
 
-    def parse(self, command: str) -> Dict[str, Any]:
+    def parse(self, command: str) -> ParsedCommand:
         """
         Parse brainstorm command string.
 
+        Every token is classified in a single sweep against the precomputed
+        keyword table; the topic is whatever is left once the chosen modes,
+        the command and the format flag/value are excluded.
+
         Args:
             command: Command string (e.g., "/brainstorm quick feature auth --format json")
 
         Returns:
-            Dictionary with parsed components:
+            ParsedCommand with dict-style access to:
             {
                 "command": "/brainstorm",
                 "time_budget_mode": "quick" | "default" | "thorough",
                 "content_mode": "feature" | "architecture" | ... | None,
                 "topic": "extracted topic text" | None,
-                "format": "terminal" | "json" | "markdown"
+                "format": "terminal" | "json" | "jsonl" | "markdown"
             }
         """
-        if not command or not command.strip():
-            # Empty command - return defaults
+        if not command:
             return self._default_result()
 
         # Split command into parts
         parts = command.split()
+        if not parts:
+            # Whitespace-only command - return defaults
+            return self._default_result()
 
-        # Initialize result
-        result = {
-            "command": "/brainstorm",
-            "time_budget_mode": None,
-            "content_mode": None,
-            "topic": None,
-            "format": self.DEFAULT_FORMAT
-        }
+        lookup = self._keywords.get
+
+        # Lowest rank wins, so "quick" beats "thorough" wherever it appears
+        time_rank = content_rank = _NO_RANK
+        time_mode = content_mode = None
+        format_value = None
 
-        # Parse time budget mode
-        result["time_budget_mode"] = self._parse_time_budget_mode(parts)
+        topic_words = []
+        needs_filter = False
+        seen_format_flag = False
+        capture_format = False
+        skip_next = False
 
-        # Parse content mode
-        result["content_mode"] = self._parse_content_mode(parts)
+        for word in parts:
+            # Value of the first --format flag (may itself be a keyword)
+            if capture_format:
+                format_value = word
+                capture_format = False
+                needs_filter = True
+
+            entry = lookup(word)
+            if entry is not None:
+                slot, rank, value = entry
+
+                if slot == _SLOT_FORMAT_FLAG:
+                    # Skip --format flag and its value
+                    if not seen_format_flag:
+                        seen_format_flag = True
+                        capture_format = True
+                    skip_next = True
+                    continue
+
+                if slot == _SLOT_TIME_BUDGET:
+                    if rank < time_rank:
+                        time_rank = rank
+                        time_mode = value
+                elif slot == _SLOT_CONTENT:
+                    if rank < content_rank:
+                        content_rank = rank
+                        content_mode = value
+
+                # Keywords are only dropped from the topic once the winning
+                # modes are known
+                needs_filter = True
 
-        # Parse format parameter
-        result["format"] = self._parse_format(parts)
+            if skip_next:
+                skip_next = False
+                continue
 
-        # Extract topic (remaining words after removing mode keywords and format)
-        result["topic"] = self._extract_topic(parts, result)
+            topic_words.append(word)
 
-        return result
+        return self._build_result(time_mode, content_mode, format_value, topic_words, needs_filter)
 
-    def _parse_time_budget_mode(self, parts: List[str]) -> str:
+    def _build_result(
+        self,
+        time_mode: Optional[str],
+        content_mode: Optional[str],
+        format_value: Optional[str],
+        topic_words: List[str],
+        needs_filter: bool
+    ) -> ParsedCommand:
         """
-        Parse time budget mode from command parts.
+        Build the result once every token has been classified.
 
         Args:
-            parts: Command split into words
+            time_mode: Winning time budget keyword or None
+            content_mode: Winning content mode keyword or None
+            format_value: Value of the first --format flag or None
+            topic_words: Topic candidates (may still contain keywords)
+            needs_filter: Whether topic_words may contain excluded words
+
+        Returns:
+            ParsedCommand
+        """
+        if needs_filter and topic_words:
+            excluded = (COMMAND, time_mode, content_mode, format_value)
+            topic_words = [word for word in topic_words if word not in excluded]
+
+        if format_value is None:
+            format_value = self.DEFAULT_FORMAT
+        else:
+            format_value = self._formats.get(format_value, format_value)
+
+        return ParsedCommand(
+            COMMAND,
+            time_mode or self.DEFAULT_TIME_BUDGET,
+            content_mode,
+            " ".join(topic_words) if topic_words else None,
+            format_value
+        )
+
+    @classmethod
+    def _build_keyword_table(cls) -> Dict[str, Tuple[int, int, str]]:
+        """
+        Build the keyword lookup table used by :meth:`parse`.
 
         Returns:
-            "quick", "thorough", or "default"
+            Mapping of keyword to (slot, rank, canonical value)
         """
-        # Check for explicit time budget mode
-        for mode in self.TIME_BUDGET_MODES:
-            if mode in parts:
-                return mode
+        table: Dict[str, Tuple[int, int, str]] = {}
+
+        table[COMMAND] = (_SLOT_COMMAND, 0, COMMAND)
+        table[FORMAT_FLAG] = (_SLOT_FORMAT_FLAG, 0, FORMAT_FLAG)
+
+        for rank, mode in enumerate(cls.TIME_BUDGET_MODES):
+            mode = sys.intern(mode)
+            table.setdefault(mode, (_SLOT_TIME_BUDGET, rank, mode))
+
+        for rank, mode in enumerate(cls.CONTENT_MODES):
+            mode = sys.intern(mode)
+            table.setdefault(mode, (_SLOT_CONTENT, rank, mode))
 
-        # Default if not specified
-        return self.DEFAULT_TIME_BUDGET
+        return table
 
-    def _parse_content_mode(self, parts: List[str]) -> Optional[str]:
+    def _default_result(self) -> ParsedCommand:
         """
-        Parse content mode from command parts.
+        Return default parsing result for empty command.
+
+        Returns:
+            Default ParsedCommand
+        """
+        return ParsedCommand(
+            COMMAND,
+            self.DEFAULT_TIME_BUDGET,
+            None,
+            None,
+            self.DEFAULT_FORMAT
+        )
+
+    def parse_mode_from_command(self, command: str) -> ParsedCommand:
+        """
+        Convenience method matching test helper function name.
 
         Args:
-            parts: Command split into words
+            command: Command string
 
         Returns:
-            Content mode string or None if not found
+            Parsed result (dict-compatible ParsedCommand)
         """
-        # Check for explicit content mode
-        for mode in self.CONTENT_MODES:
-            if mode in parts:
-                return mode
+        return self.parse(command)
 
-        return None
+    def parse_many(self, commands: Iterable[str]) -> Iterator[ParsedCommand]:
+        """
+        Lazily parse a sequence of command strings.
 
-    def _parse_format(self, parts: List[str]) -> str:
+        Args:
+            commands: Any iterable of command strings (list, generator, file)
+
+        Yields:
+            Parsed result for each command, in input order
         """
-        Parse format parameter from command parts.
+        parse = self.parse
+        for command in commands:
+            yield parse(command)
+
+    def parse_stream(
+        self,
+        file_obj: TextIO,
+        field: Optional[str] = None,
+        errors: str = "skip"
+    ) -> Iterator[ParsedCommand]:
+        """
+        Lazily parse commands read line by line from a file object.
 
         Args:
-            parts: Command split into words
+            file_obj: Text file object (plain command log or JSONL session log)
+            field: JSONL key holding the command; None for one raw command per line
+            errors: "skip" or "raise" for JSONL lines that are not valid JSON
+                (e.g., a truncated last line of a log still being written)
+
+        Yields:
+            Parsed result for each command line (blank lines and JSONL
+            records without a string ``field`` are skipped)
+
+        Raises:
+            ValueError: If errors not recognized
+            json.JSONDecodeError: On an invalid JSONL line with errors="raise"
+        """
+        return self.parse_many(_iter_stream_commands(file_obj, field, errors))
+
+
+class IncrementalParser:
+    """
+    Keystroke-level parser for as-you-type command completion.
+
+    Keeps the classifier state after every completed token, so each
+    :meth:`update` only re-tokenizes the part of the command after the last
+    unchanged token. :meth:`result` matches ``ModeParser.parse`` on the
+    current text and :meth:`completions` lists candidates for the next slot.
+    """
+
+    # Token pattern (same splitting as str.split())
+    _TOKEN_PATTERN = re.compile(r"\S+")
+
+    # Classifier state: (time_rank, time_mode, content_rank, content_mode,
+    # format_value, seen_format_flag, capture_format, skip_next,
+    # needs_filter, topic_length)
+    _INITIAL_STATE = (_NO_RANK, None, _NO_RANK, None, None, False, False, False, False, 0)
+
+    def __init__(self, parser: Optional[ModeParser] = None):
+        """
+        Initialize incremental parser.
+
+        Args:
+            parser: ModeParser providing keyword tables (default: new parser)
+        """
+        self.parser = parser if parser is not None else ModeParser()
+        self._keywords = self.parser._keywords
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current command text."""
+        self._text = ""
+        self._partial = ""
+        self._ends: List[int] = []
+        self._states: List[tuple] = []
+        self._topic: List[str] = []
+        self._state = self._INITIAL_STATE
+
+    def update(self, text: str) -> None:
+        """
+        Update the parser with the full current command text.
+
+        Args:
+            text: Command as typed so far (e.g., after a keystroke)
+        """
+        previous = self._text
+        if text.startswith(previous):
+            common = len(previous)
+        else:
+            common = len(os.path.commonprefix((previous, text)))
+
+        # Roll back tokens whose terminating whitespace changed
+        ends = self._ends
+        keep = len(ends)
+        while keep and ends[keep - 1] >= common:
+            keep -= 1
+        if keep < len(ends):
+            del ends[keep:]
+            del self._states[keep:]
+            self._state = self._states[-1] if keep else self._INITIAL_STATE
+            del self._topic[self._state[9]:]
+
+        self._text = text
+        self._partial = ""
+
+        length = len(text)
+        step = self._step
+        for match in self._TOKEN_PATTERN.finditer(text, ends[-1] if ends else 0):
+            end = match.end()
+            if end == length:
+                # Still being typed
+                self._partial = match.group()
+                break
+            self._state = step(self._state, match.group())
+            ends.append(end)
+            self._states.append(self._state)
+
+    def result(self) -> ParsedCommand:
+        """
+        Parse result for the current text.
 
         Returns:
-            Format string ("terminal", "json", or "markdown")
-        """
-        # Look for --format parameter
-        if "--format" in parts:
-            format_index = parts.index("--format")
-            # Check if there's a value after --format
-            if format_index + 1 < len(parts):
-                format_value = parts[format_index + 1]
-                # Validate format
-                if format_value in self.OUTPUT_FORMATS:
-                    return format_value
-                else:
-                    # Invalid format - could return invalid or default
-                    # Tests expect either "invalid" or "terminal"
-                    # Let's return the value as-is (tests check both)
-                    return format_value
-
-        # Default format
-        return self.DEFAULT_FORMAT
-
-    def _extract_topic(
-        self,
-        parts: List[str],
-        parsed_result: Dict[str, Any]
-    ) -> Optional[str]:
+            Same ParsedCommand as ``ModeParser.parse(text)``
+        """
+        if not self._ends and not self._partial:
+            return self.parser._default_result()
+
+        committed = len(self._topic)
+        state = self._state
+        if self._partial:
+            state = self._step(state, self._partial)
+
+        time_mode, content_mode, format_value = state[1], state[3], state[4]
+        result = self.parser._build_result(
+            time_mode, content_mode, format_value, self._topic, state[8]
+        )
+        del self._topic[committed:]
+        return result
+
+    def completions(self) -> List[str]:
+        """
+        Possible completions for the token being typed.
+
+        Only candidates ``ModeParser.parse`` would act on are offered: time
+        budget and content modes that outrank the current one (so "quick"
+        is still offered after "thorough"), and ``--format`` until its
+        first use.
+
+        Returns:
+            Candidates for the next slot (command, time budget, content mode,
+            ``--format`` or its value) that start with the partial token
         """
-        Extract topic from command parts.
+        parser = self.parser
+        prefix = self._partial
+        state = self._state
+
+        if not self._ends:
+            candidates = [COMMAND]
+        elif state[7]:
+            # Previous token was --format
+            candidates = parser.OUTPUT_FORMATS
+        else:
+            # Lower ranks (earlier list entries) override the current mode
+            candidates = parser.TIME_BUDGET_MODES[:state[0]] + parser.CONTENT_MODES[:state[2]]
+            if not state[5]:
+                candidates.append(FORMAT_FLAG)
+
+        return [candidate for candidate in candidates if candidate.startswith(prefix)]
+
+    def _step(self, state: tuple, word: str) -> tuple:
+        """
+        Classify one token (same rules as ``ModeParser.parse``).
 
         Args:
-            parts: Command split into words
-            parsed_result: Already parsed components (to exclude from topic)
+            state: Classifier state before the token
+            word: Token
 
         Returns:
-            Topic string or None if no topic
+            Classifier state after the token (topic candidates are appended
+            to ``self._topic``)
         """
-        # Words to exclude from topic
-        exclude_words = set()
+        (time_rank, time_mode, content_rank, content_mode, format_value,
+         seen_format_flag, capture_format, skip_next, needs_filter, _) = state
 
-        # Add command itself
-        exclude_words.add("/brainstorm")
+        if capture_format:
+            format_value = word
+            capture_format = False
+            needs_filter = True
 
-        # Add time budget mode if found
-        if parsed_result["time_budget_mode"] in self.TIME_BUDGET_MODES:
-            exclude_words.add(parsed_result["time_budget_mode"])
+        entry = self._keywords.get(word)
+        if entry is not None:
+            slot, rank, value = entry
 
-        # Add content mode if found
-        if parsed_result["content_mode"]:
-            exclude_words.add(parsed_result["content_mode"])
+            if slot == _SLOT_FORMAT_FLAG:
+                if not seen_format_flag:
+                    seen_format_flag = True
+                    capture_format = True
+                return (time_rank, time_mode, content_rank, content_mode, format_value,
+                        seen_format_flag, capture_format, True, needs_filter, len(self._topic))
 
-        # Add format parameter and its value
-        if "--format" in parts:
-            exclude_words.add("--format")
-            format_index = parts.index("--format")
-            if format_index + 1 < len(parts):
-                exclude_words.add(parts[format_index + 1])
+            if slot == _SLOT_TIME_BUDGET:
+                if rank < time_rank:
+                    time_rank = rank
+                    time_mode = value
+            elif slot == _SLOT_CONTENT:
+                if rank < content_rank:
+                    content_rank = rank
+                    content_mode = value
 
-        # Extract remaining words as topic
-        topic_words = []
-        skip_next = False
+            needs_filter = True
 
-        for i, word in enumerate(parts):
-            # Skip --format flag and its value
-            if word == "--format":
-                skip_next = True
-                continue
+        if skip_next:
+            skip_next = False
+        else:
+            self._topic.append(word)
 
-            if skip_next:
-                skip_next = False
-                continue
+        return (time_rank, time_mode, content_rank, content_mode, format_value,
+                seen_format_flag, capture_format, skip_next, needs_filter, len(self._topic))
 
-            # Skip excluded words
-            if word in exclude_words:
-                continue
 
-            # Add to topic
-            topic_words.append(word)
+class OrchestrateCommand(NamedTuple):
+    """Parsed craft ``orchestrate`` command."""
 
-        # Join topic words
-        if topic_words:
-            return " ".join(topic_words)
+    command: str
+    task: Optional[str]
+    mode: Optional[str]
+    subcommand: Optional[str]
+
+
+class CommandGrammar:
+    """
+    Recognize workflow commands in arbitrary lines of text.
+
+    Covers the command family piped through chat transcripts:
+    - ``/brainstorm`` (optionally ``/workflow:brainstorm``) with ModeParser arguments
+    - craft ``orchestrate "task" [mode]`` and ``orchestrate <subcommand>``
+
+    Lines that cannot start a command are rejected by a first-character
+    check before any regex work, so plain chat lines cost constant time.
+    """
 
-        return None
+    ORCHESTRATE_MODES = ["default", "debug", "optimize", "release"]
+    DEFAULT_ORCHESTRATE_MODE = "default"
 
-    def _default_result(self) -> Dict[str, Any]:
+    # First characters that can begin a command (after optional indentation)
+    COMMAND_START_CHARS = frozenset("/o \t")
+
+    def __init__(self, parser: Optional[ModeParser] = None):
         """
-        Return default parsing result for empty command.
+        Initialize command grammar.
+
+        Args:
+            parser: ModeParser used for brainstorm arguments (default: new parser)
+        """
+        self.parser = parser if parser is not None else ModeParser()
+        modes = "|".join(re.escape(mode) for mode in self.ORCHESTRATE_MODES)
+        self._pattern = re.compile(
+            r"\s*(?:"
+            r"/(?:workflow:)?brainstorm(?:\s+(?P<args>.*?))?"
+            r"|"
+            r"/?(?:craft:)?orchestrate\s+(?:"
+            r'"(?P<task>[^"]+)"(?:\s+(?P<mode>' + modes + r"))?"
+            r"|(?P<subcommand>[\w-]+)"
+            r")"
+            r")\s*$"
+        )
+
+    def parse(self, line: str) -> Optional[Union[ParsedCommand, OrchestrateCommand]]:
+        """
+        Parse a line if it is a workflow command.
+
+        Args:
+            line: Any line of text (e.g., one line of a chat transcript)
 
         Returns:
-            Default result dictionary
+            ParsedCommand for brainstorm, OrchestrateCommand for orchestrate,
+            or None if the line is not a command
         """
-        return {
-            "command": "/brainstorm",
-            "time_budget_mode": self.DEFAULT_TIME_BUDGET,
-            "content_mode": None,
-            "topic": None,
-            "format": self.DEFAULT_FORMAT
-        }
+        if not line or line[0] not in self.COMMAND_START_CHARS:
+            return None
+
+        match = self._pattern.match(line)
+        if match is None:
+            return None
+
+        task = match.group("task")
+        if task is not None:
+            mode = match.group("mode") or self.DEFAULT_ORCHESTRATE_MODE
+            return OrchestrateCommand("orchestrate", task, mode, None)
+
+        subcommand = match.group("subcommand")
+        if subcommand is not None:
+            return OrchestrateCommand("orchestrate", None, None, subcommand)
+
+        return self.parser.parse(match.group("args") or "")
+
+
+def _iter_stream_commands(file_obj: TextIO, field: Optional[str], errors: str = "skip") -> Iterator[str]:
+    """Yield command strings from a plain or JSONL log."""
+    if errors not in STREAM_ERRORS:
+        raise ValueError(f"Invalid errors mode '{errors}'. Valid modes: {', '.join(STREAM_ERRORS)}")
+    return _stream_commands(file_obj, field, errors == "skip")
+
+
+def _stream_commands(file_obj: TextIO, field: Optional[str], skip_invalid: bool) -> Iterator[str]:
+    """Generate command strings for :func:`_iter_stream_commands`."""
+    for line in file_obj:
+        if not line.strip():
+            continue
+
+        if field is None:
+            yield line
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if skip_invalid:
+                continue
+            raise
+        command = record.get(field) if isinstance(record, dict) else None
+        if isinstance(command, str):
+            yield command
+
 
-    def parse_mode_from_command(self, command: str) -> Dict[str, Any]:
+def _chunked(items: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """Split an iterable into lists of at most ``chunksize`` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ParseCache:
+    """Bounded LRU cache of parse results keyed on the raw command string."""
+
+    def __init__(self, parse: Callable[[str], ParsedCommand], maxsize: int = 1024):
         """
-        Convenience method matching test helper function name.
+        Initialize parse cache.
 
         Args:
-            command: Command string
+            parse: Function used to parse commands on a miss
+            maxsize: Maximum number of cached commands
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size: {maxsize}. Must be >= 1")
+
+        self.maxsize = maxsize
+        self._parse = parse
+        self._entries: "OrderedDict[str, ParsedCommand]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, command: str) -> ParsedCommand:
+        """
+        Return the cached result for a command, parsing it on a miss.
+
+        Args:
+            command: Raw command string
 
         Returns:
-            Parsed result dictionary
+            Immutable ParsedCommand (safe to share between callers)
         """
-        return self.parse(command)
+        entries = self._entries
+        with self._lock:
+            result = entries.get(command)
+            if result is not None:
+                entries.move_to_end(command)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = self._parse(command)
+
+        with self._lock:
+            entries[command] = result
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size and maxsize
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+
+def _parse_chunk(chunk: List[str]) -> List[ParsedCommand]:
+    """Parse one chunk of commands (multiprocessing worker entry point)."""
+    parse = _parser.parse
+    return [parse(command) for command in chunk]
 
 
 # Module-level function for compatibility with tests
 _parser = ModeParser()
 
+_grammar = CommandGrammar(_parser)
+
+# Optional LRU cache in front of _parser (see enable_parse_cache)
+_parse_cache: Optional[ParseCache] = None
+
 
-def parse_mode_from_command(command: str) -> Dict[str, Any]:
+def _module_parse() -> Callable[[str], ParsedCommand]:
+    """Return the cached or uncached module-level parse function."""
+    cache = _parse_cache
+    return cache.get if cache is not None else _parser.parse
+
+
+def enable_parse_cache(maxsize: int = 1024) -> None:
+    """
+    Put a bounded LRU cache in front of parse_mode_from_command.
+
+    Re-enabling replaces any existing cache (and its counters).
+
+    Args:
+        maxsize: Maximum number of distinct command strings kept
+    """
+    global _parse_cache
+    _parse_cache = ParseCache(_parser.parse, maxsize)
+
+
+def disable_parse_cache() -> None:
+    """Remove the parse cache; later calls parse every command."""
+    global _parse_cache
+    _parse_cache = None
+
+
+def parse_cache_stats() -> Dict[str, Any]:
+    """
+    Get parse cache counters.
+
+    Returns:
+        Dictionary with enabled, hits, misses, evictions, size and maxsize
+    """
+    cache = _parse_cache
+    if cache is None:
+        return {
+            "enabled": False,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "size": 0,
+            "maxsize": 0
+        }
+    return {"enabled": True, **cache.stats()}
+
+
+def parse_mode_from_command(command: str) -> ParsedCommand:
     """
     Parse mode and parameters from command string.
 
@@ -253,17 +804,17 @@ def parse_mode_from_command(command: str) -> Dict[str, Any]:
         command: Command string (e.g., "/brainstorm quick feature auth")
 
     Returns:
-        Dictionary with parsed components:
+        ParsedCommand with dict-style access to:
         {
             "command": "/brainstorm",
             "time_budget_mode": "quick" | "default" | "thorough",
             "content_mode": "feature" | ... | None,
             "topic": "extracted topic" | None,
-            "format": "terminal" | "json" | "markdown"
+            "format": "terminal" | "json" | "jsonl" | "markdown"
         }
 
     Examples:
-        >>> parse_mode_from_command("/brainstorm quick feature auth")
+        >>> dict(parse_mode_from_command("/brainstorm quick feature auth"))
         {
             "command": "/brainstorm",
             "time_budget_mode": "quick",
@@ -272,7 +823,7 @@ def parse_mode_from_command(command: str) -> Dict[str, Any]:
             "format": "terminal"
         }
 
-        >>> parse_mode_from_command("/brainstorm --format json")
+        >>> dict(parse_mode_from_command("/brainstorm --format json"))
         {
             "command": "/brainstorm",
             "time_budget_mode": "default",
@@ -281,4 +832,95 @@ def parse_mode_from_command(command: str) -> Dict[str, Any]:
             "format": "json"
         }
     """
+    cache = _parse_cache
+    if cache is not None:
+        return cache.get(command)
     return _parser.parse(command)
+
+
+def parse_many(
+    commands: Iterable[str],
+    processes: Optional[int] = None,
+    chunksize: int = 10000
+) -> Iterator[ParsedCommand]:
+    """
+    Lazily parse many command strings.
+
+    Args:
+        commands: Iterable of command strings; consumed incrementally
+        processes: Number of worker processes; None parses in this process
+        chunksize: Commands sent to a worker at a time (multiprocessing only)
+
+    Yields:
+        Parsed result for each command, in input order
+
+    Examples:
+        >>> results = parse_many(["/brainstorm quick auth", "/brainstorm api"])
+        >>> [result["time_budget_mode"] for result in results]
+        ['quick', 'default']
+    """
+    if processes is None:
+        parse = _module_parse()
+        for command in commands:
+            yield parse(command)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for results in pool.imap(_parse_chunk, _chunked(commands, chunksize)):
+            yield from results
+
+
+def parse_stream(
+    file_obj: TextIO,
+    field: Optional[str] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 10000,
+    errors: str = "skip"
+) -> Iterator[ParsedCommand]:
+    """
+    Lazily parse commands from a plain log or JSONL session log.
+
+    Args:
+        file_obj: Text file object to read line by line
+        field: JSONL key holding the command; None for one raw command per line
+        processes: Number of worker processes; None parses in this process
+        chunksize: Commands sent to a worker at a time (multiprocessing only)
+        errors: "skip" or "raise" for JSONL lines that are not valid JSON
+
+    Yields:
+        Parsed result for each command line
+
+    Raises:
+        ValueError: If errors not recognized
+        json.JSONDecodeError: On an invalid JSONL line with errors="raise"
+
+    Examples:
+        >>> with open("brainstorm-log.jsonl") as log:
+        ...     for parsed in parse_stream(log, field="command"):
+        ...         print(parsed["time_budget_mode"])
+    """
+    commands = _iter_stream_commands(file_obj, field, errors)
+    return parse_many(commands, processes=processes, chunksize=chunksize)
+
+
+def parse_command_line(line: str) -> Optional[Union[ParsedCommand, OrchestrateCommand]]:
+    """
+    Parse a line of text if it is a workflow command.
+
+    Args:
+        line: Any line of text (chat transcript line, log line, ...)
+
+    Returns:
+        ParsedCommand, OrchestrateCommand, or None for non-command lines
+
+    Examples:
+        >>> parse_command_line("/brainstorm quick auth")["time_budget_mode"]
+        'quick'
+
+        >>> parse_command_line('orchestrate "add auth" optimize').mode
+        'optimize'
+
+        >>> parse_command_line("sounds good, thanks!") is None
+        True
+    """
+    return _grammar.parse(line)
@@ -0,0 +1,373 @@
+"""
+Agent result cache for workflow plugin.
+
+Caches delegated agent outputs on disk so repeated brainstorms on the
+same topic skip the agent call:
+- Content-addressed by (agent, normalized topic, mode)
+- TTL and size-based eviction (oldest first, only once over a limit)
+- Inspectable and purgeable
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from .keyword_matcher import tokenize
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".json"
+
+# Fields every entry file holds
+_ENTRY_FIELDS = ("created", "result", "key", "agent", "topic", "mode")
+
+
+def default_cache_dir() -> str:
+    """
+    Get the default cache directory.
+
+    Returns:
+        $XDG_CACHE_HOME/workflow/agent-results (~/.cache if unset)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "workflow", "agent-results")
+
+
+class AgentResultCache:
+    """
+    On-disk cache of delegated agent results.
+
+    Each entry is one JSON file named by the SHA-256 of (agent, normalized
+    topic, mode). Topics are normalized to their case-folded word tokens,
+    so "Auth flow?" and "auth  flow" share an entry while "C++ API" and
+    "C# API" do not. Topics without any word token are never cached, and
+    only JSON-serializable results are.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock=time.time
+    ):
+        """
+        Initialize agent result cache.
+
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            ttl_seconds: Entry lifetime (None for no expiry)
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of entries kept
+            clock: Wall clock in seconds (entries outlive the process)
+        """
+        self.directory = directory or default_cache_dir()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # (entries, bytes, oldest modified time) as of the last eviction
+        # scan plus this process's writes; None until the first scan
+        self._usage: Optional[Tuple[int, int, Optional[float]]] = None
+
+    @staticmethod
+    def normalize_topic(topic: str) -> str:
+        """
+        Normalize a topic for cache keys.
+
+        Args:
+            topic: Brainstorm topic
+
+        Returns:
+            Case-folded word tokens joined by single spaces (see
+            keyword_matcher.tokenize); empty if the topic has none
+        """
+        return " ".join(tokenize(topic))
+
+    @classmethod
+    def key(cls, agent: str, topic: str, mode: str) -> str:
+        """
+        Build the content address of an entry.
+
+        Args:
+            agent: Agent name
+            topic: Brainstorm topic
+            mode: Time budget mode
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        identity = json.dumps([agent, cls.normalize_topic(topic), mode])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Get the file path of an entry."""
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def _expired(self, created: float) -> bool:
+        """Check whether an entry created at the given time has expired."""
+        return self.ttl_seconds is not None and self.clock() - created > self.ttl_seconds
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read an entry file (None if missing, unreadable or not an entry)."""
+        try:
+            with open(path, "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or any(field not in entry for field in _ENTRY_FIELDS):
+            return None
+        created = entry["created"]
+        if not isinstance(created, (int, float)) or isinstance(created, bool):
+            return None
+        return entry
+
+    def lookup(self, agent: str, topic: str, mode: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            agent: Agent name
+            topic: Brainstorm topic
+            mode: Time budget mode
+
+        Returns:
+            (True, result) on a hit, (False, None) on a miss; expired
+            entries and topics without word tokens count as misses
+        """
+        if not self.normalize_topic(topic):
+            with self._lock:
+                self.misses += 1
+            return False, None
+
+        path = self._path(self.key(agent, topic, mode))
+        entry = self._read(path)
+
+        if entry is not None and self._expired(entry["created"]):
+            self._remove(path)
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+        return True, entry["result"]
+
+    def get(self, agent: str, topic: str, mode: str, default: Any = None) -> Any:
+        """
+        Get a cached result.
+
+        Args:
+            agent: Agent name
+            topic: Brainstorm topic
+            mode: Time budget mode
+            default: Returned on a miss
+
+        Returns:
+            Cached result, or default
+        """
+        hit, result = self.lookup(agent, topic, mode)
+        return result if hit else default
+
+    def put(self, agent: str, topic: str, mode: str, result: Any) -> bool:
+        """
+        Store a result, evicting once the cache may be over its limits.
+
+        The directory is only scanned (see :meth:`evict`) when the entries
+        and bytes tracked since the last scan exceed max_entries/max_bytes
+        or the oldest entry may have expired, so writes stay O(1).
+
+        Args:
+            agent: Agent name
+            topic: Brainstorm topic
+            mode: Time budget mode
+            result: Agent output
+
+        Returns:
+            True if stored, False if the result is not JSON-serializable
+            or the topic has no word tokens
+        """
+        normalized = self.normalize_topic(topic)
+        if not normalized:
+            return False
+
+        key = self.key(agent, topic, mode)
+        entry = {
+            "key": key,
+            "agent": agent,
+            "topic": normalized,
+            "mode": mode,
+            "created": self.clock(),
+            "result": result
+        }
+        try:
+            payload = json.dumps(entry)
+        except (TypeError, ValueError):
+            return False
+
+        path = self._path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                temp_file.write(payload)
+            size = os.path.getsize(temp_path)
+            # Modification time doubles as creation time for eviction
+            os.utime(temp_path, (entry["created"], entry["created"]))
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = None
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        if self._track_write(size, replaced, entry["created"]):
+            self.evict()
+        return True
+
+    def _track_write(self, size: int, replaced: Optional[int], created: float) -> bool:
+        """Account for a written entry; True if an eviction scan is due."""
+        with self._lock:
+            if self._usage is None:
+                return True
+            count, total_bytes, oldest = self._usage
+            if replaced is None:
+                count += 1
+            else:
+                total_bytes -= replaced
+            total_bytes += size
+            if oldest is None:
+                oldest = created
+            self._usage = (count, total_bytes, oldest)
+        return count > self.max_entries or total_bytes > self.max_bytes or self._expired(oldest)
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """List (modified time, size, path) of entries, oldest first."""
+        try:
+            scanned = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(_ENTRY_SUFFIX)
+            ]
+        except FileNotFoundError:
+            return []
+        return sorted(scanned)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Remove an entry file (False if already gone)."""
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then the oldest beyond max_entries/max_bytes.
+
+        Entry age is taken from file modification time, which put() sets
+        to the creation time.
+
+        Returns:
+            Number of entries removed
+        """
+        scanned = self._scan()
+        total_bytes = sum(size for _, size, _ in scanned)
+        count = len(scanned)
+        removed = 0
+        oldest = None
+
+        for modified, size, path in scanned:
+            if not (self._expired(modified) or count > self.max_entries or total_bytes > self.max_bytes):
+                oldest = modified
+                break
+            removed += self._remove(path)
+            count -= 1
+            total_bytes -= size
+
+        with self._lock:
+            self._usage = (count, total_bytes, oldest)
+        return removed
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Describe cached entries, oldest first (without their results).
+
+        Returns:
+            List of dictionaries with key, agent, topic, mode,
+            age_seconds, size_bytes and expired
+        """
+        described = []
+        for _, size, path in self._scan():
+            entry = self._read(path)
+            if entry is None:
+                continue
+            described.append({
+                "key": entry["key"],
+                "agent": entry["agent"],
+                "topic": entry["topic"],
+                "mode": entry["mode"],
+                "age_seconds": self.clock() - entry["created"],
+                "size_bytes": size,
+                "expired": self._expired(entry["created"])
+            })
+        return described
+
+    def purge(
+        self,
+        agent: Optional[str] = None,
+        mode: Optional[str] = None,
+        expired_only: bool = False
+    ) -> int:
+        """
+        Remove entries.
+
+        Args:
+            agent: Only entries of this agent (None for any)
+            mode: Only entries of this mode (None for any)
+            expired_only: Only expired entries
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for entry in self.entries():
+            if agent is not None and entry["agent"] != agent:
+                continue
+            if mode is not None and entry["mode"] != mode:
+                continue
+            if expired_only and not entry["expired"]:
+                continue
+            removed += self._remove(self._path(entry["key"]))
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses (this process), entries and bytes
+        """
+        scanned = self._scan()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(scanned),
+                "bytes": sum(size for _, size, _ in scanned)
+            }
@@ -0,0 +1,298 @@
+"""
+Rule source for workflow plugin.
+
+Loads agent and skill rules from a JSON or YAML file instead of the
+built-in tables:
+- AgentConfig.AGENTS and AgentConfig.SELECTION_RULES
+- SkillActivator.SKILLS
+- Optional match mode for both
+
+Reloads are mtime-watched and atomic: new routing tables and matchers
+are compiled before the swap, and the new tables are published in one
+step, so in-flight selections keep using the previous (immutable)
+tables and never see a mix of two revisions. A file without
+match_mode uses "word".
+"""
+
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, Tuple
+import json
+import os
+import threading
+
+from .agent_delegation import AgentConfig, RoutingTable, SkillActivator, install_routing_table
+from .keyword_matcher import MATCH_MODES, compiled_skill_matcher
+
+# File section -> (owner class, attribute)
+SECTIONS = {
+    "agents": (AgentConfig, "AGENTS"),
+    "selection_rules": (AgentConfig, "SELECTION_RULES"),
+    "skills": (SkillActivator, "SKILLS")
+}
+
+# Match mode used when a file does not set one
+DEFAULT_MATCH_MODE = "word"
+
+
+def _mapping(value: Any, where: str) -> Dict[str, Any]:
+    """Check that a rules value is a mapping with string keys."""
+    if not isinstance(value, dict) or not all(isinstance(key, str) for key in value):
+        raise ValueError(f"Invalid {where}: expected a mapping of names, got {type(value).__name__}")
+    return value
+
+
+def _strings(value: Any, where: str) -> list:
+    """Check that a rules value is a list of strings."""
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"Invalid {where}: expected a list of strings, got {value!r}")
+    return value
+
+
+def _duration(value: Any, where: str) -> Tuple[float, float]:
+    """Check that a rules value is a (min, max) pair of seconds."""
+    if (
+        not isinstance(value, list)
+        or len(value) != 2
+        or not all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in value)
+    ):
+        raise ValueError(f"Invalid {where}: expected [min, max] seconds, got {value!r}")
+    return tuple(value)
+
+
+def parse_rules(text: str, path: str) -> Dict[str, Any]:
+    """
+    Parse and validate a rules document.
+
+    Args:
+        text: File contents
+        path: File path (".yaml"/".yml" parse as YAML, anything else as JSON)
+
+    Returns:
+        Dictionary with any of agents, selection_rules, skills, match_mode
+
+    Raises:
+        ValueError: If the document is malformed (including sections of the
+            wrong type) or references unknown agents
+        ImportError: If a YAML file is given and PyYAML is not installed
+    """
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ImportError("PyYAML is required to load YAML rule files") from exc
+        try:
+            rules = yaml.safe_load(text) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Invalid rules file {path}: {exc}") from exc
+    else:
+        try:
+            rules = json.loads(text)
+        except ValueError as exc:
+            raise ValueError(f"Invalid rules file {path}: {exc}") from exc
+
+    if not isinstance(rules, dict):
+        raise ValueError(f"Invalid rules file {path}: expected a mapping at top level")
+
+    unknown = set(rules) - set(SECTIONS) - {"match_mode"}
+    if unknown:
+        raise ValueError(
+            f"Invalid rules section '{sorted(unknown)[0]}'. "
+            f"Valid sections: {', '.join(list(SECTIONS) + ['match_mode'])}"
+        )
+
+    match_mode = rules.get("match_mode")
+    if match_mode is not None and (not isinstance(match_mode, str) or match_mode not in MATCH_MODES):
+        raise ValueError(
+            f"Invalid match mode '{match_mode}'. Valid modes: {', '.join(MATCH_MODES)}"
+        )
+
+    if "agents" in rules:
+        # JSON/YAML have no tuples; durations are (min, max) pairs
+        rules["agents"] = {
+            agent: {
+                **_mapping(config, f"agent '{agent}'"),
+                "typical_duration": _duration(
+                    config.get("typical_duration", [0, 0]), f"typical_duration of agent '{agent}'"
+                )
+            }
+            for agent, config in _mapping(rules["agents"], "agents section").items()
+        }
+
+    if "skills" in rules:
+        for skill, config in _mapping(rules["skills"], "skills section").items():
+            _strings(_mapping(config, f"skill '{skill}'").get("triggers", []), f"triggers of skill '{skill}'")
+
+    known_agents = rules.get("agents", AgentConfig.AGENTS)
+    for keyword, agents in _mapping(rules.get("selection_rules", {}), "selection_rules section").items():
+        for agent in _strings(agents, f"selection rule '{keyword}'"):
+            if agent not in known_agents:
+                raise ValueError(f"Unknown agent '{agent}' in selection rule '{keyword}'")
+
+    return rules
+
+
+class RuleSource:
+    """
+    Hot-reloadable rules file for AgentConfig and SkillActivator.
+
+    Sections missing from the file keep their current tables. Sections
+    whose contents did not change keep their current table objects, so
+    their compiled matchers are reused.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize rule source (nothing is loaded until :meth:`reload`).
+
+        Args:
+            path: JSON or YAML rules file
+        """
+        self.path = path
+        self.revision = 0
+        self.last_error: Optional[Exception] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Tuple[int, int]:
+        """Get the (mtime_ns, size) signature of the file."""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed(self) -> bool:
+        """
+        Check whether the file changed since the last load.
+
+        Returns:
+            True if the modification time or size differs
+        """
+        try:
+            return self._stat() != self._signature
+        except FileNotFoundError:
+            return False
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Load the file and swap in its rules if it changed.
+
+        Args:
+            force: Reload even if the file signature is unchanged
+
+        Returns:
+            True if any rule table was replaced
+
+        Raises:
+            ValueError: If the file is malformed (current rules are kept)
+            OSError: If the file cannot be read
+        """
+        with self._lock:
+            signature = self._stat()
+            if not force and signature == self._signature:
+                return False
+
+            with open(self.path, "r", encoding="utf-8") as rules_file:
+                rules = parse_rules(rules_file.read(), self.path)
+            self._signature = signature
+
+            return self._install(rules)
+
+    def _install(self, rules: Dict[str, Any]) -> bool:
+        """Compile the new tables, then swap them in."""
+        updates = {}
+        for section, (owner, attribute) in SECTIONS.items():
+            if section in rules and rules[section] != getattr(owner, attribute):
+                updates[(owner, attribute)] = rules[section]
+
+        match_mode = rules.get("match_mode", DEFAULT_MATCH_MODE)
+        mode_changed = (
+            match_mode != AgentConfig.MATCH_MODE or match_mode != SkillActivator.MATCH_MODE
+        )
+        if not updates and not mode_changed:
+            return False
+
+        def current(owner, attribute):
+            return updates.get((owner, attribute), getattr(owner, attribute))
+
+        # Compile everything before publishing anything
+        snapshot = SimpleNamespace(
+            AGENTS=current(AgentConfig, "AGENTS"),
+            SELECTION_RULES=current(AgentConfig, "SELECTION_RULES"),
+            MODE_RULES=AgentConfig.MODE_RULES,
+            MATCH_MODE=match_mode
+        )
+        table = RoutingTable(snapshot)
+        compiled_skill_matcher(current(SkillActivator, "SKILLS"), match_mode)
+
+        updates[(AgentConfig, "MATCH_MODE")] = match_mode
+        updates[(SkillActivator, "MATCH_MODE")] = match_mode
+        install_routing_table(table, updates=updates)
+
+        self.revision += 1
+        return True
+
+    def poll(self) -> bool:
+        """
+        Reload if the file changed, recording errors instead of raising.
+
+        Returns:
+            True if any rule table was replaced
+        """
+        if not self.changed():
+            return False
+        try:
+            replaced = self.reload()
+        except (OSError, ValueError, ImportError) as exc:
+            self.last_error = exc
+            return False
+        self.last_error = None
+        return replaced
+
+    def watch(self, interval: float = 2.0) -> None:
+        """
+        Poll the file for changes on a background thread.
+
+        Args:
+            interval: Seconds between checks
+
+        Raises:
+            RuntimeError: If already watching
+        """
+        if self._thread is not None:
+            raise RuntimeError("RuleSource is already watching; call stop() first")
+
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                self.poll()
+
+        self._thread = threading.Thread(target=loop, name="rule-source", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching the file."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+def load_rules(path: str, watch: bool = False, interval: float = 2.0) -> RuleSource:
+    """
+    Load rules from a file, optionally watching it for changes.
+
+    Args:
+        path: JSON or YAML rules file
+        watch: Reload automatically when the file changes
+        interval: Seconds between checks when watching
+
+    Returns:
+        RuleSource for the file
+    """
+    source = RuleSource(path)
+    source.reload(force=True)
+    if watch:
+        source.watch(interval)
+    return source
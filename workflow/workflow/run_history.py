@@ -0,0 +1,319 @@
+"""
+Run history for workflow plugin.
+
+Keeps latency statistics of past brainstorm runs for capacity planning:
+- Streaming quantile sketches (p50/p95/p99) of elapsed time
+- Keyed by run shape (mode, content mode, agent set)
+- Bounded in memory and persisted as JSON
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+import json
+import math
+import os
+import tempfile
+import threading
+
+
+class LatencySketch:
+    """
+    Mergeable streaming quantile sketch with bounded relative error.
+
+    Values fall into logarithmic buckets (gamma = (1 + a) / (1 - a)), so any
+    quantile is estimated within relative accuracy ``a`` using a fixed,
+    small number of counters regardless of how many runs were recorded.
+    """
+
+    # Values at or below this many seconds share one bucket
+    MIN_VALUE = 1e-3
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 512):
+        """
+        Initialize latency sketch.
+
+        Args:
+            relative_accuracy: Relative error bound for quantiles (0 < a < 1)
+            max_buckets: Maximum number of buckets (lowest buckets collapse)
+
+        Raises:
+            ValueError: If relative_accuracy is out of range
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"Invalid relative accuracy: {relative_accuracy}. Must be between 0 and 1"
+            )
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """
+        Record one elapsed time.
+
+        Args:
+            value: Elapsed seconds
+        """
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if value <= self.MIN_VALUE:
+            self.zero_count += 1
+            return
+
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+        if len(self.buckets) > self.max_buckets:
+            self._collapse_lowest()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1] (e.g., 0.95)
+
+        Returns:
+            Estimated seconds, or None if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get count, mean and p50/p95/p99.
+
+        Returns:
+            Summary dictionary (quantiles None if empty)
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99)
+        }
+
+    def _collapse_lowest(self) -> None:
+        """Merge the two lowest buckets to respect max_buckets."""
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-ready dictionary.
+
+        Returns:
+            Serializable sketch state
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        """
+        Restore a sketch from :meth:`to_dict` output.
+
+        Args:
+            data: Serialized sketch state
+
+        Returns:
+            LatencySketch
+        """
+        sketch = cls(data["relative_accuracy"], data["max_buckets"])
+        sketch.buckets = {int(key): count for key, count in data["buckets"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.total = data["total"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        return sketch
+
+
+class RunHistory:
+    """
+    Persistent, bounded latency history of brainstorm runs.
+
+    One sketch is kept per run shape (mode, content mode, agent set) and
+    one per mode across all shapes. The least recently recorded shapes are
+    dropped beyond ``max_shapes``.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_shapes: int = 256):
+        """
+        Initialize run history, loading it from path if the file exists.
+
+        Args:
+            path: JSON file used by :meth:`save` (None for in-memory only)
+            max_shapes: Maximum number of run shapes kept
+        """
+        self.path = path
+        self.max_shapes = max_shapes
+        self._shapes: "OrderedDict[str, LatencySketch]" = OrderedDict()
+        self._modes: Dict[str, LatencySketch] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def shape_key(
+        mode: str,
+        content_mode: Optional[str] = None,
+        agents: Iterable[str] = ()
+    ) -> str:
+        """
+        Build the key for a run shape.
+
+        Args:
+            mode: Time budget mode
+            content_mode: Content mode (or None)
+            agents: Agents used (order does not matter)
+
+        Returns:
+            Key string "mode|content_mode|agent,agent"
+        """
+        return f"{mode}|{content_mode or ''}|{','.join(sorted(agents))}"
+
+    def record(
+        self,
+        mode: str,
+        elapsed: float,
+        content_mode: Optional[str] = None,
+        agents: Iterable[str] = ()
+    ) -> None:
+        """
+        Record the elapsed time of one run.
+
+        Args:
+            mode: Time budget mode
+            elapsed: Elapsed seconds
+            content_mode: Content mode (or None)
+            agents: Agents used
+        """
+        key = self.shape_key(mode, content_mode, agents)
+
+        with self._lock:
+            sketch = self._shapes.get(key)
+            if sketch is None:
+                sketch = self._shapes[key] = LatencySketch()
+            else:
+                self._shapes.move_to_end(key)
+            sketch.add(elapsed)
+
+            self._modes.setdefault(mode, LatencySketch()).add(elapsed)
+
+            while len(self._shapes) > self.max_shapes:
+                self._shapes.popitem(last=False)
+
+    def summary(
+        self,
+        mode: str,
+        content_mode: Optional[str] = None,
+        agents: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get latency statistics for a run shape.
+
+        Args:
+            mode: Time budget mode
+            content_mode: Content mode (or None)
+            agents: Agents used; None for statistics across the whole mode
+
+        Returns:
+            Dictionary with count, mean, p50, p95, p99 and shape, or None
+            if no run of that shape was recorded
+        """
+        with self._lock:
+            if agents is None and content_mode is None:
+                sketch = self._modes.get(mode)
+                shape = mode
+            else:
+                shape = self.shape_key(mode, content_mode, agents or ())
+                sketch = self._shapes.get(shape)
+
+            if sketch is None:
+                return None
+            return {"shape": shape, **sketch.summary()}
+
+    def shapes(self) -> Tuple[str, ...]:
+        """
+        Get recorded run shapes, least recently recorded first.
+
+        Returns:
+            Tuple of shape keys
+        """
+        with self._lock:
+            return tuple(self._shapes)
+
+    def load(self) -> None:
+        """Replace in-memory history with the contents of self.path."""
+        with open(self.path, "r", encoding="utf-8") as history_file:
+            data = json.load(history_file)
+
+        with self._lock:
+            self._shapes = OrderedDict(
+                (key, LatencySketch.from_dict(sketch)) for key, sketch in data["shapes"].items()
+            )
+            self._modes = {
+                mode: LatencySketch.from_dict(sketch) for mode, sketch in data["modes"].items()
+            }
+
+    def save(self) -> None:
+        """
+        Atomically write history to self.path.
+
+        Raises:
+            ValueError: If the history has no path
+        """
+        if self.path is None:
+            raise ValueError("RunHistory has no path to save to")
+
+        with self._lock:
+            data = {
+                "shapes": {key: sketch.to_dict() for key, sketch in self._shapes.items()},
+                "modes": {mode: sketch.to_dict() for mode, sketch in self._modes.items()}
+            }
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                json.dump(data, temp_file)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -7,9 +7,185 @@ Provides time budget specifications, enforcement, and reporting for:
 - thorough mode (< 1800s MAX)
 """
 
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Callable, Iterator, List, Optional, Tuple
+import asyncio
+import functools
+import importlib
+import inspect
+import json
+import multiprocessing
+import threading
 import time
 
+if TYPE_CHECKING:
+    from .run_history import RunHistory
+
+# Nanoseconds per second
+NS_PER_SECOND = 1_000_000_000
+
+# Default clock: monotonic, high resolution, integer nanoseconds.
+# Unlike time.time() it never jumps when NTP adjusts the wall clock.
+DEFAULT_CLOCK: Callable[[], int] = time.perf_counter_ns
+
+
+class Span:
+    """Named timing span in a phase tree (times in clock nanoseconds)."""
+
+    def __init__(self, name: str, start_ns: int):
+        """
+        Initialize span.
+
+        Args:
+            name: Phase name (e.g., "parse", "agent:backend-architect")
+            start_ns: Clock reading when the phase started
+        """
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns: Optional[int] = None
+        self.children: List["Span"] = []
+
+    def total_ns(self, now_ns: Optional[int] = None) -> int:
+        """
+        Get total time of the span, including children.
+
+        Args:
+            now_ns: Clock reading used as end of a span that is still open
+
+        Returns:
+            Total nanoseconds
+        """
+        end_ns = self.end_ns if self.end_ns is not None else now_ns
+        if end_ns is None:
+            return 0
+        return end_ns - self.start_ns
+
+    def self_ns(self, now_ns: Optional[int] = None) -> int:
+        """
+        Get time spent in the span itself, excluding children.
+
+        Args:
+            now_ns: Clock reading used as end of spans that are still open
+
+        Returns:
+            Self nanoseconds
+        """
+        children_ns = sum(child.total_ns(now_ns) for child in self.children)
+        return max(self.total_ns(now_ns) - children_ns, 0)
+
+    def to_dict(self, now_ns: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert span subtree to a JSON-ready dictionary.
+
+        Args:
+            now_ns: Clock reading used as end of spans that are still open
+
+        Returns:
+            Dictionary with name, total/self seconds and children
+        """
+        return {
+            "name": self.name,
+            "total_seconds": self.total_ns(now_ns) / NS_PER_SECOND,
+            "self_seconds": self.self_ns(now_ns) / NS_PER_SECOND,
+            "children": [child.to_dict(now_ns) for child in self.children]
+        }
+
+    def iter_folded(self, now_ns: Optional[int] = None, prefix: str = "") -> Iterator[str]:
+        """
+        Yield flamegraph folded-stack lines for the subtree.
+
+        Each line is ``root;child;grandchild <self microseconds>``.
+
+        Args:
+            now_ns: Clock reading used as end of spans that are still open
+            prefix: Stack of ancestor names
+
+        Yields:
+            Folded-stack lines (spans with zero self time are omitted)
+        """
+        stack = prefix + self.name.replace(";", "_")
+        self_us = self.self_ns(now_ns) // 1000
+        if self_us > 0:
+            yield f"{stack} {self_us}"
+        for child in self.children:
+            yield from child.iter_folded(now_ns, stack + ";")
+
+
+class Deadline:
+    """
+    Absolute deadline shared by a run and its delegated sub-calls.
+
+    Created from a started TimeBudget and handed to every agent call, so
+    each sub-call sees how much of the overall budget is left.
+    """
+
+    def __init__(self, expires_ns: int, clock: Callable[[], int] = DEFAULT_CLOCK):
+        """
+        Initialize deadline.
+
+        Args:
+            expires_ns: Clock reading at which the deadline passes
+            clock: Monotonic clock returning integer nanoseconds
+        """
+        self.expires_ns = expires_ns
+        self.clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], int] = DEFAULT_CLOCK) -> "Deadline":
+        """
+        Create a deadline a number of seconds from now.
+
+        Args:
+            seconds: Seconds until the deadline
+            clock: Monotonic clock returning integer nanoseconds
+
+        Returns:
+            Deadline
+        """
+        return cls(clock() + int(seconds * NS_PER_SECOND), clock)
+
+    def remaining_ns(self) -> int:
+        """
+        Get time left before the deadline.
+
+        Returns:
+            Remaining nanoseconds (0 once expired)
+        """
+        return max(self.expires_ns - self.clock(), 0)
+
+    def remaining(self) -> float:
+        """
+        Get time left before the deadline.
+
+        Returns:
+            Remaining seconds (0 once expired)
+        """
+        return self.remaining_ns() / NS_PER_SECOND
+
+    def expired(self) -> bool:
+        """
+        Check whether the deadline has passed.
+
+        Returns:
+            True if no time is left
+        """
+        return self.clock() >= self.expires_ns
+
+    def child(self, max_seconds: Optional[float] = None) -> "Deadline":
+        """
+        Create a sub-deadline that never outlives this one.
+
+        Args:
+            max_seconds: Optional cap for the sub-call
+
+        Returns:
+            Deadline at min(this deadline, now + max_seconds)
+        """
+        if max_seconds is None:
+            return Deadline(self.expires_ns, self.clock)
+        capped_ns = self.clock() + int(max_seconds * NS_PER_SECOND)
+        return Deadline(min(self.expires_ns, capped_ns), self.clock)
+
 
 class TimeBudget:
     """Time budget configuration and enforcement."""
@@ -33,10 +209,26 @@ class TimeBudget:
         }
     }
 
-    def __init__(self):
-        """Initialize time budget tracker."""
-        self.start_time: Optional[float] = None
+    def __init__(self, clock: Callable[[], int] = DEFAULT_CLOCK):
+        """
+        Initialize time budget tracker.
+
+        Args:
+            clock: Monotonic clock returning integer nanoseconds
+                (default: time.perf_counter_ns; inject a fake clock in tests)
+        """
+        self.clock = clock
+        self.start_ns: Optional[int] = None
         self.mode: Optional[str] = None
+        self.root: Optional[Span] = None
+        self._stack: List[Span] = []
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Start reading of the clock in seconds (None if not started)."""
+        if self.start_ns is None:
+            return None
+        return self.start_ns / NS_PER_SECOND
 
     def start(self, mode: str = "default") -> None:
         """
@@ -45,8 +237,115 @@ class TimeBudget:
         Args:
             mode: Time budget mode (quick/default/thorough)
         """
-        self.start_time = time.time()
+        self.start_ns = self.clock()
         self.mode = mode
+        self.root = Span(mode, self.start_ns)
+        self._stack = [self.root]
+
+    def deadline(self) -> Deadline:
+        """
+        Get the deadline for the running mode's budget.
+
+        Returns:
+            Deadline at start + budget_seconds for the mode
+
+        Raises:
+            RuntimeError: If the budget has not been started
+        """
+        if self.start_ns is None:
+            raise RuntimeError("TimeBudget.start() must be called before deadline()")
+        budget_seconds = self.get_budget(self.mode)["budget_seconds"]
+        return Deadline(self.start_ns + budget_seconds * NS_PER_SECOND, self.clock)
+
+    def stop(self) -> None:
+        """Close any open phases and the root span."""
+        if self.root is None:
+            return
+        end_ns = self.clock()
+        for span in self._stack:
+            if span.end_ns is None:
+                span.end_ns = end_ns
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Span]:
+        """
+        Time a named phase nested under the current phase.
+
+        Args:
+            name: Phase name
+
+        Yields:
+            The phase's Span
+
+        Raises:
+            RuntimeError: If the budget has not been started
+
+        Example:
+            budget.start("thorough")
+            with budget.phase("agents"):
+                with budget.phase("agent:backend-architect"):
+                    ...
+        """
+        if not self._stack:
+            raise RuntimeError("TimeBudget.start() must be called before phase()")
+
+        span = Span(name, self.clock())
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = self.clock()
+            self._stack.pop()
+
+    def span_tree(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the phase tree with total and self times.
+
+        Returns:
+            Root span dictionary, or None if not started
+        """
+        if self.root is None:
+            return None
+        return self.root.to_dict(self.clock())
+
+    def export_json(self, indent: Optional[int] = 2) -> str:
+        """
+        Export the phase tree as JSON.
+
+        Args:
+            indent: JSON indentation (None for compact)
+
+        Returns:
+            JSON string ("null" if not started)
+        """
+        return json.dumps(self.span_tree(), indent=indent)
+
+    def export_folded(self) -> str:
+        """
+        Export the phase tree as flamegraph folded stacks.
+
+        Compatible with flamegraph.pl, inferno and speedscope; counts are
+        self time in microseconds.
+
+        Returns:
+            Folded-stack text, one line per phase
+        """
+        if self.root is None:
+            return ""
+        return "\n".join(self.root.iter_folded(self.clock()))
+
+    def elapsed_ns(self) -> int:
+        """
+        Get elapsed time since start in nanoseconds.
+
+        Returns:
+            Elapsed nanoseconds (or 0 if not started)
+        """
+        if self.start_ns is None:
+            return 0
+        return self.clock() - self.start_ns
 
     def elapsed(self) -> float:
         """
@@ -55,9 +354,7 @@ class TimeBudget:
         Returns:
             Elapsed seconds (or 0 if not started)
         """
-        if self.start_time is None:
-            return 0.0
-        return time.time() - self.start_time
+        return self.elapsed_ns() / NS_PER_SECOND
 
     def check_budget_adherence(self, mode: str, elapsed: float) -> bool:
         """
@@ -79,7 +376,9 @@ class TimeBudget:
         elapsed: float,
         budget: Optional[float] = None,
         exceeded: bool = False,
-        agents: Optional[list] = None
+        agents: Optional[list] = None,
+        p95: Optional[float] = None,
+        cache_hits: int = 0
     ) -> str:
         """
         Format completion message.
@@ -90,6 +389,9 @@ class TimeBudget:
             budget: Budget seconds (optional, will look up if not provided)
             exceeded: Whether budget was exceeded
             agents: List of agents used (optional)
+            p95: Historical p95 seconds for this run shape (optional,
+                see get_budget_for_mode(..., history=...))
+            cache_hits: Agent results served from the result cache
 
         Returns:
             Formatted message string
@@ -105,6 +407,12 @@ class TimeBudget:
         if agents:
             msg += f" with {len(agents)} agents"
 
+        if cache_hits:
+            msg += f" ({cache_hits} cached)" if agents else f" with {cache_hits} cached agent results"
+
+        if p95 is not None:
+            msg += f"; p95 for this shape is {p95:.0f} s"
+
         return msg
 
     @classmethod
@@ -131,30 +439,266 @@ class TimeBudget:
         return cls.BUDGETS
 
 
-def enforce_time_budget(budget_seconds: int):
+# Enforcement policies for enforce_time_budget
+ENFORCEMENT_POLICIES = ("report", "cancel", "kill")
+
+
+def _binds(signature: inspect.Signature, name: str, args: tuple, kwargs: dict) -> bool:
+    """Whether a call passes parameter name, positionally or by keyword."""
+    try:
+        return name in signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        # Invalid call; let the function raise its own error
+        return True
+
+
+def _run_in_thread(func: Callable, args: tuple, kwargs: dict, timeout: float):
+    """
+    Run func in a daemon thread, waiting at most timeout seconds.
+
+    Returns:
+        (finished, result) - result is None if the deadline passed
+    """
+    outcome: Dict[str, Any] = {}
+
+    def target():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except BaseException as exc:  # re-raised in the caller
+            outcome["error"] = exc
+
+    worker = threading.Thread(
+        target=target, name=f"time-budget:{getattr(func, '__name__', 'call')}", daemon=True
+    )
+    worker.start()
+    worker.join(timeout)
+
+    if worker.is_alive():
+        return False, None
+    if "error" in outcome:
+        raise outcome["error"]
+    return True, outcome.get("result")
+
+
+# Functions decorated with policy="kill", by (module, qualname). Pickle
+# finds functions by name, which after decoration is the wrapper, so
+# "spawn"/"forkserver" workers re-import the module and look here instead.
+_KILL_TARGETS: Dict[Tuple[str, str], Callable] = {}
+
+
+def _target_key(func: Callable) -> Optional[Tuple[str, str]]:
+    """Registry key of a module-level function (None for nested ones and lambdas)."""
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        return None
+    # Under "spawn" the main script is re-imported as __mp_main__
+    return ("__main__" if module == "__mp_main__" else module), qualname
+
+
+class _KillTarget:
+    """Picklable reference to a function in _KILL_TARGETS."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Tuple[str, str]):
+        self.key = key
+
+    def resolve(self) -> Callable:
+        """Find the undecorated function (importing its module if needed)."""
+        module_name, qualname = self.key
+        func = _KILL_TARGETS.get(self.key)
+        if func is None:
+            # Importing the module re-runs its decorators, which register it
+            module = importlib.import_module(module_name)
+            func = _KILL_TARGETS.get(self.key)
+            if func is None:
+                # Not decorated at module level: the module attribute is the function
+                func = module
+                for name in qualname.split("."):
+                    func = getattr(func, name)
+        return func
+
+
+def _process_target(connection, func: Callable, args: tuple, kwargs: dict) -> None:
+    """Worker process entry point: send (ok, value) back to the parent."""
+    try:
+        if isinstance(func, _KillTarget):
+            func = func.resolve()
+        connection.send((True, func(*args, **kwargs)))
+    except BaseException as exc:
+        connection.send((False, exc))
+    finally:
+        connection.close()
+
+
+def _run_in_process(
+    func: Callable, args: tuple, kwargs: dict, timeout: float, start_method: Optional[str] = None
+):
+    """
+    Run func in a worker process, terminating it at the deadline.
+
+    Returns:
+        (finished, result) - result is None if the worker was killed
+    """
+    context = multiprocessing.get_context(start_method)
+    key = _target_key(func)
+    target = _KillTarget(key) if key is not None else func
+
+    receiver, sender = context.Pipe(duplex=False)
+    worker = context.Process(
+        target=_process_target, args=(sender, target, args, kwargs), daemon=True
+    )
+    worker.start()
+    sender.close()
+
+    try:
+        if receiver.poll(timeout):
+            try:
+                ok, value = receiver.recv()
+            except EOFError:
+                worker.join()
+                raise RuntimeError(
+                    f"Budget worker exited without a result (exit code {worker.exitcode})"
+                )
+            worker.join()
+            if not ok:
+                raise value
+            return True, value
+    finally:
+        receiver.close()
+
+    worker.terminate()
+    worker.join(1)
+    if worker.is_alive():
+        worker.kill()
+        worker.join()
+    return False, None
+
+
+def enforce_time_budget(
+    budget_seconds: int,
+    clock: Callable[[], int] = DEFAULT_CLOCK,
+    policy: str = "report",
+    on_timeout: Optional[Callable[[], Any]] = None,
+    start_method: Optional[str] = None
+):
     """
     Decorator to enforce time budget on functions.
 
+    Timing uses a monotonic nanosecond clock, and the budget check compares
+    integer nanoseconds, so results do not flap when the wall clock moves.
+
+    Policies:
+    - "report": run to completion, then report whether the budget held
+    - "cancel": run in a daemon thread and stop waiting at the deadline.
+      Python threads cannot be killed: a function with a ``deadline``
+      parameter is passed a :class:`Deadline` for the budget and should
+      return once it expires (cooperative cancellation); any other
+      function is abandoned and keeps running in the background
+    - "kill": run in a worker process that is terminated at the deadline;
+      arguments and results must be picklable unless the "fork" start
+      method is in use. Module-level functions work with every start
+      method (the worker re-imports the module to find the undecorated
+      function); nested functions and lambdas need "fork"
+
+    Coroutine functions get an async wrapper (await it for the same
+    tuple). With "cancel" or "kill" the coroutine is cancelled at the
+    deadline via asyncio.wait_for, so several agent calls can share an
+    event loop, each under its own deadline.
+
     Args:
         budget_seconds: Maximum allowed seconds
+        clock: Monotonic clock returning integer nanoseconds
+        policy: Enforcement policy ("report", "cancel" or "kill")
+        on_timeout: Called when the deadline passes ("cancel"/"kill");
+            its return value (awaited if awaitable) is used as the
+            (partial) result
+        start_method: multiprocessing start method for "kill" ("fork",
+            "spawn" or "forkserver"; None: the platform default)
 
     Returns:
-        Decorator function
+        Decorator function; the wrapped function returns
+        (result, elapsed_seconds, within_budget)
+
+    Raises:
+        ValueError: If policy is not recognized
 
     Example:
-        @enforce_time_budget(60)
+        @enforce_time_budget(60, policy="cancel", on_timeout=lambda: partial_ideas)
         def quick_operation():
             # ... implementation ...
             return result
     """
+    if policy not in ENFORCEMENT_POLICIES:
+        valid_policies = ", ".join(ENFORCEMENT_POLICIES)
+        raise ValueError(
+            f"Invalid policy '{policy}'. "
+            f"Valid policies: {valid_policies}"
+        )
+
+    budget_ns = int(budget_seconds * NS_PER_SECOND)
+    runner = {
+        "cancel": _run_in_thread,
+        "kill": functools.partial(_run_in_process, start_method=start_method)
+    }.get(policy)
+
     def decorator(func):
+        if policy == "kill":
+            key = _target_key(func)
+            if key is not None:
+                _KILL_TARGETS[key] = func
+
+        # Signature of a "cancel" function with a deadline parameter, else None
+        deadline_signature = None
+        if policy == "cancel":
+            try:
+                signature = inspect.signature(func)
+            except (TypeError, ValueError):
+                signature = None
+            parameter = signature.parameters.get("deadline") if signature is not None else None
+            if parameter is not None and parameter.kind in (
+                parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY
+            ):
+                deadline_signature = signature
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = clock()
+                if runner is None:
+                    result = await func(*args, **kwargs)
+                else:
+                    try:
+                        result = await asyncio.wait_for(func(*args, **kwargs), budget_seconds)
+                    except asyncio.TimeoutError:
+                        result = on_timeout() if on_timeout is not None else None
+                        if inspect.isawaitable(result):
+                            result = await result
+                        return result, (clock() - start) / NS_PER_SECOND, False
+                elapsed_ns = clock() - start
+
+                within_budget = elapsed_ns <= budget_ns
+                return result, elapsed_ns / NS_PER_SECOND, within_budget
+
+            return async_wrapper
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
-            result = func(*args, **kwargs)
-            elapsed = time.time() - start
-
-            within_budget = elapsed <= budget_seconds
-            return result, elapsed, within_budget
+            start = clock()
+            if runner is None:
+                result = func(*args, **kwargs)
+            else:
+                if deadline_signature is not None and not _binds(deadline_signature, "deadline", args, kwargs):
+                    kwargs["deadline"] = Deadline(start + budget_ns, clock)
+                finished, result = runner(func, args, kwargs, budget_seconds)
+                if not finished:
+                    result = on_timeout() if on_timeout is not None else None
+                    return result, (clock() - start) / NS_PER_SECOND, False
+            elapsed_ns = clock() - start
+
+            within_budget = elapsed_ns <= budget_ns
+            return result, elapsed_ns / NS_PER_SECOND, within_budget
 
         return wrapper
     return decorator
@@ -172,14 +716,31 @@ def get_time_budgets() -> Dict[str, Dict[str, Any]]:
     return TimeBudget.get_all_budgets()
 
 
-def get_budget_for_mode(mode: str) -> Dict[str, Any]:
+def get_budget_for_mode(
+    mode: str,
+    history: Optional["RunHistory"] = None,
+    content_mode: Optional[str] = None,
+    agents: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get budget configuration for specific mode.
 
     Args:
         mode: Time budget mode (quick/default/thorough)
+        history: Optional RunHistory used for data-driven predictions
+        content_mode: Content mode of the run shape (with history)
+        agents: Agents of the run shape (with history; None for mode-wide)
 
     Returns:
-        Budget configuration with budget_seconds, type, and description
+        Budget configuration with budget_seconds, type, and description;
+        with history, a copy that also has "predicted" (count, mean,
+        p50, p95, p99 seconds) when runs of that shape were recorded
     """
-    return TimeBudget.get_budget(mode)
+    budget = TimeBudget.get_budget(mode)
+    if history is None:
+        return budget
+
+    predicted = history.summary(mode, content_mode, agents)
+    if predicted is None:
+        return budget
+    return {**budget, "predicted": predicted}